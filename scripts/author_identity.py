@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Recognize the CV owner's name in BibTeX author lists, whatever the spelling.
+
+The bibliography spells one person many ways: "Ferreira da Silva, Rafael",
+"Ferreira da Silva, R.", "da Silva, R Ferreira", stray spaces before commas,
+missing accents. AuthorIdentity starts from the canonical "Family, Given"
+forms listed under `personal.author_names` in _data/rafael.yml. It derives the
+initial, particle ("da", "van", ...), word-order and accent variants of each,
+and compiles all of them into a single regular expression. Each author list is
+then matched in one pass, once per publication at load time (see
+publications.Publication.owner_spans), instead of one str.replace per spelling
+every time a citation is formatted.
+"""
+
+import re
+import unicodedata
+
+# Any whitespace but a single space; spans() and matches() collapse it first
+LOOSE_SPACE = re.compile(r'\s{2,}|[^\S ]')
+
+# Lower-case name particles that may move between the family and given names
+PARTICLES = {'da', 'de', 'do', 'dos', 'das', 'di', 'del', 'della', 'van', 'von', 'der', 'den', 'la', 'le'}
+
+
+def _fold_accents(text):
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in text if not unicodedata.combining(c))
+
+
+def _given_forms(given):
+    """'Rafael' -> Rafael, R., R ; 'Ian T.' -> Ian T., I. T., I.T., I T, ..."""
+    words = given.replace('.', '. ').split()
+    if not words:
+        return {''}
+    initials = [w[0] for w in words]
+    forms = {
+        ' '.join(words),
+        ' '.join(f"{i}." for i in initials),
+        ''.join(f"{i}." for i in initials),
+        ' '.join(initials),
+        # first name spelled out, later names as initials ("Ian T.")
+        ' '.join([words[0]] + [f"{i}." for i in initials[1:]]),
+        words[0],
+    }
+    return {f.strip() for f in forms if f.strip()}
+
+
+def name_variants(canonical):
+    """Every spelling of a "Family, Given" name this module recognizes."""
+    family, _, given = (part.strip() for part in canonical.partition(','))
+    family_words = family.split()
+
+    # (family, extra given words): "Ferreira da Silva" may also be written
+    # "da Silva" with "Ferreira" moved after the given name.
+    splits = [(family, '')]
+    for i, word in enumerate(family_words[1:], start=1):
+        if word.lower() in PARTICLES:
+            rest = ' '.join(family_words[i:])
+            moved = ' '.join(family_words[:i])
+            splits.append((rest, moved))
+            splits.append((rest[0].upper() + rest[1:], moved))
+
+    variants = set()
+    for fam, moved in splits:
+        for giv in _given_forms(given):
+            full_given = f"{giv} {moved}".strip()
+            variants.add(f"{fam}, {full_given}")
+            variants.add(f"{full_given} {fam}")
+    variants |= {_fold_accents(v) for v in variants}
+    return variants
+
+
+def _collapse_spaces(text):
+    """
+    `text` with each whitespace run as one space, and for every character of
+    the result the (start, end) it came from in `text`.
+    """
+    pieces, starts, ends = [], [], []
+    for m in re.finditer(r'\s+|\S+', text):
+        if m.group().isspace():
+            pieces.append(' ')
+            starts.append(m.start())
+            ends.append(m.end())
+        else:
+            pieces.append(m.group())
+            starts.extend(range(m.start(), m.end()))
+            ends.extend(range(m.start() + 1, m.end() + 1))
+    return ''.join(pieces), starts, ends
+
+
+def _variant_pattern(variant):
+    """Regex for one spelling, tolerant of spacing around commas and dots."""
+    parts = []
+    for token in re.split(r'(\s*,\s*|\s+|\.)', variant):
+        if not token:
+            continue
+        if token.strip() == ',':
+            parts.append(r'\s*,\s*')
+        elif token.isspace():
+            parts.append(r'\s+')
+        elif token == '.':
+            parts.append(r'\.?\s*')
+        else:
+            parts.append(re.escape(token))
+    return ''.join(parts)
+
+
+class AuthorIdentity:
+    """All spellings of one person's name, compiled into one matcher."""
+
+    def __init__(self, canonical_names):
+        self.canonical_names = list(canonical_names)
+        variants = set()
+        for name in self.canonical_names:
+            variants |= name_variants(name)
+        # Longest first, so "Ferreira da Silva, Rafael" wins over shorter forms
+        alternatives = sorted({_variant_pattern(v) for v in variants}, key=len, reverse=True)
+        # An author is a whole " and "-separated item of the author list. Raw
+        # .bib fields wrap over lines, so spans() and matches() collapse
+        # whitespace runs to one space before matching
+        self.pattern = re.compile(
+            r'(?:^|(?<= and ))(?:' + '|'.join(alternatives) + r')(?= and | ?$)'
+        ) if alternatives else None
+
+    @classmethod
+    def from_data(cls, data):
+        """Identity of the CV owner described in a rafael.yml payload."""
+        personal = (data or {}).get('personal', {}) or {}
+        names = personal.get('author_names') or []
+        if not names and personal.get('name'):
+            # Fall back to "Given ... Family" -> "Family, Given ..."
+            *given, family = personal['name'].split()
+            names = [f"{family}, {' '.join(given)}"]
+        return cls(names)
+
+    def spans(self, authors):
+        """
+        (start, end) in `authors` of every occurrence of this person in the
+        author list, however its whitespace runs.
+        """
+        if self.pattern is None or not authors:
+            return ()
+        if not LOOSE_SPACE.search(authors):
+            return tuple(m.span() for m in self.pattern.finditer(authors))
+        collapsed, starts, ends = _collapse_spaces(authors)
+        return tuple(
+            (starts[m.start()], ends[m.end() - 1])
+            for m in self.pattern.finditer(collapsed) if m.end() > m.start()
+        )
+
+    def matches(self, author):
+        """True if a single author name is this person."""
+        if self.pattern is None:
+            return False
+        return self.pattern.fullmatch(re.sub(r'\s+', ' ', author.strip())) is not None
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark the PDF CV build.
+
+Times the two phases of CVGenerator separately -- building the story (section
+methods, paragraph parsing) and doc.build (wrapping, page breaking, drawing) --
+over the real site data, optionally with the publication list repeated to
+simulate a much longer CV. Each configuration runs with a fresh generator and
+cold process-wide caches, and the median of the repeats is reported. The
+'optimize size' and 'object streams' rows show what the size-optimized modes
+(see pdf_size.py) save in output size and cost in build time; the
+object-stream rewrite is counted in the build.
+
+With --memory, it instead reports the peak Python heap of one single-pass
+build and one chunked build (--chunk-size) of the same CV, measured with
+tracemalloc.
+
+Usage:
+    python scripts/benchmark_cv.py [--repeat 5] [--scale 1]
+    python scripts/benchmark_cv.py --memory [--scale 10] [--chunk-size 200]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import cv_pdf  # noqa: E402
+from cv_pdf import CVGenerator  # noqa: E402
+from publications import PublicationSet  # noqa: E402
+
+# name -> CVGenerator attribute overrides
+CONFIGURATIONS = {
+    'baseline': {'use_frag_cache': False},
+    'frag cache': {'use_frag_cache': True},
+    'optimize size': {'optimize_size': True},
+    'object streams': {'optimize_size': True, 'object_streams': True},
+}
+
+
+def run_once(yaml_path, project_root, output_path, scale, overrides):
+    with contextlib.redirect_stdout(io.StringIO()):
+        gen = CVGenerator(yaml_path, project_root)
+        # The first access loads the bibliography, which reports on stdout
+        gen.publications = PublicationSet(list(gen.publications) * scale)
+    for attr, value in overrides.items():
+        setattr(gen, attr, value)
+    cv_pdf.parse_paragraph.cache_clear()
+
+    doc = gen._doc_template(output_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        gen.build_story()
+        story_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        gen.build(doc)
+        gen._compact(output_path)
+        build_time = time.perf_counter() - start
+
+    return story_time, build_time, os.path.getsize(output_path)
+
+
+def peak_memory(yaml_path, project_root, output_path, scale, chunk_size=None):
+    """Peak traced heap (MB) of one full PDF build, single pass or chunked."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        gen = CVGenerator(yaml_path, project_root)
+        gen.publications = PublicationSet(list(gen.publications) * scale)
+    cv_pdf.parse_paragraph.cache_clear()
+
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            gen.generate(output_path, chunk_size=chunk_size)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='runs per configuration')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='repeat the publication list N times')
+    parser.add_argument('--memory', action='store_true',
+                        help='report peak memory of single-pass vs chunked builds')
+    parser.add_argument('--chunk-size', type=int, default=200,
+                        help='publication entries per batch for --memory (default: 200)')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    yaml_path = os.path.join(project_root, '_data', 'rafael.yml')
+
+    if args.memory:
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, 'cv.pdf')
+            print(f"{'build':<20} {'peak heap (MB)':>15}")
+            for name, chunk_size in [('single pass', None), (f'chunked ({args.chunk_size})', args.chunk_size)]:
+                peak = peak_memory(yaml_path, project_root, output_path, args.scale, chunk_size)
+                print(f"{name:<20} {peak:>15.1f}")
+        return
+
+    print(f"{'configuration':<14} {'story (s)':>10} {'build (s)':>10} {'total (s)':>10} {'size (KB)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, 'cv.pdf')
+        # Interleave configurations so warm-up and machine noise hit them alike
+        results = {name: [] for name in CONFIGURATIONS}
+        for _ in range(args.repeat):
+            for name, overrides in CONFIGURATIONS.items():
+                results[name].append(
+                    run_once(yaml_path, project_root, output_path, args.scale, overrides)
+                )
+        for name, runs in results.items():
+            story = statistics.median(r[0] for r in runs)
+            build = statistics.median(r[1] for r in runs)
+            size = runs[-1][2] / 1024
+            print(f"{name:<14} {story:>10.3f} {build:>10.3f} {story + build:>10.3f} {size:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
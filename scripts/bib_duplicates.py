@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Flag duplicate and near-duplicate entries in _bibliography/references.bib.
+
+Comparing every pair of entries grows quadratically with the bibliography, so
+candidates are found by blocking instead:
+
+- DOI: entries sharing a normalized DOI are duplicates outright.
+- Title MinHash/LSH: each normalized title becomes a set of character
+  shingles, summarized by a MinHash signature. Signatures are cut into bands,
+  and titles that agree on any band land in the same bucket. Titles with
+  Jaccard similarity around LSH_THRESHOLD or more very likely share a bucket,
+  while dissimilar titles almost never do.
+- Year: a bucket match is kept only when the years are at most MAX_YEAR_GAP
+  apart (a preprint and its published version), and only if the exact shingle
+  Jaccard of the two titles reaches the threshold.
+
+Each entry is hashed once and only bucket-mates are compared, so the work is
+near-linear in the number of entries.
+
+Usage:
+    python scripts/bib_duplicates.py [--threshold 0.6]
+
+Exits with status 1 if candidate duplicates are found.
+"""
+
+import argparse
+import os
+import re
+import sys
+import zlib
+from collections import defaultdict
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from publications import load_publications  # noqa: E402
+
+SHINGLE = 4
+NUM_PERM = 64
+# 16 bands x 4 rows puts the LSH knee, (1/BANDS)**(1/ROWS), at Jaccard 0.5:
+# below the confirmation threshold, so true matches are rarely missed
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+LSH_THRESHOLD = 0.6
+MAX_YEAR_GAP = 1
+
+_PRIME = (1 << 61) - 1
+# Fixed (a, b) pairs for the hash family h(x) = (a*x + b) mod p, so signatures
+# are reproducible across runs
+_PERMUTATIONS = [
+    (zlib.crc32(f"a{i}".encode()) * 2654435761 % _PRIME | 1,
+     zlib.crc32(f"b{i}".encode()) * 40503 % _PRIME)
+    for i in range(NUM_PERM)
+]
+
+
+def normalize_title(title):
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', title.lower()).split())
+
+
+def normalize_doi(doi):
+    doi = doi.strip().lower()
+    return re.sub(r'^(https?://(dx\.)?doi\.org/|doi:)', '', doi)
+
+
+def shingles(text, k=SHINGLE):
+    """Set of character k-grams (hashed to ints) of a normalized title."""
+    if len(text) <= k:
+        return {zlib.crc32(text.encode())} if text else set()
+    return {zlib.crc32(text[i:i + k].encode()) for i in range(len(text) - k + 1)}
+
+
+def minhash(shingle_set):
+    return tuple(
+        min((a * x + b) % _PRIME for x in shingle_set)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def find_duplicates(publications, threshold=LSH_THRESHOLD):
+    """
+    Return [(key_a, key_b, reason, similarity)] candidate duplicate pairs.
+
+    `reason` is 'doi' for shared DOIs, 'title' for LSH matches confirmed by the
+    exact title similarity.
+    """
+    records = list(publications)
+    titles = [shingles(normalize_title(p.title)) for p in records]
+
+    pairs = {}
+    by_doi = defaultdict(list)
+    for i, pub in enumerate(records):
+        if pub.doi:
+            by_doi[normalize_doi(pub.doi)].append(i)
+    for ids in by_doi.values():
+        for i, j in combinations(ids, 2):
+            pairs[(i, j)] = ('doi', jaccard(titles[i], titles[j]))
+
+    buckets = defaultdict(list)
+    for i, shingle_set in enumerate(titles):
+        if not shingle_set:
+            continue
+        signature = minhash(shingle_set)
+        for band in range(BANDS):
+            buckets[(band, signature[band * ROWS:(band + 1) * ROWS])].append(i)
+
+    for ids in buckets.values():
+        for i, j in combinations(ids, 2):
+            if (i, j) in pairs:
+                continue
+            yi, yj = records[i].year, records[j].year
+            if yi is not None and yj is not None and abs(yi - yj) > MAX_YEAR_GAP:
+                continue
+            similarity = jaccard(titles[i], titles[j])
+            if similarity >= threshold:
+                pairs[(i, j)] = ('title', similarity)
+
+    return sorted(
+        (records[i].key, records[j].key, reason, similarity)
+        for (i, j), (reason, similarity) in pairs.items()
+    )
+
+
+def duplicate_report(pairs):
+    """{bib key: [(other key, reason, similarity), ...]} for every flagged entry."""
+    report = defaultdict(list)
+    for a, b, reason, similarity in pairs:
+        report[a].append((b, reason, similarity))
+        report[b].append((a, reason, similarity))
+    return dict(report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find duplicate entries in references.bib.')
+    parser.add_argument('--threshold', type=float, default=LSH_THRESHOLD,
+                        help=f'title similarity (Jaccard) to flag (default: {LSH_THRESHOLD})')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    publications = load_publications(project_root)
+
+    pairs = find_duplicates(publications, args.threshold)
+    print(f"Checked {len(publications)} entries: {len(pairs)} candidate duplicate pair(s)")
+    by_key = {p.key: p for p in publications}
+    for key, matches in sorted(duplicate_report(pairs).items()):
+        pub = by_key[key]
+        print(f"\n{key} ({pub.year_label}): {pub.title}")
+        for other, reason, similarity in matches:
+            print(f"    ~ {other} [{reason}, title similarity {similarity:.2f}]")
+    return 1 if pairs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
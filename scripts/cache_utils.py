@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Small helpers shared by the build caches under .cache/ at the project root.
+
+Every cache in the CV tooling is content-addressed: entries are keyed by a
+SHA-256 digest of the inputs that produced them (file bytes, glyph sets, ...),
+so a stale entry is never reused and nothing needs to be invalidated by hand.
+The .cache/ directory is git-ignored and skipped by Jekyll; deleting it is
+always safe.
+"""
+
+import hashlib
+import os
+
+CACHE_DIRNAME = '.cache'
+
+
+def cache_dir(project_root, name):
+    """Return (and create) the cache directory `name` under the project root."""
+    path = os.path.join(project_root, CACHE_DIRNAME, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file's bytes."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def digest(*parts):
+    """SHA-256 hex digest of the repr of `parts` (strings, numbers, tuples)."""
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+def read_bytes(path):
+    """Return the bytes stored at `path`, or None if the entry does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_bytes(path, data):
+    """Atomically store `data` at `path` (write to a temp file, then rename)."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
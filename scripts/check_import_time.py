@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Check that importing the CV generator stays fast.
+
+Imports generate_cv_pdf in a fresh interpreter under `python -X importtime`,
+takes the best cumulative time over a few runs and fails if it exceeds the
+budget, or if a heavy backend (reportlab, python-docx, bibtexparser,
+pylatexenc, pypdf, Pillow) was imported at startup. Those belong inside the
+code path that renders their format, so that cache hits and --sections runs
+start almost instantly.
+
+Usage:
+    python scripts/check_import_time.py [--budget-ms 100] [--repeat 5] [--top 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULE = 'generate_cv_pdf'
+
+# Top-level packages that must only be imported when their output is requested
+DEFERRED = ('reportlab', 'docx', 'bibtexparser', 'pylatexenc', 'pypdf', 'PIL', 'lxml')
+
+
+def import_times(module):
+    """
+    Import `module` in a fresh interpreter and return
+    [(module, self_us, cumulative_us)] in import order, from -X importtime.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=SCRIPT_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        rows.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the import time of generate_cv_pdf.py')
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                        help='maximum cumulative import time (default: 100)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs to take the best of (default: 5)')
+    parser.add_argument('--top', type=int, default=10,
+                        help='heaviest imports to list (default: 10)')
+    args = parser.parse_args()
+
+    runs = [import_times(MODULE) for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda rows: next(c for m, _, c in rows if m == MODULE))
+    total_ms = next(c for m, _, c in best if m == MODULE) / 1000
+
+    print(f"{MODULE}: {total_ms:.1f} ms (best of {len(runs)}, budget {args.budget_ms:.0f} ms)")
+    print("\nHeaviest imports (cumulative):")
+    for module, _, cumulative in sorted(best, key=lambda r: -r[2])[:args.top]:
+        print(f"  {cumulative / 1000:7.1f} ms  {module}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import takes {total_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    loaded = sorted({m for m, _, _ in best if m.split('.')[0] in DEFERRED})
+    if loaded:
+        failures.append(f"backends imported at startup: {', '.join(loaded)}")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print("\n✓ Import time within budget")
+
+
+if __name__ == '__main__':
+    main()
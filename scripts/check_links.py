@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Check the outbound links in _data/ and _bibliography/references.bib.
+
+Collects every `link:` URL in rafael.yml (talks, media, ...) and the
+activities_*.yml files, plus the DOI (as https://doi.org/...) and `url` of every
+BibTeX entry, and checks them concurrently. Each URL is reported back under the
+places it came from (`rafael.yml: invited_talks[3].entries[0].link`,
+`references.bib: ferreiradasilva2024workflows.doi`).
+
+Requests run on an asyncio event loop with blocking http.client calls in worker
+threads. Each host gets a small pool of keep-alive connections and a semaphore,
+so many links on one site (doi.org, conference pages) share a few connections
+and no host sees more than --per-host concurrent requests. A pooled connection
+the server has closed in the meantime is replaced and the request resent. Links
+are checked with HEAD first; servers that reject, mishandle or drop HEAD are
+retried with GET.
+
+Results are cached in .cache/links/results.json. Working links are rechecked only
+after --ttl hours, so daily runs only touch stale links. Broken links are always
+rechecked.
+
+Usage:
+    python scripts/check_links.py [--ttl 168] [--per-host 4] [--timeout 15] [--json REPORT]
+
+Exits with status 1 if any link is broken.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from urllib.parse import urljoin, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cache_utils import cache_dir, read_bytes, write_bytes  # noqa: E402
+from cv_data import ACTIVITY_FILES, load_yaml  # noqa: E402
+
+try:
+    import bibtexparser
+    BIBTEX_AVAILABLE = True
+except ImportError:
+    BIBTEX_AVAILABLE = False
+    print("Warning: bibtexparser not installed. BibTeX links will be skipped.")
+    print("Install with: pip install bibtexparser")
+
+USER_AGENT = 'Mozilla/5.0 (compatible; link-checker)'
+MAX_REDIRECTS = 5
+# HEAD answers that usually mean "HEAD not supported here", not "link broken"
+RETRY_WITH_GET = {400, 403, 404, 405, 406, 429, 500, 501, 503}
+
+
+# ---------------------------------------------------------------- collecting
+def _walk_links(node, path, found):
+    """Append (path, url) for every http(s) `link` value below `node`."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            child = f"{path}.{key}" if path else str(key)
+            if key == 'link' and isinstance(value, str) and value.startswith(('http://', 'https://')):
+                found.append((child, value.strip()))
+            else:
+                _walk_links(value, child, found)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            _walk_links(value, f"{path}[{i}]", found)
+
+
+def collect_yaml_links(project_root):
+    """Return [(source, url)] for rafael.yml and the activities files."""
+    links = []
+    for filename in ['rafael.yml', *ACTIVITY_FILES.values()]:
+        filepath = os.path.join(project_root, '_data', filename)
+        if not os.path.exists(filepath):
+            continue
+        found = []
+        _walk_links(load_yaml(filepath, project_root), '', found)
+        links.extend((f"{filename}: {path}", url) for path, url in found)
+    return links
+
+
+def collect_bib_links(project_root):
+    """Return [(source, url)] for DOIs and URLs in references.bib."""
+    if not BIBTEX_AVAILABLE:
+        return []
+    bib_path = os.path.join(project_root, '_bibliography', 'references.bib')
+    if not os.path.exists(bib_path):
+        return []
+    with open(bib_path, 'r', encoding='utf-8') as f:
+        entries = bibtexparser.load(f).entries
+
+    links = []
+    for entry in entries:
+        key = entry.get('ID', '?')
+        doi = entry.get('doi', '').strip()
+        if doi:
+            doi = re.sub(r'^(https?://(dx\.)?doi\.org/|doi:)', '', doi, flags=re.I)
+            links.append((f"references.bib: {key}.doi", f"https://doi.org/{doi}"))
+        url = entry.get('url', '').strip()
+        if url.startswith(('http://', 'https://')):
+            links.append((f"references.bib: {key}.url", url))
+    return links
+
+
+# ------------------------------------------------------------------ checking
+class HostPool:
+    """Keep-alive connections to one scheme://host, at most `limit` in use."""
+
+    def __init__(self, scheme, netloc, limit, timeout):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(limit)
+        self._idle = []
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        return cls(self.netloc, timeout=self.timeout)
+
+    def _request(self, method, target):
+        """
+        Blocking request on a pooled connection; returns (status, location).
+        A pooled connection the server has closed since its last use fails
+        with a connection error; it is dropped and the request is sent once
+        more on a fresh connection.
+        """
+        try:
+            conn, reused = self._idle.pop(), True
+        except IndexError:
+            conn, reused = self._connect(), False
+        try:
+            return self._send(conn, method, target)
+        except (ConnectionError, http.client.HTTPException):
+            if not reused:
+                raise
+        return self._send(self._connect(), method, target)
+
+    def _send(self, conn, method, target):
+        try:
+            conn.request(method, target, headers={'User-Agent': USER_AGENT})
+            response = conn.getresponse()
+            # Drain the body (GET) so the connection can be reused
+            response.read()
+            status, location = response.status, response.getheader('Location')
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.append(conn)
+            return status, location
+        except Exception:
+            conn.close()
+            raise
+
+    async def request(self, method, target):
+        async with self.semaphore:
+            return await asyncio.to_thread(self._request, method, target)
+
+    def close(self):
+        for conn in self._idle:
+            conn.close()
+        self._idle.clear()
+
+
+class LinkChecker:
+    """Check URLs concurrently with per-host connection pools."""
+
+    def __init__(self, per_host=4, timeout=15):
+        self.per_host = per_host
+        self.timeout = timeout
+        self._pools = {}
+
+    def _pool(self, scheme, netloc):
+        key = (scheme, netloc)
+        if key not in self._pools:
+            self._pools[key] = HostPool(scheme, netloc, self.per_host, self.timeout)
+        return self._pools[key]
+
+    async def _fetch(self, method, url):
+        """Follow redirects; return (status, final_url)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            target = parts.path or '/'
+            if parts.query:
+                target += '?' + parts.query
+            status, location = await self._pool(parts.scheme, parts.netloc).request(method, target)
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            return status, url
+        return None, url
+
+    async def check(self, url):
+        """Return a result dict: ok, status, error, final_url."""
+        try:
+            try:
+                status, final_url = await self._fetch('HEAD', url)
+            except Exception:
+                # Some servers drop or reset HEAD requests; GET decides
+                status, final_url = None, url
+            if status is None or status in RETRY_WITH_GET:
+                status, final_url = await self._fetch('GET', url)
+        except Exception as e:  # DNS, TLS, timeouts, bad URLs
+            return {'ok': False, 'status': None, 'error': f"{type(e).__name__}: {e}"}
+        result = {'ok': status is not None and status < 400, 'status': status}
+        if status is None:
+            result['error'] = 'too many redirects'
+        if final_url != url:
+            result['final_url'] = final_url
+        return result
+
+    async def check_all(self, urls):
+        results = await asyncio.gather(*(self.check(url) for url in urls))
+        return dict(zip(urls, results))
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.close()
+
+
+# --------------------------------------------------------------------- cache
+class ResultCache:
+    """Link results in .cache/links/results.json, with a TTL for working links."""
+
+    def __init__(self, project_root, ttl_seconds):
+        self.path = os.path.join(cache_dir(project_root, 'links'), 'results.json')
+        self.ttl = ttl_seconds
+        data = read_bytes(self.path)
+        self.results = json.loads(data) if data else {}
+
+    def fresh(self, url, now):
+        result = self.results.get(url)
+        return result is not None and result['ok'] and now - result['checked_at'] < self.ttl
+
+    def update(self, results, now):
+        for url, result in results.items():
+            self.results[url] = dict(result, checked_at=now)
+
+    def save(self):
+        write_bytes(self.path, json.dumps(self.results, indent=1, sort_keys=True).encode('utf-8'))
+
+
+def check_links(project_root, links, ttl_seconds, per_host=4, timeout=15, now=None):
+    """
+    Check `links` ([(source, url)]), reusing cached results younger than the TTL.
+
+    Returns (report, checked) where report maps url -> {'sources': [...], **result}
+    and checked is the number of URLs actually requested.
+    """
+    now = time.time() if now is None else now
+    sources = defaultdict(list)
+    for source, url in links:
+        sources[url].append(source)
+
+    cache = ResultCache(project_root, ttl_seconds)
+    stale = [url for url in sources if not cache.fresh(url, now)]
+    if stale:
+        checker = LinkChecker(per_host, timeout)
+        try:
+            cache.update(asyncio.run(checker.check_all(stale)), now)
+        finally:
+            checker.close()
+        cache.save()
+
+    report = {url: dict(cache.results[url], sources=srcs) for url, srcs in sources.items()}
+    return report, len(stale)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check outbound links in _data/ and references.bib.')
+    parser.add_argument('--ttl', type=float, default=168,
+                        help='hours before a working link is checked again (default: 168)')
+    parser.add_argument('--per-host', type=int, default=4,
+                        help='concurrent requests per host (default: 4)')
+    parser.add_argument('--timeout', type=float, default=15, help='seconds per request')
+    parser.add_argument('--json', metavar='REPORT', help='also write the full report as JSON')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+
+    links = collect_yaml_links(project_root) + collect_bib_links(project_root)
+    print(f"Found {len(links)} links ({len({url for _, url in links})} unique URLs)")
+    report, checked = check_links(
+        project_root, links, args.ttl * 3600, args.per_host, args.timeout,
+    )
+    print(f"Checked {checked} stale URLs, {len(report) - checked} from cache")
+
+    broken = {url: r for url, r in report.items() if not r['ok']}
+    for url, result in sorted(broken.items(), key=lambda item: item[1]['sources']):
+        reason = result.get('error') or f"HTTP {result['status']}"
+        print(f"\n✗ {reason}: {url}")
+        for source in result['sources']:
+            print(f"    {source}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\nReport written to {args.json}")
+
+    print(f"\n{len(report) - len(broken)} OK, {len(broken)} broken")
+    return 1 if broken else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
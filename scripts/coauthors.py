@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Coauthor network built from _bibliography/references.bib, and NSF-style
+collaborator (COA) tables.
+
+Every author name is canonicalized once with publications.author_key(), so
+"Ferreira da Silva, Rafael", "da Silva, Rafael Ferreira" and accent or
+punctuation variants collapse to one node; every spelling the owner's
+AuthorIdentity recognizes (initials included) maps to the owner's node. The graph keeps per-year edge
+weights (papers co-written that year) between every pair of coauthors, plus a
+per-year count of the owner's collaborators. A windowed query ("everyone I
+published with in the last 48 months") then only touches the years in the
+window, not the whole bibliography.
+
+Parsing the BibTeX file (and normalizing its LaTeX) dominates the cost, so the
+built graph is pickled under .cache/coauthors/, keyed by the bib file's hash
+and this module's hash.
+
+Usage:
+    python scripts/coauthors.py [--months 48] [--output coa.csv]
+"""
+
+import argparse
+import csv
+import os
+import pickle
+import sys
+from collections import Counter, defaultdict
+from datetime import date
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from author_identity import AuthorIdentity  # noqa: E402
+from cache_utils import cache_dir, digest, file_digest, read_bytes, write_bytes  # noqa: E402
+from cv_data import load_yaml  # noqa: E402
+from publications import author_key, load_publications  # noqa: E402
+
+COA_HEADER = ['Type', 'Name', 'Organizational Affiliation', 'Optional (email, Department)', 'Last Active']
+
+
+class CoauthorGraph:
+    """Weighted, per-year coauthor graph centred on the CV owner."""
+
+    def __init__(self, identity):
+        self.identity = identity
+        self.owner = author_key(identity.canonical_names[0]) if identity.canonical_names else ''
+        # author key -> spelling variants seen, most common first via Counter
+        self._spellings = defaultdict(Counter)
+        # (key_a, key_b) with key_a < key_b -> {year: papers}
+        self.edges = defaultdict(Counter)
+        # year -> {collaborator key: papers with the owner that year}
+        self.by_year = defaultdict(Counter)
+
+    @classmethod
+    def from_publications(cls, publications, identity):
+        graph = cls(identity)
+        for pub in publications:
+            graph.add_publication(pub.author_list, pub.year)
+        return graph
+
+    def add_publication(self, authors, year):
+        keys = []
+        for name in authors:
+            key = self.owner if self.identity.matches(name) else author_key(name)
+            if key and key not in keys:
+                keys.append(key)
+                self._spellings[key][name] += 1
+        if year is None:
+            return
+        for a, b in combinations(sorted(keys), 2):
+            self.edges[(a, b)][year] += 1
+        if self.owner in keys:
+            for key in keys:
+                if key != self.owner:
+                    self.by_year[year][key] += 1
+
+    def display_name(self, key):
+        """The most frequent spelling of an author, as written in the bib file."""
+        return self._spellings[key].most_common(1)[0][0]
+
+    def collaborators(self, since=None, until=None):
+        """
+        [(key, papers, last_year)] for the owner's coauthors within the year
+        window (inclusive bounds, None = open), most recent and frequent first.
+        """
+        papers = Counter()
+        last_year = {}
+        for year, counts in self.by_year.items():
+            if (since is not None and year < since) or (until is not None and year > until):
+                continue
+            papers.update(counts)
+            for key in counts:
+                if year > last_year.get(key, 0):
+                    last_year[key] = year
+        return sorted(
+            ((key, n, last_year[key]) for key, n in papers.items()),
+            key=lambda row: (-row[2], -row[1], row[0]),
+        )
+
+    def weighted_edges(self, since=None, until=None):
+        """{(key_a, key_b): papers} across the whole network for the year window."""
+        out = {}
+        for pair, years in self.edges.items():
+            weight = sum(
+                n for year, n in years.items()
+                if (since is None or year >= since) and (until is None or year <= until)
+            )
+            if weight:
+                out[pair] = weight
+        return out
+
+    def coa_rows(self, since=None, until=None):
+        """COA table 'A' rows: type, name, affiliation, optional, last active."""
+        return [
+            ['A:', self.display_name(key), '', '', str(last_year)]
+            for key, _, last_year in self.collaborators(since, until)
+        ]
+
+
+def load_coauthor_graph(project_root, identity):
+    """Build (or load from .cache/coauthors/) the coauthor graph of references.bib."""
+    bib_path = os.path.join(project_root, '_bibliography', 'references.bib')
+    cache_path = None
+    if os.path.exists(bib_path):
+        # The graph depends on how publications.py splits author lists and how
+        # author_identity.py recognizes the owner, not only on this module
+        here = os.path.dirname(os.path.abspath(__file__))
+        key = digest(
+            file_digest(bib_path), identity.canonical_names,
+            *(file_digest(os.path.join(here, name))
+              for name in ('coauthors.py', 'publications.py', 'author_identity.py')),
+        )
+        cache_path = os.path.join(cache_dir(project_root, 'coauthors'), f"{key}.pickle")
+        cached = read_bytes(cache_path)
+        if cached is not None:
+            # Plain containers only, so the cache does not depend on whether
+            # this module was imported or run as __main__
+            graph = CoauthorGraph(identity)
+            spellings, edges, by_year = pickle.loads(cached)
+            graph._spellings.update((k, Counter(v)) for k, v in spellings.items())
+            graph.edges.update((k, Counter(v)) for k, v in edges.items())
+            graph.by_year.update((k, Counter(v)) for k, v in by_year.items())
+            return graph
+
+    graph = CoauthorGraph.from_publications(load_publications(project_root, identity), identity)
+    if cache_path is not None:
+        state = tuple(
+            {k: dict(v) for k, v in table.items()}
+            for table in (graph._spellings, graph.edges, graph.by_year)
+        )
+        write_bytes(cache_path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+    return graph
+
+
+def window_start(months, today=None):
+    """First calendar year touched by the last `months` months."""
+    today = today or date.today()
+    month_index = today.year * 12 + (today.month - 1) - months
+    return month_index // 12
+
+
+def write_coa_table(rows, output_path):
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(COA_HEADER)
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Coauthor statistics and COA tables.')
+    parser.add_argument('--months', type=int, default=48,
+                        help='collaboration window in months (default: 48, as for NSF COA)')
+    parser.add_argument('--output', help='write a COA table (CSV) to this path')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    data = load_yaml(os.path.join(project_root, '_data', 'rafael.yml'), project_root)
+    graph = load_coauthor_graph(project_root, AuthorIdentity.from_data(data))
+    since = window_start(args.months)
+    rows = graph.collaborators(since=since)
+    print(f"{len(rows)} collaborators since {since} ({args.months} months), "
+          f"{len(graph.collaborators())} overall")
+    for key, papers, last_year in rows[:15]:
+        print(f"  {graph.display_name(key):<40} {papers:>3} papers, last {last_year}")
+
+    if args.output:
+        write_coa_table(graph.coa_rows(since=since), args.output)
+        print(f"COA table written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Current & Pending (Other) Support report, in the layout NSF and DOE ask for.
+
+Built on funding_index.FundingIndex: the current awards are those not yet
+over on the report date, whether they are running or awarded and yet to
+start. The pending ones are the proposals listed under `funding_pending` in
+the person's YAML. For each, the report gives the source of support, award
+numbers, role, total amount, period of performance, person-months (when the
+YAML has `person_months`) and the amount prorated over each calendar year.
+A summary lists what is active on the report date and what ends within the
+next 12 months.
+
+The report is a cv_document.Document, so it is written by the same
+machinery as the CV: CVGenerator.generate_document() for the PDF,
+CVDocxGenerator for the DOCX and cv_render for HTML, Markdown and LaTeX.
+
+Usage:
+    python scripts/current_pending.py [--as-of 2026-01-01] [--person SLUG]
+                                      [--formats pdf docx html md tex] [--reproducible]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cv_data import load_yaml, people_files  # noqa: E402
+from cv_document import FUNDING_GROUPS, Block, Document, Run, Section, styled, text_block  # noqa: E402
+from funding_index import FundingIndex, months_after  # noqa: E402
+from funding_utils import resolve_funding_tokens  # noqa: E402
+from lab_cv import file_stem  # noqa: E402
+from reproducible import build_datetime, enable as enable_reproducible  # noqa: E402
+
+REPORT_TITLE = 'Current and Pending (Other) Support'
+AGENCIES = dict(FUNDING_GROUPS)
+FORMATS = ('pdf', 'docx', 'html', 'md', 'tex')
+
+
+def _money(value):
+    return f"${value:,.0f}"
+
+
+def _day(value):
+    return f"{value:%m/%d/%Y}" if value else 'present'
+
+
+def _status(award, as_of):
+    if award.pending:
+        return 'Pending'
+    if award.start > as_of:
+        return f"Awarded, starts {award.start:%m/%Y}"
+    return 'Active'
+
+
+def _award_blocks(index, award, as_of):
+    runs = [styled(award.title, bold=True)]
+    if award.amount_label:
+        runs.append(styled(f" — {award.amount_label}", bold=True, tone='accent'))
+    blocks = [Block('body', runs)]
+
+    source = award.agency or AGENCIES.get(award.category, '')
+    if award.program:
+        source = f"{source} — {award.program}" if source else award.program
+    details = [f"Status: {_status(award, as_of)}"]
+    if source:
+        details.append(f"Source of support: {source}")
+    if award.award_ids:
+        details.append(f"Award number(s): {', '.join(award.award_ids)}")
+    blocks.append(text_block('small', ' • '.join(details)))
+
+    terms = [f"Period of performance: {_day(award.start)} – {_day(award.end)}"]
+    if award.role:
+        terms.insert(0, f"Role: {award.role}")
+    if award.person_months is not None:
+        terms.append(f"Person-months per year: {award.person_months:g}")
+    blocks.append(text_block('small', ' • '.join(terms)))
+
+    by_year = index.annual_amounts([award])
+    if len(by_year) > 1:
+        blocks.append(text_block('small', 'By year (prorated): ' + ' • '.join(
+            f"{year}: {_money(amount)}" for year, amount in by_year.items()
+        )))
+    blocks.append(Block('small', rule='divider'))
+    return blocks
+
+
+def build_report(data, index, as_of):
+    """The Current & Pending Document for one person's data and FundingIndex."""
+    personal = data.get('personal', {})
+    name = personal.get('name', '')
+    suffix = personal.get('title', '')
+    header = [
+        Block('name', [Run(f"{name}, {suffix}" if suffix else name)]),
+        Block('tagline', [Run(REPORT_TITLE)]),
+        Block('contact', [Run(f"As of {as_of:%B} {as_of.day}, {as_of.year}")], rule='below'),
+    ]
+
+    current = index.current(as_of)
+    active = index.active_on(as_of)
+    ending = index.ending_within(as_of, 12)
+    next_year = months_after(as_of, 12)
+    summary = [
+        Block('body', [
+            styled(f"{len(current)} current award(s) totaling "
+                   f"{_money(sum(a.amount for a in current))}", bold=True),
+            Run(f"; {_money(index.amount_between(as_of, next_year, current))} of it falls in the "
+                "next 12 months."),
+        ]),
+        text_block('body', f"{len(active)} active on {as_of:%m/%d/%Y}; "
+                           f"{len(current) - len(active)} awarded and yet to start; "
+                           f"{len(index.pending)} pending."),
+    ]
+    if ending:
+        summary.append(Block('category', [Run('Ending within 12 months')]))
+        summary.extend(
+            text_block('small', f"{a.title} — ends {_day(a.end)}") for a in ending
+        )
+    annual = {y: v for y, v in index.annual_amounts(current).items() if y >= as_of.year}
+    if annual:
+        summary.append(Block('category', [Run('Current support by year (prorated)')]))
+        summary.append(text_block('small', ' • '.join(
+            f"{year}: {_money(amount)}" for year, amount in annual.items()
+        )))
+
+    current_blocks = [b for a in current for b in _award_blocks(index, a, as_of)]
+    pending_blocks = [b for a in index.pending for b in _award_blocks(index, a, as_of)]
+    return Document(REPORT_TITLE, [
+        Section('header', None, header),
+        Section('summary', 'Summary', summary),
+        Section('current', 'Current Support', current_blocks or [text_block('body', 'None.')]),
+        Section('pending', 'Pending Support', pending_blocks or [text_block('body', 'None.')]),
+    ])
+
+
+def write_report(document, fmt, output_base, yaml_path, project_root, activities_dir=None):
+    """Write the report as `fmt`; returns the path written."""
+    path = f"{output_base}.{fmt}"
+    if fmt == 'pdf':
+        from cv_pdf import CVGenerator
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            gen = CVGenerator(yaml_path, project_root, activities_dir=activities_dir)
+            gen.footer_label = REPORT_TITLE
+            gen.generate_document(document, path)
+    elif fmt == 'docx':
+        from cv_docx import CVDocxGenerator
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            CVDocxGenerator(document).generate(path)
+    else:
+        from cv_render import write_document
+
+        write_document(document, fmt, output_base)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write the Current & Pending support report.')
+    parser.add_argument('--as-of', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                        help='report date (default: the build date)')
+    parser.add_argument('--person', default='rafael', metavar='SLUG',
+                        help='rafael, or a lab member from _data/people/ (default: rafael)')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=['pdf', 'docx'],
+                        metavar='FORMAT', help=f"formats to write, from {', '.join(FORMATS)} "
+                                               "(default: pdf docx)")
+    parser.add_argument('--output-dir', help='directory for the report (default: files/cv)')
+    parser.add_argument('--reproducible', action='store_true',
+                        help='date the report from SOURCE_DATE_EPOCH or the last git commit')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    people = {slug: (path, activities) for slug, path, activities in people_files(project_root)}
+    if args.person not in people:
+        parser.error(f"unknown person {args.person!r}; choose from {', '.join(people)}")
+    yaml_path, activities_dir = people[args.person]
+    if args.reproducible and enable_reproducible(project_root) is None:
+        print("Warning: no SOURCE_DATE_EPOCH and no git history; output will not be reproducible.")
+
+    data = resolve_funding_tokens(load_yaml(yaml_path, project_root))
+    index = FundingIndex.from_data(data)
+    for category, title, period in index.unparsed:
+        print(f"Warning: skipping {category} award {title!r}: cannot read period {period!r}")
+    as_of = args.as_of or build_datetime().date()
+
+    document = build_report(data, index, as_of)
+    output_dir = args.output_dir or os.path.join(project_root, 'files', 'cv')
+    output_base = os.path.join(output_dir, file_stem(data, args.person) + '-current-pending')
+    os.makedirs(output_dir, exist_ok=True)
+    for fmt in dict.fromkeys(args.formats):
+        path = write_report(document, fmt, output_base, yaml_path, project_root, activities_dir)
+        print(f"✓ {fmt.upper()} report generated: {path}")
+
+
+if __name__ == '__main__':
+    main()
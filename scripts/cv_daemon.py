@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Long-lived CV render server for editors and site previews.
+
+A one-off `generate_cv_pdf.py` run pays for interpreter startup, imports,
+YAML/BibTeX parsing and style construction before it renders anything. The
+daemon pays that once: it keeps the loaded data, the PDF style sheets and the
+paragraph fragment cache resident, and answers HTTP requests on localhost or
+on a Unix socket with the rendered bytes, built in memory without temp files.
+
+    GET /cv.pdf                       the full CV (also .docx, .html, .md, .tex)
+    GET /cv.pdf?sections=header,awards   only those sections
+    GET /status                       JSON: load time, renders, cache hits
+
+Before each request the _data/*.yml files, the bibliography and the fonts
+are checked for changes (by size and mtime); when one changed, the data is
+reloaded and validated again. Rendered outputs are kept until then, so
+repeated requests for the same format and sections are served from memory.
+Changes to the scripts themselves need a restart.
+
+Usage:
+    python scripts/cv_daemon.py [--port 8765] [--socket PATH] [--reproducible]
+                                [--font REGULAR.ttf [BOLD.ttf ...]]
+
+    curl -o cv.pdf http://127.0.0.1:8765/cv.pdf
+    curl --unix-socket /tmp/cv.sock -o cv.docx http://localhost/cv.docx
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import socketserver
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from importlib.util import find_spec
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cv_document import SECTION_KEYS  # noqa: E402
+from cv_pdf import CVGenerator  # noqa: E402
+from cv_render import RENDERERS  # noqa: E402
+from data_schema import validate_data  # noqa: E402
+from pdf_fonts import register_font_family  # noqa: E402
+from reproducible import build_datetime, enable as enable_reproducible  # noqa: E402
+
+DOCX_AVAILABLE = find_spec('docx') is not None
+
+CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'html': 'text/html; charset=utf-8',
+    'md': 'text/markdown; charset=utf-8',
+    'tex': 'application/x-tex; charset=utf-8',
+}
+
+
+class InvalidData(Exception):
+    """The _data/ files have problems that validate_data() reports."""
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} problem(s) in _data/")
+        self.errors = errors
+
+
+class CVService:
+    """
+    Renders the CV to bytes from data loaded once and reloaded only when an
+    input file changes. Not thread-safe: the servers below handle one request
+    at a time.
+    """
+
+    def __init__(self, project_root, font_files=None):
+        self.project_root = project_root
+        self.yaml_path = os.path.join(project_root, '_data', 'rafael.yml')
+        self.font_files = list(font_files or [])
+        self.fonts = None
+        if self.font_files:
+            regular, *faces = self.font_files
+            self.fonts = register_font_family(regular, project_root, *faces)
+
+        self.generator = None
+        self.signature = None
+        self.outputs = {}    # (format, sections, footer month) -> bytes
+        self.documents = {}  # sections -> cv_document.Document
+        self.stats = {'loads': 0, 'load_seconds': 0.0, 'renders': 0, 'cache_hits': 0}
+
+    def _input_signature(self):
+        paths = (
+            sorted(glob.glob(os.path.join(self.project_root, '_data', '*.yml')))
+            + [os.path.join(self.project_root, '_bibliography', 'references.bib')]
+            + self.font_files
+        )
+        signature = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            signature.append((path, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def refresh(self):
+        """Reload and validate the data if any input changed since the last load."""
+        signature = self._input_signature()
+        if signature == self.signature and self.generator is not None:
+            return
+        start = time.perf_counter()
+        errors = validate_data(self.project_root)
+        if errors:
+            self.generator = None
+            self.signature = None
+            raise InvalidData(errors)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.generator = CVGenerator(self.yaml_path, self.project_root, fonts=self.fonts)
+        self.signature = signature
+        self.outputs.clear()
+        self.documents.clear()
+        self.stats['loads'] += 1
+        self.stats['load_seconds'] = round(time.perf_counter() - start, 3)
+
+    def _document(self, sections):
+        if sections not in self.documents:
+            self.documents[sections] = self.generator.document(sections)
+        return self.documents[sections]
+
+    def render(self, fmt, sections=None):
+        """
+        The CV as `fmt` ('pdf', 'docx' or a cv_render format) bytes: all
+        sections, or only the SECTION_KEYS in `sections`.
+        """
+        if fmt not in CONTENT_TYPES:
+            raise ValueError(f"Unknown format: {fmt}")
+        if fmt == 'docx' and not DOCX_AVAILABLE:
+            raise ValueError("python-docx is not installed")
+        if sections is not None:
+            sections = tuple(dict.fromkeys(sections))
+            unknown = set(sections) - set(SECTION_KEYS)
+            if unknown:
+                raise ValueError(f"Unknown CV sections: {', '.join(sorted(unknown))}")
+
+        self.refresh()
+        # The footers print the month, so a new month renders afresh
+        key = (fmt, sections, build_datetime().strftime('%Y-%m'))
+        if key in self.outputs:
+            self.stats['cache_hits'] += 1
+            return self.outputs[key]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            if fmt == 'pdf':
+                data = self.generator.render_bytes(sections)
+            elif fmt == 'docx':
+                from cv_docx import CVDocxGenerator
+
+                data = CVDocxGenerator(self._document(sections)).to_bytes()
+            else:
+                renderer, _ = RENDERERS[fmt]
+                data = renderer(self._document(sections)).encode('utf-8')
+        self.outputs[key] = data
+        self.stats['renders'] += 1
+        return data
+
+
+# ----------------------------------------------------------------------------
+# HTTP front end
+# ----------------------------------------------------------------------------
+
+
+class CVRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'CVDaemon/1.0'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        service = self.server.service
+
+        if url.path == '/status':
+            body = dict(service.stats, formats=list(CONTENT_TYPES), sections=list(SECTION_KEYS))
+            self._send(200, 'application/json', json.dumps(body, indent=1).encode('utf-8'))
+            return
+
+        name, _, fmt = url.path.lstrip('/').rpartition('.')
+        if name != 'cv' or fmt not in CONTENT_TYPES:
+            self._send_error(404, f"Not found: {url.path} (try /cv.pdf or /status)")
+            return
+
+        query = parse_qs(url.query)
+        sections = None
+        if 'sections' in query:
+            sections = [s for value in query['sections'] for s in value.split(',') if s]
+
+        start = time.perf_counter()
+        try:
+            data = service.render(fmt, sections)
+        except InvalidData as exc:
+            self._send_error(422, '\n'.join([str(exc)] + [f"  ✗ {e}" for e in exc.errors]))
+            return
+        except ValueError as exc:
+            self._send_error(400, str(exc))
+            return
+        except Exception as exc:  # keep serving after a failed render
+            self._send_error(500, f"{type(exc).__name__}: {exc}")
+            return
+        self._send(200, CONTENT_TYPES[fmt], data,
+                   {'X-Render-Time': f"{time.perf_counter() - start:.3f}"})
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        self._send(status, 'text/plain; charset=utf-8', (message + '\n').encode('utf-8'))
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+
+class CVHTTPServer(HTTPServer):
+    def __init__(self, address, service):
+        super().__init__(address, CVRequestHandler)
+        self.service = service
+
+
+class CVUnixServer(socketserver.UnixStreamServer):
+    def __init__(self, path, service):
+        super().__init__(path, CVRequestHandler)
+        self.service = service
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve CV renders from a long-lived process.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port (default: 8765)')
+    parser.add_argument('--socket', metavar='PATH', help='listen on this Unix socket instead of TCP')
+    parser.add_argument('--font', nargs='+', metavar='TTF',
+                        help='TrueType family for the PDF, as for generate_cv_pdf.py')
+    parser.add_argument('--reproducible', action='store_true',
+                        help='date the outputs from SOURCE_DATE_EPOCH or the last git commit')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+
+    if args.font and len(args.font) > 4:
+        parser.error('--font takes at most four files (regular, bold, italic, bold-italic)')
+    if args.reproducible and enable_reproducible(project_root) is None:
+        print("Warning: no SOURCE_DATE_EPOCH and no git history; output will not be reproducible.")
+
+    service = CVService(project_root, args.font)
+    try:
+        service.refresh()
+    except InvalidData as exc:
+        # Keep running: the next request after the data is fixed loads it
+        print(f"Warning: {exc}; requests fail until it is fixed:")
+        for error in exc.errors:
+            print(f"  ✗ {error}")
+    else:
+        print(f"Loaded CV data in {service.stats['load_seconds']:.2f}s")
+
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = CVUnixServer(args.socket, service)
+        print(f"Serving the CV on unix:{args.socket}")
+    else:
+        server = CVHTTPServer((args.host, args.port), service)
+        print(f"Serving the CV on http://{args.host}:{server.server_address[1]}/cv.pdf")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Loading helpers for the YAML data files under _data/, shared by the CV
+generators and the build scripts. Kept free of reportlab/python-docx imports so
+light scripts (derive_stats.py, ...) can use them without the PDF toolchain.
+
+Every YAML read goes through load_yaml(): it parses with libyaml's CSafeLoader
+when PyYAML was built with it (falling back to the pure-Python SafeLoader) and,
+given a project root, keeps the parsed object pickled under .cache/yaml/ keyed
+by the file's hash, so unchanged files are not parsed again.
+"""
+
+import os
+import pickle
+
+import yaml
+
+from cache_utils import cache_dir, digest, file_digest, read_bytes, write_bytes
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+ACTIVITY_FILES = {
+    'chair': 'activities_chair.yml',
+    'pc': 'activities_pc.yml',
+    'conference': 'activities_conference.yml',
+    'journal': 'activities_journal.yml',
+    'editor': 'activities_editor.yml',
+    'funding': 'activities_funding.yml',
+    'sc': 'activities_sc.yml',
+}
+
+# Lab members' CV data, one <slug>.yml per person (see people_files)
+PEOPLE_DIR = 'people'
+
+
+def load_yaml(path, project_root=None):
+    """
+    Parse a YAML file like yaml.safe_load, as fast as possible.
+
+    With `project_root`, the result is cached in binary form under
+    <project_root>/.cache/yaml/. Every call returns a fresh object, so callers
+    may mutate what they get.
+    """
+    cache_path = None
+    if project_root is not None:
+        key = digest(file_digest(path), SafeLoader.__name__, yaml.__version__,
+                     pickle.HIGHEST_PROTOCOL)
+        cache_path = os.path.join(cache_dir(project_root, 'yaml'), f"{key}.pickle")
+        cached = read_bytes(cache_path)
+        if cached is not None:
+            return pickle.loads(cached)
+
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    if cache_path is not None:
+        write_bytes(cache_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return data
+
+
+def load_activities(project_root, data_dir=None):
+    """The activities_*.yml files of `data_dir` (default: _data/), by kind."""
+    activities_dir = data_dir or os.path.join(project_root, '_data')
+    out = {}
+    for key, filename in ACTIVITY_FILES.items():
+        filepath = os.path.join(activities_dir, filename)
+        if os.path.exists(filepath):
+            out[key] = load_yaml(filepath, project_root)
+    return out
+
+
+def people_files(project_root):
+    """
+    [(slug, yaml path, activities dir)] for everyone with a CV: the site owner
+    (_data/rafael.yml, activities in _data/) and each lab member
+    (_data/people/<slug>.yml, activities in _data/people/<slug>/).
+    """
+    data_dir = os.path.join(project_root, '_data')
+    people = [('rafael', os.path.join(data_dir, 'rafael.yml'), data_dir)]
+    people_dir = os.path.join(data_dir, PEOPLE_DIR)
+    if os.path.isdir(people_dir):
+        for filename in sorted(os.listdir(people_dir)):
+            slug, ext = os.path.splitext(filename)
+            if ext == '.yml':
+                people.append((slug, os.path.join(people_dir, filename),
+                               os.path.join(people_dir, slug)))
+    return people
@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+"""
+Renderer-independent representation of the CV: sections -> blocks -> runs.
+
+build_document() walks the YAML data, activities and publications once and
+produces a Document that the output backends only have to lay out: the DOCX
+generator (CVDocxGenerator) and the HTML/Markdown/LaTeX exporters in
+cv_render.py all consume the same Document, so emitting several formats pays
+for the data walk once.
+
+The vocabulary is deliberately small:
+
+- Run: text with optional bold/italic and a colour `tone` ('primary',
+  'accent', 'muted'). bold/italic are None to inherit the block's style and
+  True/False to set it explicitly.
+- Block: a paragraph with a `role` (name, tagline, contact, subsection,
+  category, body, entry, metric, small, publication) and an optional `rule`
+  decoration ('below' under the header, 'callout' for the highlight box,
+  'divider' for the closing separator). An 'entry' is one item of a list:
+  the 'small' blocks right after it are its detail lines, `right` holds the
+  runs of its right-hand column (dates, amounts; one line each) and `indent`
+  nests it under a category or subsection. The header's 'contact' block keeps
+  its lines in `right` as well. A 'metric' is a headline figure: its first
+  run is the value, the rest the label.
+- Section: a titled list of blocks (the header has no title).
+
+The PDF (CVGenerator.document_story) lays out right-hand columns and metrics
+as such; backends without columns take a block's text from inline_runs().
+"""
+
+import re
+
+from author_identity import AuthorIdentity
+from cv_data import load_activities, load_yaml
+from derive_stats import compute_derived
+from funding_utils import parse_amount, resolve_funding_tokens
+from publications import PublicationSet, load_publications
+from reproducible import build_datetime
+
+
+# Section keys in page order, shared by every backend (and by --sections)
+SECTION_KEYS = (
+    'header', 'summary', 'major_funding', 'appointments', 'education', 'research',
+    'selected_publications', 'awards', 'funding', 'activities', 'talks', 'teaching',
+    'affiliations', 'students', 'publications',
+)
+
+# Entries shown by the sections that feature a selection; page-budget builds
+# (generate_cv_pdf.py --pages) pick their own
+DEFAULT_COUNTS = {'major_funding': 4, 'selected_publications': 10}
+
+# Sections that read the bibliography
+PUBLICATION_SECTIONS = frozenset({'summary', 'selected_publications', 'publications'})
+
+
+def needs_publications(sections):
+    """True unless `sections` (None = all) avoids every publication section."""
+    return sections is None or not PUBLICATION_SECTIONS.isdisjoint(sections)
+
+
+def strip_html(text):
+    if not text:
+        return ""
+    text = re.sub(r'<a[^>]*>', '', text)
+    text = re.sub(r'</a>', '', text)
+    text = re.sub(r'<[^>]+>', '', text)
+    return text.strip()
+
+
+class Run:
+    __slots__ = ('text', 'bold', 'italic', 'tone')
+
+    def __init__(self, text, bold=None, italic=None, tone=None):
+        self.text = text
+        self.bold = bold
+        self.italic = italic
+        self.tone = tone
+
+    def __repr__(self):
+        return f"Run({self.text!r}, bold={self.bold}, italic={self.italic}, tone={self.tone})"
+
+
+class Block:
+    __slots__ = ('role', 'runs', 'rule', 'right', 'indent')
+
+    def __init__(self, role, runs=(), rule=None, right=(), indent=0):
+        self.role = role
+        self.runs = list(runs)
+        self.rule = rule
+        self.right = list(right)
+        self.indent = indent
+
+    @property
+    def text(self):
+        return ''.join(run.text for run in self.runs)
+
+
+class Section:
+    __slots__ = ('key', 'title', 'blocks')
+
+    def __init__(self, key, title=None, blocks=()):
+        self.key = key
+        self.title = title
+        self.blocks = list(blocks)
+
+
+class Document:
+    __slots__ = ('title', 'sections')
+
+    def __init__(self, title, sections):
+        self.title = title
+        self.sections = sections
+
+
+def styled(text, bold=False, italic=False, tone=None):
+    """A run with explicit bold/italic, overriding the block style."""
+    return Run(text, bold=bold, italic=italic, tone=tone)
+
+
+def text_block(role, text, indent=0):
+    """A block holding plain text (no run at all when the text is empty)."""
+    return Block(role, [Run(text)] if text else [], indent=indent)
+
+
+def joined(runs, separator):
+    """`runs` with a `separator` run between neighbours."""
+    out = []
+    for run in runs:
+        if out:
+            out.append(separator)
+        out.append(run)
+    return out
+
+
+def inline_runs(block):
+    """
+    The block's runs with its right-hand column inline, for backends that
+    lay blocks out as single paragraphs: "  (2019–2023)" after an entry, the
+    lines joined by bullets in a block that has nothing else.
+    """
+    if not block.right:
+        return block.runs
+    if not block.runs:
+        return joined(block.right, Run(' • '))
+    return (block.runs + [Run('  (', tone='muted')]
+            + joined(block.right, Run(', ', tone='muted')) + [Run(')', tone='muted')])
+
+
+# Figures worth bolding in prose: $12M, 40+, 2,500
+NUMBER = re.compile(r'(\$?\d[\d,]*\+?M?)')
+
+
+def emphasized(text):
+    """Runs of `text` with its figures in bold."""
+    return [Run(part, bold=True if i % 2 else None)
+            for i, part in enumerate(NUMBER.split(text)) if part]
+
+
+# ----------------------------------------------------------------------------
+# Builder
+# ----------------------------------------------------------------------------
+
+FUNDING_GROUPS = [
+    ('doe', 'U.S. Department of Energy (DOE)'),
+    ('nsf', 'U.S. National Science Foundation (NSF)'),
+    ('darpa', 'U.S. Defense Advanced Research Projects Agency (DARPA)'),
+    ('international', 'International / Other'),
+]
+
+
+class DocumentBuilder:
+    """Builds the Document from the loaded CV inputs, one section per method."""
+
+    def __init__(self, data, activities, publications, funding, counts=None, selection=None):
+        self.data = data
+        self.activities = activities
+        self.publications = publications
+        # The publication lists show only the PublicationSet.query() matches
+        # of `selection`; the headline figures still count every publication
+        self.selection = dict(selection or {})
+        self.listed = publications.query(**self.selection)
+        self.funding = funding
+        self.counts = dict(DEFAULT_COUNTS, **(counts or {}))
+
+    def build(self, sections=None):
+        """The Document with every section, or only the SECTION_KEYS in `sections`."""
+        personal = self.data.get('personal', {})
+        builders = {
+            'header': self._header,
+            'summary': self._executive_summary,
+            'major_funding': lambda: self._major_funding(top_n=self.counts['major_funding']),
+            'appointments': self._appointments,
+            'education': self._education,
+            'research': self._research,
+            'selected_publications': lambda: self._selected_publications(
+                count=self.counts['selected_publications'],
+            ),
+            'awards': self._awards,
+            'funding': self._funding,
+            'activities': self._professional_activities,
+            'talks': self._invited_talks,
+            'teaching': self._teaching,
+            'affiliations': self._affiliations,
+            'students': self._students,
+            'publications': self._publications,
+        }
+        built = [builders[key]() for key in SECTION_KEYS if sections is None or key in sections]
+        built.append(self._footer())
+        return Document(
+            title=f"Curriculum Vitae — {personal.get('name', '')}",
+            sections=[s for s in built if s is not None],
+        )
+
+    # ----- sections
+    def _header(self):
+        personal = self.data.get('personal', {})
+        name = personal.get('name', '')
+        suffix = personal.get('title', '')
+        full_name = f"{name}, {suffix}" if suffix else name
+        blocks = [Block('name', [Run(full_name)])]
+
+        titles = []
+        for pos in personal.get('titles_full', []):
+            t = pos.get('title', '')
+            if pos.get('interim'):
+                t += ' (Interim)'
+            titles.append(t)
+        if titles:
+            blocks.append(Block('tagline', [Run(' • '.join(titles))]))
+
+        contact = personal.get('contact', {})
+        office = personal.get('office', {})
+        lines = []
+        if office.get('institution'):
+            lines.append(styled(office['institution'], bold=True))
+        if contact.get('email'):
+            lines.append(Run(contact['email']))
+        if contact.get('website'):
+            site = contact['website'].replace('https://', '').replace('http://', '')
+            lines.append(Run(site, tone='accent'))
+        if contact.get('phone'):
+            lines.append(Run(contact['phone']))
+        blocks.append(Block('contact', right=lines, rule='below'))
+        return Section('header', None, blocks)
+
+    def _executive_summary(self):
+        personal = self.data.get('personal', {})
+        blocks = []
+        intro = personal.get('intro', '')
+        if intro:
+            blocks.append(text_block('body', strip_html(intro)))
+
+        blocks.extend(self._metrics())
+
+        research = self.data.get('research', {})
+        highlights = research.get('leadership_highlights', [])
+        accomplishments = list(highlights[:4])
+
+        senior = [m for m in personal.get('memberships', []) if 'Senior' in m.get('level', '')]
+        if senior:
+            orgs = ', '.join(sorted({m.get('organization', '') for m in senior if m.get('organization')}))
+            if orgs:
+                accomplishments.append(f"Senior Member of {orgs}")
+
+        if accomplishments:
+            parts = joined([emphasized(item) for item in accomplishments], [Run('; ')])
+            runs = [run for part in parts for run in part]
+            blocks.append(Block('body', runs + [Run('.')], rule='callout'))
+
+        projects = self.data.get('research_projects', [])
+        initiatives = []
+        for project in projects:
+            n = project.get('name', '')
+            if not n:
+                continue
+            count = str(project.get('count', '')).strip()
+            if initiatives:
+                initiatives.append(Run(' • '))
+            initiatives.append(styled(n, bold=True))
+            if count:
+                initiatives.append(Run(f" ({count})"))
+        if initiatives:
+            blocks.append(Block('body', [
+                styled('Signature initiatives: ', bold=True), *initiatives, Run('.'),
+            ]))
+        return Section('summary', None, blocks)
+
+    def _metrics(self):
+        """Headline figures: funding, publications, grants, awards."""
+        metrics = []
+        if self.funding['total']:
+            metrics.append((self.funding['total_label'], 'Funded awards'))
+        if self.publications:
+            recent = self.publications.count_since(2020)
+            metrics.append((str(len(self.publications)), f'Publications ({recent} since 2020)'))
+        if self.funding['count']:
+            metrics.append((str(self.funding['count']), 'Competitive grants'))
+        awards = self.data.get('awards', [])
+        if awards:
+            metrics.append((str(len(awards)), 'Best paper awards'))
+        return [
+            Block('metric', [styled(value, bold=True, tone='primary'), Run(f" {label}")])
+            for value, label in metrics
+        ]
+
+    def _major_funding(self, top_n=4):
+        funding = self.data.get('funding', {})
+        if not funding:
+            return None
+        categories = [('doe', 'DOE'), ('nsf', 'NSF'), ('darpa', 'DARPA'), ('international', 'International')]
+        entries = []
+        for key, label in categories:
+            for a in funding.get(key, []):
+                entries.append({
+                    'title': a.get('title', ''),
+                    'role': a.get('role', ''),
+                    'period': a.get('period', ''),
+                    'amount': a.get('amount', ''),
+                    'amount_value': parse_amount(a.get('amount')),
+                    'program': a.get('program', ''),
+                    'label': label,
+                })
+        if not entries or top_n <= 0:
+            return None
+        entries.sort(key=lambda x: x['amount_value'], reverse=True)
+
+        blocks = []
+        for entry in entries[:top_n]:
+            right = []
+            if entry['amount']:
+                right.append(styled(str(entry['amount']), bold=True, tone='accent'))
+            if entry['period']:
+                right.append(styled(str(entry['period']), tone='muted'))
+            blocks.append(Block('entry', [styled(entry['title'], bold=True)], right=right))
+            meta = ' • '.join(x for x in [entry['role'], entry['program'], entry['label']] if x)
+            if meta:
+                blocks.append(text_block('small', meta))
+        return Section('major_funding', 'Major Funded Programs', blocks)
+
+    def _appointments(self):
+        appointments = self.data.get('appointments', {})
+        if not appointments:
+            return None
+        blocks = []
+
+        def render(appt, include_dept=False):
+            institution = appt.get('institution', '')
+            country = appt.get('country', '')
+            dept = appt.get('department', '')
+            line = institution
+            if include_dept and dept:
+                line += f", {dept}"
+            if country:
+                line += f", {country}"
+            blocks.append(Block('subsection', [Run(line)]))
+            for pos in appt.get('positions', []):
+                title = pos.get('title', '')
+                period = pos.get('period', '')
+                division = pos.get('division', '')
+                runs = [styled('▸', tone='accent'), Run(f"\u00a0\u00a0{title}")]
+                if division:
+                    runs += [Run(', '), styled(division, italic=True)]
+                right = [styled(str(period), tone='muted')] if period else []
+                blocks.append(Block('entry', runs, right=right, indent=1))
+
+        for appt in appointments.get('current', []):
+            render(appt, include_dept=False)
+        for appt in appointments.get('past', []):
+            render(appt, include_dept=True)
+        return Section('appointments', 'Professional Appointments', blocks)
+
+    def _education(self):
+        education = self.data.get('education', [])
+        if not education:
+            return None
+        blocks = []
+        for edu in education:
+            degree = edu.get('degree', '')
+            year = edu.get('year', '')
+            institution = edu.get('institution', '')
+            country = edu.get('country', '')
+            right = [styled(str(year), bold=True, tone='accent')] if year else []
+            blocks.append(Block('entry', [styled(degree, bold=True)], right=right))
+            inst_line = f"{institution}, {country}" if country else institution
+            blocks.append(text_block('small', inst_line))
+            if edu.get('thesis_title'):
+                blocks.append(Block('small', [Run(f"Thesis: {edu['thesis_title']}", italic=True)]))
+        return Section('education', 'Education', blocks)
+
+    def _research(self):
+        research = self.data.get('research', {})
+        if not research:
+            return None
+        blocks = []
+        description = research.get('description', '')
+        if description:
+            blocks.append(text_block('body', strip_html(description)))
+        areas = research.get('areas', [])
+        if areas:
+            blocks.append(Block('body', [
+                styled('Focus areas: ', tone='muted'),
+                *joined([styled(area, bold=True) for area in areas], Run(' \u00a0·\u00a0 ')),
+                Run('.'),
+            ]))
+        return Section('research', 'Research Focus', blocks)
+
+    def _citation(self, pub, number):
+        """Publication block; the owner's name is bold."""
+        parts = []
+        if pub.authors:
+            parts.append([Run(text, bold=True if is_owner else None)
+                          for text, is_owner in pub.author_segments()])
+        if pub.title:
+            parts.append([Run(f"“{pub.title}”")])
+        if pub.venue:
+            parts.append([Run(pub.venue, italic=True)])
+        if pub.year_label:
+            parts.append([Run(str(pub.year_label))])
+        if pub.doi:
+            parts.append([Run(f"DOI: {pub.doi}")])
+
+        runs = [Run(f"[{number}]", bold=True), Run('\u00a0\u00a0')]
+        for part in joined(parts, [Run('. ')]):
+            runs.extend(part)
+        runs.append(Run('.'))
+        return Block('publication', runs)
+
+    def _selected_publications(self, count=10):
+        if not self.listed or count <= 0:
+            return None
+        n = len(self.listed)
+        blocks = []
+        for pub in self.listed[:count]:
+            blocks.append(self._citation(pub, n))
+            n -= 1
+        return Section('selected_publications', 'Selected Recent Publications', blocks)
+
+    def _publications(self):
+        if not self.listed:
+            return None
+        n = len(self.listed)
+        blocks = []
+        for year, pubs in self.listed.year_groups():
+            blocks.append(Block('category', [Run(year)]))
+            for pub in pubs:
+                blocks.append(self._citation(pub, n))
+                n -= 1
+        if self.selection:
+            title = f'Publication Record ({len(self.listed)} of {len(self.publications)})'
+        else:
+            title = f'Complete Publication Record ({len(self.listed)} total)'
+        return Section('publications', title, blocks)
+
+    def _funding(self):
+        funding = self.data.get('funding', {})
+        if not funding:
+            return None
+        blocks = []
+        if self.funding['total']:
+            blocks.append(Block('body', [
+                styled(f"Total: {self.funding['total_label']}", bold=True, tone='primary'),
+                Run(f" across {self.funding['count']} competitively reviewed proposals."),
+            ]))
+        for key, label in FUNDING_GROUPS:
+            blocks.extend(self._funding_group(funding.get(key, []), label, with_award_ids=(key == 'nsf')))
+        return Section('funding', 'Funding Awards', blocks)
+
+    def _funding_group(self, awards, label, with_award_ids=False):
+        if not awards:
+            return []
+        blocks = [Block('category', [Run(label)])]
+        for a in awards:
+            right = [styled(str(a['amount']), bold=True, tone='accent')] if a.get('amount') else []
+            blocks.append(Block('entry', [styled(a.get('title', ''), bold=True)], right=right, indent=1))
+            detail_parts = [x for x in [a.get('role'), a.get('period')] if x]
+            detail = ', '.join(detail_parts)
+            if with_award_ids:
+                ids = ', '.join(f"#{x.get('id', '')}" for x in a.get('awards', []) if x.get('id'))
+                if ids:
+                    detail = f"{detail} ({ids})" if detail else ids
+            if detail:
+                blocks.append(text_block('small', detail, indent=1))
+        return blocks
+
+    def _awards(self):
+        awards = self.data.get('awards', [])
+        if not awards:
+            return None
+        blocks = []
+        for award in awards:
+            runs = [styled(award.get('title', ''), bold=True)]
+            event = award.get('event') or award.get('organization', '')
+            if event:
+                runs.append(Run(f" — {event}"))
+            right = [styled(str(award['year']), bold=True, tone='accent')] if award.get('year') else []
+            blocks.append(Block('entry', runs, right=right))
+            if award.get('paper'):
+                blocks.append(Block('small', [Run(award['paper'], italic=True)]))
+        return Section('awards', 'Awards & Honors', blocks)
+
+    def _professional_activities(self):
+        activities = self.data.get('professional_activities', {})
+        if not self.activities and not activities:
+            return None
+        blocks = []
+
+        def entry(runs, period=''):
+            right = [styled(str(period), tone='muted')] if period else []
+            blocks.append(Block('entry', runs, right=right, indent=1))
+
+        def write_category(name, items, fmt):
+            if not items:
+                return
+            blocks.append(Block('category', [Run(name)]))
+            for item in items:
+                entry(fmt(item), item.get('period', ''))
+
+        write_category(
+            'Steering Committees',
+            activities.get('steering_committees', []),
+            lambda i: [Run(f"{i.get('role', '')}, "), styled(i.get('organization', ''), bold=True)],
+        )
+        write_category(
+            'Advisory Boards',
+            activities.get('advisory_boards', []),
+            lambda i: [styled(i.get('name', ''), bold=True)]
+            + ([Run(f" ({i['type']})")] if i.get('type') else [])
+            + ([Run(f" — {i['note']}")] if i.get('note') else []),
+        )
+
+        chair = self.activities.get('chair', [])
+        if chair:
+            blocks.append(Block('category', [Run('Conference / Workshop Chair Roles')]))
+            for conf in chair:
+                conf_name = conf.get('conference', '')
+                series = conf.get('series', '')
+                for e in conf.get('entries', []):
+                    runs = [Run(f"{e.get('role', '')}, "), styled(conf_name, bold=True)]
+                    if series:
+                        runs.append(Run(f" ({series})"))
+                    if e.get('location'):
+                        runs.append(Run(f" — {e['location']}"))
+                    entry(runs, e.get('year', ''))
+
+        pc = self.activities.get('pc', [])
+        if pc:
+            blocks.append(Block('category', [Run('Program Committee Member')]))
+            for conf in pc:
+                series = conf.get('series', '')
+                years = ', '.join(str(e.get('year', '')) for e in conf.get('entries', []))
+                runs = [styled(conf.get('conference', ''), bold=True)]
+                if series:
+                    runs.append(Run(f" ({series})"))
+                if years:
+                    runs.append(Run(f" — {years}"))
+                entry(runs)
+
+        write_category(
+            'Editorial Positions',
+            activities.get('editorial', []),
+            lambda i: [Run(f"{i.get('role', '')}, "), styled(i.get('journal', ''), italic=True)],
+        )
+        write_category(
+            'Funding Review Panels',
+            activities.get('funding_reviewer', []),
+            lambda i: [Run(f"{i.get('role', '')}, "), styled(i.get('agency', ''), bold=True)],
+        )
+        return Section('activities', 'Professional Activities', blocks)
+
+    def _invited_talks(self):
+        talks = self.data.get('invited_talks', [])
+        if not talks:
+            return None
+        blocks = []
+        for year_group in talks:
+            blocks.append(Block('category', [Run(str(year_group.get('year', '')))]))
+            for talk in year_group.get('entries', []):
+                blocks.append(Block('entry', [styled(talk.get('title', ''), bold=True)], indent=1))
+                detail = ', '.join(x for x in [talk.get('event', ''), talk.get('location', '')] if x)
+                if detail:
+                    blocks.append(text_block('small', detail, indent=1))
+        return Section('talks', 'Invited Talks', blocks)
+
+    def _teaching(self):
+        teaching = self.data.get('teaching', [])
+        if not teaching:
+            return None
+        blocks = []
+        for course in teaching:
+            runs = [styled(f"{course.get('course', '')}", bold=True)]
+            level = course.get('level', '')
+            if level:
+                runs += [Run(' — '), styled(level, tone='muted')]
+            semester = course.get('semester', '')
+            right = [styled(str(semester), tone='muted')] if semester else []
+            blocks.append(Block('entry', runs, right=right))
+            inst = course.get('institution', '')
+            if inst:
+                blocks.append(text_block('small', inst))
+        return Section('teaching', 'Teaching Experience', blocks)
+
+    def _students(self):
+        students = self.data.get('students', {})
+        if not students:
+            return None
+        groups = [
+            ('phd', 'PhD Students'),
+            ('worker', 'Student Workers / Interns'),
+            ('dr', 'Directed Research Students'),
+            ('thesis_committee', 'Thesis Committee Member'),
+        ]
+        blocks = []
+        for key, label in groups:
+            items = students.get(key, [])
+            if not items:
+                continue
+            blocks.append(Block('category', [Run(label)]))
+            for s in items:
+                name = s.get('name', '')
+                degree = s.get('degree', '')
+                period = s.get('period', '') or s.get('year', '')
+                institution = s.get('institution', '')
+                runs = [styled(name, bold=True)]
+                trail = ', '.join(x for x in [degree, institution] if x)
+                if trail:
+                    runs.append(Run(f" — {trail}"))
+                right = [styled(str(period), tone='muted')] if period else []
+                blocks.append(Block('entry', runs, right=right, indent=1))
+        return Section('students', 'Students & Mentoring', blocks)
+
+    def _affiliations(self):
+        personal = self.data.get('personal', {})
+        memberships = personal.get('memberships', [])
+        certifications = personal.get('certifications', [])
+        if not memberships and not certifications:
+            return None
+        blocks = []
+
+        def write_category(name, items, title_key, trail_key, date_key):
+            if not items:
+                return
+            blocks.append(Block('category', [Run(name)]))
+            for item in items:
+                runs = [styled(item.get(title_key, ''), bold=True)]
+                if item.get(trail_key):
+                    runs.append(Run(f" — {item[trail_key]}"))
+                right = [styled(str(item[date_key]), tone='muted')] if item.get(date_key) else []
+                blocks.append(Block('entry', runs, right=right, indent=1))
+
+        write_category('Professional Memberships', memberships, 'organization', 'level', 'period')
+        write_category('Certifications', certifications, 'title', 'organization', 'date')
+        return Section('affiliations', 'Affiliations & Certifications', blocks)
+
+    def _footer(self):
+        updated = build_datetime().strftime("Last updated: %B %Y")
+        return Section('footer', None, [
+            Block('small', rule='divider'),
+            Block('small', [Run(updated)]),
+        ])
+
+
+def build_document(data, activities, publications, funding, sections=None, counts=None,
+                   selection=None):
+    """
+    The CV Document for already-loaded inputs (see load_document); `counts`
+    overrides DEFAULT_COUNTS and `selection` holds PublicationSet.query()
+    filters for the publication lists.
+    """
+    return DocumentBuilder(data, activities, publications, funding, counts, selection).build(sections)
+
+
+def load_document(yaml_path, project_root, sections=None, selection=None):
+    """
+    Load the CV inputs the same way the generators do and build the Document.
+    The bibliography is only read if one of `sections` needs it.
+    """
+    data = load_yaml(yaml_path, project_root)
+    activities = load_activities(project_root)
+    funding = compute_derived(data, activities)['funding']
+    data = resolve_funding_tokens(data)
+    if needs_publications(sections):
+        publications = load_publications(project_root, AuthorIdentity.from_data(data))
+    else:
+        publications = PublicationSet([])
+    return build_document(data, activities, publications, funding, sections, selection=selection)
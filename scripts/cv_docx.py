@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+DOCX backend of the CV: CVDocxGenerator writes a cv_document.Document with
+python-docx, mapping block roles to Word paragraph styles and run tones to the
+palette.
+
+This module imports python-docx; the generate_cv_pdf.py entry point imports it
+only when a DOCX is requested.
+"""
+
+import io
+import os
+import sys
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cv_document import inline_runs, load_document  # noqa: E402
+from reproducible import (  # noqa: E402
+    build_datetime,
+    is_reproducible,
+    normalize_zip,
+    normalize_zip_bytes,
+    source_date_epoch,
+)
+
+
+class CVDocxGenerator:
+    """Modern DOCX CV — uses real Word borders, not underscore separators."""
+
+    PALETTE = {
+        'ink':     RGBColor(0x1a, 0x20, 0x2c),
+        'primary': RGBColor(0x1e, 0x3a, 0x8a),
+        'accent':  RGBColor(0x25, 0x63, 0xeb),
+        'muted':   RGBColor(0x64, 0x74, 0x8b),
+    }
+
+    # Block role -> paragraph style
+    STYLES = {
+        'name': 'CV Name',
+        'tagline': 'CV Tagline',
+        'contact': 'CV Contact',
+        'subsection': 'CV Subsection',
+        'category': 'CV Category',
+        'body': 'CV Body',
+        'entry': 'CV Body',
+        'metric': 'CV Body',
+        'small': 'CV Small',
+        'publication': 'CV Publication',
+    }
+
+    def __init__(self, document):
+        self.document = document
+        self.doc = Document()
+        self._set_page_margins()
+        self._setup_styles()
+
+    @classmethod
+    def from_yaml(cls, yaml_path, project_root):
+        return cls(load_document(yaml_path, project_root))
+
+    def _set_page_margins(self):
+        for section in self.doc.sections:
+            section.top_margin = Inches(0.65)
+            section.bottom_margin = Inches(0.8)
+            section.left_margin = Inches(0.7)
+            section.right_margin = Inches(0.7)
+
+    def _setup_styles(self):
+        styles = self.doc.styles
+        existing = {s.name for s in styles}
+
+        normal = styles['Normal']
+        normal.font.name = 'Calibri'
+        normal.font.size = Pt(10)
+        normal.font.color.rgb = self.PALETTE['ink']
+
+        def add(name, size, bold=False, color=None, italic=False, space_before=0, space_after=0):
+            if name in existing:
+                return
+            s = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            s.font.name = 'Calibri'
+            s.font.size = Pt(size)
+            s.font.bold = bold
+            s.font.italic = italic
+            if color is not None:
+                s.font.color.rgb = color
+            s.paragraph_format.space_before = Pt(space_before)
+            s.paragraph_format.space_after = Pt(space_after)
+            return s
+
+        add('CV Name', 22, bold=True, color=self.PALETTE['ink'])
+        add('CV Tagline', 11, bold=True, color=self.PALETTE['accent'])
+        add('CV Contact', 9, color=self.PALETTE['muted'])
+        add('CV Section', 11, bold=True, color=self.PALETTE['primary'], space_before=10, space_after=4)
+        add('CV Subsection', 10, bold=True, color=self.PALETTE['primary'])
+        add('CV Category', 9.5, bold=True, color=self.PALETTE['accent'], space_before=4, space_after=2)
+        add('CV Body', 10, color=self.PALETTE['ink'])
+        add('CV Small', 9, color=self.PALETTE['muted'])
+
+        pub_name = 'CV Publication'
+        if pub_name not in existing:
+            pub_style = styles.add_style(pub_name, WD_STYLE_TYPE.PARAGRAPH)
+            pub_style.font.name = 'Calibri'
+            pub_style.font.size = Pt(9)
+            pub_style.font.color.rgb = self.PALETTE['ink']
+            pub_style.paragraph_format.left_indent = Inches(0.25)
+            pub_style.paragraph_format.first_line_indent = Inches(-0.25)
+            pub_style.paragraph_format.space_after = Pt(2)
+
+    # ----- helpers
+    def _bottom_border(self, paragraph, size=8, color='1e3a8a'):
+        """Add a colored bottom border to a paragraph (Word native, not underscores)."""
+        pPr = paragraph._p.get_or_add_pPr()
+        pBdr = OxmlElement('w:pBdr')
+        bottom = OxmlElement('w:bottom')
+        bottom.set(qn('w:val'), 'single')
+        bottom.set(qn('w:sz'), str(size))
+        bottom.set(qn('w:space'), '4')
+        bottom.set(qn('w:color'), color)
+        pBdr.append(bottom)
+        pPr.append(pBdr)
+
+    def _left_border(self, paragraph, size=24, color='1e3a8a'):
+        pPr = paragraph._p.get_or_add_pPr()
+        pBdr = OxmlElement('w:pBdr')
+        left = OxmlElement('w:left')
+        left.set(qn('w:val'), 'single')
+        left.set(qn('w:sz'), str(size))
+        left.set(qn('w:space'), '8')
+        left.set(qn('w:color'), color)
+        pBdr.append(left)
+        pPr.append(pBdr)
+
+    def _section(self, title):
+        p = self.doc.add_paragraph(style='CV Section')
+        p.add_run(title.upper())
+        self._bottom_border(p, size=8, color='1e3a8a')
+
+    # Left indent per cv_document indent level
+    INDENT = Inches(0.18)
+
+    def _add_block(self, block):
+        p = self.doc.add_paragraph(style=self.STYLES[block.role])
+        if block.indent:
+            p.paragraph_format.left_indent = self.INDENT * block.indent
+        for r in inline_runs(block):
+            run = p.add_run(r.text)
+            if r.bold is not None:
+                run.bold = r.bold
+            if r.italic is not None:
+                run.italic = r.italic
+            if r.tone is not None:
+                run.font.color.rgb = self.PALETTE[r.tone]
+        if block.rule == 'below':
+            self._bottom_border(p, size=12, color='1e3a8a')
+        elif block.rule == 'callout':
+            self._left_border(p, size=24, color='2563eb')
+        elif block.rule == 'divider':
+            self._bottom_border(p, size=4, color='e2e8f0')
+
+    def _fill(self):
+        print("Building DOCX CV sections...")
+        for section in self.document.sections:
+            if section.title:
+                self._section(section.title)
+            for block in section.blocks:
+                self._add_block(block)
+        if is_reproducible():
+            # python-docx keeps its template's dates; stamp the build date instead
+            props = self.doc.core_properties
+            props.created = props.modified = build_datetime().replace(tzinfo=None)
+
+    def generate(self, output_path):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        self._fill()
+        print("Saving DOCX...")
+        self.doc.save(output_path)
+        if is_reproducible():
+            normalize_zip(output_path, source_date_epoch())
+        print(f"✓ DOCX CV generated: {output_path}")
+
+    def to_bytes(self):
+        """Write the DOCX into memory and return its bytes."""
+        self._fill()
+        buffer = io.BytesIO()
+        self.doc.save(buffer)
+        data = buffer.getvalue()
+        if is_reproducible():
+            data = normalize_zip_bytes(data, source_date_epoch())
+        return data
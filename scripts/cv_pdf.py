@@ -0,0 +1,1028 @@
+#!/usr/bin/env python3
+"""
+PDF backend of the CV: CVGenerator lays the cv_document.Document built from
+the YAML data out as reportlab flowables and renders them, in one pass or with
+the layout cache, chunked or parallel builds described on generate().
+
+This module imports reportlab (and pypdf, for stitched builds); the
+generate_cv_pdf.py entry point imports it only when a PDF is requested.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from author_identity import AuthorIdentity  # noqa: E402
+from cache_utils import digest  # noqa: E402
+from cv_data import load_activities, load_yaml  # noqa: E402
+from cv_document import DEFAULT_COUNTS, SECTION_KEYS, build_document, needs_publications  # noqa: E402
+from derive_stats import compute_derived  # noqa: E402
+from funding_utils import FUNDING_CATEGORIES, resolve_funding_tokens  # noqa: E402
+from pdf_flowables import ColumnRow  # noqa: E402
+from pdf_fonts import DEFAULT_FONTS, font_digests  # noqa: E402
+from pdf_size import compact_pdf, compact_streams  # noqa: E402
+from publications import PublicationSet, load_publications  # noqa: E402
+from reproducible import build_datetime, is_reproducible  # noqa: E402
+from pdf_pages import (  # noqa: E402
+    PYPDF_AVAILABLE,
+    HeightModel,
+    LayoutCache,
+    TrackingDocTemplate,
+    flowable_fingerprint,
+    source_digest,
+    stamp_pages,
+    stitch_pdfs,
+)
+
+import reportlab
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (
+    HRFlowable,
+    PageBreak,
+    Paragraph,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+
+# ----------------------------------------------------------------------------
+# PDF Generator
+# ----------------------------------------------------------------------------
+
+# Paragraph style sheets shared by every CVGenerator in the process, keyed by
+# palette, fonts and geometry (see CVGenerator._create_styles).
+_STYLE_SHEETS = {}
+
+
+@lru_cache(maxsize=4096)
+def parse_paragraph(markup, style):
+    """
+    Parse paragraph mini-HTML once per (markup, style) and return its fragments.
+
+    Years, roles, periods and conference names repeat dozens of times in the CV;
+    reportlab only reads the fragment list when wrapping, so identical cells can
+    share it. `style` comes from a shared style sheet and is keyed by identity.
+    """
+    return Paragraph(markup, style).frags
+
+
+class CVGenerator:
+    """Modern, professional PDF CV generator."""
+
+    # --- Page geometry -------------------------------------------------------
+    PAGE_WIDTH, PAGE_HEIGHT = letter
+    MARGIN_X = 0.7 * inch
+    MARGIN_TOP = 0.65 * inch
+    MARGIN_BOTTOM = 0.85 * inch  # extra room for footer
+    CONTENT_WIDTH = PAGE_WIDTH - (2 * MARGIN_X)
+
+    # Two-column row geometry — single source of truth so dates line up
+    RIGHT_COL_WIDTH = 1.25 * inch
+    LEFT_COL_WIDTH = CONTENT_WIDTH - RIGHT_COL_WIDTH
+
+    # Header right column is wider to accommodate contact info
+    HEADER_RIGHT_WIDTH = 2.6 * inch
+    HEADER_LEFT_WIDTH = CONTENT_WIDTH - HEADER_RIGHT_WIDTH
+
+    # Vertical rhythm
+    SPACE_SECTION = 0.14 * inch
+    SPACE_SUBSECTION = 0.07 * inch
+    SPACE_ITEM = 0.04 * inch
+    SPACE_DETAIL = 0.02 * inch
+
+    # Sub-entry indentation (kept consistent across appointments, funding, etc.)
+    INDENT_SUB = 0.18 * inch
+    INDENT_DETAIL = 0.18 * inch
+
+    # Reuse parsed paragraph fragments across identical cells (see _para)
+    use_frag_cache = True
+
+    # Smaller files (see pdf_size): streams without ASCII85, and with
+    # `object_streams` (needs pypdf) a final rewrite with object streams
+    optimize_size = False
+    object_streams = False
+
+    # Printed in the footer and the PDF title
+    footer_label = 'Curriculum Vitae'
+
+    # cv_document block role -> paragraph style (see document_story)
+    DOCUMENT_STYLES = {
+        'name': 'CVName',
+        'tagline': 'CVTagline',
+        'contact': 'ContactInfo',
+        'subsection': 'InstitutionHeading',
+        'category': 'CategoryHeading',
+        'body': 'CVBody',
+        'entry': 'CVEntry',
+        'small': 'CVSmall',
+        'publication': 'Publication',
+    }
+
+    # --- Palettes ------------------------------------------------------------
+    # Refined modern palette: deep navy primary, royal blue accent. Variants
+    # are added with register_palette() and only list the colours they change.
+    PALETTES = {
+        'default': {
+            'ink':     '#1a202c',
+            'primary': '#1e3a8a',
+            'accent':  '#2563eb',
+            'muted':   '#64748b',
+            'border':  '#e2e8f0',
+            'soft':    '#f8fafc',
+            'card':    '#eff6ff',
+        },
+    }
+
+    @classmethod
+    def register_palette(cls, name, **overrides):
+        """Register a variant of the default palette, e.g. register_palette('mono', accent='#000000')."""
+        unknown = set(overrides) - set(cls.PALETTES['default'])
+        if unknown:
+            raise ValueError(f"Unknown palette colours: {', '.join(sorted(unknown))}")
+        cls.PALETTES[name] = dict(cls.PALETTES['default'], **overrides)
+
+    def __init__(self, yaml_path, project_root, fonts=None, palette='default', activities_dir=None):
+        self.data = load_yaml(yaml_path, project_root)
+
+        self.project_root = project_root
+        self.activities = load_activities(project_root, activities_dir)
+
+        # Same aggregates the website reads from _data/derived.yml
+        self.stats = compute_derived(self.data, self.activities)
+        self.funding = self.stats['funding']
+        self.data = resolve_funding_tokens(self.data)
+
+        # Font names for each face; see pdf_fonts.register_font_family()
+        self.fonts = dict(DEFAULT_FONTS, **(fonts or {}))
+
+        self.palette_name = palette
+        self.palette = self._resolve_palette(palette)
+        self.styles = self._create_styles()
+        self.story = []
+        self.section_starts = []
+        self.page_offset = 0
+        # Entries in the featured-selection sections (see fit_to_pages)
+        self.counts = dict(DEFAULT_COUNTS)
+        # PublicationSet.query() filters for the publication lists
+        self.selection = {}
+        # False while section groups are rendered in parallel: numbers are
+        # stamped on after the groups are merged
+        self.number_pages = True
+
+        self.identity = AuthorIdentity.from_data(self.data)
+        # Loaded on first use, so runs that skip the publication sections never
+        # parse the bibliography
+        self._publications = None
+        # (sections, counts) and the Document last built from them
+        self._document = None
+
+    @property
+    def publications(self):
+        if self._publications is None:
+            self._publications = load_publications(self.project_root, self.identity)
+            if self._publications:
+                print(f"Loaded {len(self._publications)} publications from BibTeX file")
+        return self._publications
+
+    @publications.setter
+    def publications(self, value):
+        self._publications = value
+        self._document = None
+
+    # ------------------------------------------------------------------ styles
+    def _create_styles(self, palette_name=None):
+        """
+        Return the style sheet for a palette under this generator's fonts and geometry.
+
+        Sheets are built once per configuration and shared by every generator in
+        the process, so they must be treated as read-only. A registered variant
+        palette reuses the default sheet: only the styles whose colour changes
+        get a child style, the rest are the very same objects.
+        """
+        palette_name = palette_name or self.palette_name
+        key = self._style_key(palette_name)
+        styles = _STYLE_SHEETS.get(key)
+        if styles is None:
+            if palette_name == 'default':
+                styles = self._build_styles(self._resolve_palette('default'))
+            else:
+                styles = self._derive_styles(self._create_styles('default'), palette_name)
+            _STYLE_SHEETS[key] = styles
+        return styles
+
+    def _style_key(self, palette_name):
+        palette = self.PALETTES[palette_name]
+        return (
+            tuple(sorted(palette.items())),
+            tuple(sorted(self.fonts.items())),
+            self.INDENT_DETAIL,
+        )
+
+    def _resolve_palette(self, palette_name):
+        return {k: colors.HexColor(v) for k, v in self.PALETTES[palette_name].items()}
+
+    def _derive_styles(self, base, palette_name):
+        """Variant sheet over `base`: child styles only where a colour changed."""
+        base_palette = self.PALETTES['default']
+        palette = self.PALETTES[palette_name]
+        recolor = {
+            colors.HexColor(base_palette[k]).hexval(): colors.HexColor(v)
+            for k, v in palette.items() if base_palette.get(k) != v
+        }
+        aliases = {style.name: alias for alias, style in base.byAlias.items()}
+        styles = StyleSheet1()
+        for name, style in base.byName.items():
+            if isinstance(style, ParagraphStyle):
+                new_color = recolor.get(style.textColor.hexval())
+                if new_color is not None:
+                    style = ParagraphStyle(name=name, parent=style, textColor=new_color)
+            styles.add(style, alias=aliases.get(name))
+        return styles
+
+    def _build_styles(self, palette):
+        styles = getSampleStyleSheet()
+
+        styles.add(ParagraphStyle(
+            name='CVName', parent=styles['Normal'],
+            fontName=self.fonts['bold'], fontSize=22, leading=26,
+            textColor=palette['ink'], spaceAfter=2, alignment=TA_LEFT,
+        ))
+        styles.add(ParagraphStyle(
+            name='CVTagline', parent=styles['Normal'],
+            fontName=self.fonts['bold'], fontSize=11, leading=14,
+            textColor=palette['accent'], spaceAfter=2, alignment=TA_LEFT,
+        ))
+        styles.add(ParagraphStyle(
+            name='CVTitleMuted', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=9, leading=11,
+            textColor=palette['muted'], spaceAfter=0, alignment=TA_LEFT,
+        ))
+        styles.add(ParagraphStyle(
+            name='ContactInfo', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=8.5, leading=11,
+            textColor=palette['muted'], spaceAfter=1, alignment=TA_RIGHT,
+        ))
+
+        styles.add(ParagraphStyle(
+            name='SectionHeading', parent=styles['Normal'],
+            fontName=self.fonts['bold'], fontSize=10.5, leading=12,
+            textColor=palette['primary'], spaceBefore=0, spaceAfter=0,
+            alignment=TA_LEFT,
+        ))
+        styles.add(ParagraphStyle(
+            name='InstitutionHeading', parent=styles['Normal'],
+            fontName=self.fonts['bold'], fontSize=10, leading=12,
+            textColor=palette['primary'], spaceBefore=0, spaceAfter=0,
+            alignment=TA_LEFT, keepWithNext=1,
+        ))
+        styles.add(ParagraphStyle(
+            name='CategoryHeading', parent=styles['Normal'],
+            fontName=self.fonts['bold'], fontSize=9, leading=11,
+            textColor=palette['accent'], spaceBefore=0, spaceAfter=0,
+            alignment=TA_LEFT, keepWithNext=1,
+        ))
+
+        styles.add(ParagraphStyle(
+            name='CVBody', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=9.5, leading=12.5,
+            textColor=palette['ink'], spaceAfter=2, alignment=TA_JUSTIFY,
+        ))
+        styles.add(ParagraphStyle(
+            name='CVEntry', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=9.5, leading=12.5,
+            textColor=palette['ink'], spaceAfter=0, alignment=TA_LEFT,
+        ))
+        styles.add(ParagraphStyle(
+            name='CVSmall', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=8.5, leading=11,
+            textColor=palette['muted'], spaceAfter=0, alignment=TA_LEFT,
+        ))
+        styles.add(ParagraphStyle(
+            name='CVDetail', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=8.5, leading=11,
+            textColor=palette['muted'], spaceAfter=0, alignment=TA_LEFT,
+            leftIndent=self.INDENT_DETAIL,
+        ))
+
+        # Right-aligned column of entries (dates, amounts)
+        styles.add(ParagraphStyle(
+            name='EntryMetaMuted', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=8.5, leading=11,
+            textColor=palette['muted'], spaceAfter=0, alignment=TA_RIGHT,
+        ))
+
+        # Publication style — hanging indent so the number stays at left edge
+        styles.add(ParagraphStyle(
+            name='Publication', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=8.5, leading=11,
+            textColor=palette['ink'], spaceAfter=3, alignment=TA_JUSTIFY,
+            leftIndent=0.30 * inch, firstLineIndent=-0.30 * inch,
+        ))
+
+        # Metric (big number) and label
+        styles.add(ParagraphStyle(
+            name='MetricValue', parent=styles['Normal'],
+            fontName=self.fonts['bold'], fontSize=18, leading=20,
+            textColor=palette['primary'], spaceAfter=0, alignment=TA_CENTER,
+        ))
+        styles.add(ParagraphStyle(
+            name='MetricLabel', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=7.5, leading=9,
+            textColor=palette['muted'], spaceAfter=0, alignment=TA_CENTER,
+        ))
+
+        # Highlight card body
+        styles.add(ParagraphStyle(
+            name='HighlightBody', parent=styles['Normal'],
+            fontName=self.fonts['regular'], fontSize=9, leading=12,
+            textColor=palette['ink'], spaceAfter=0, alignment=TA_JUSTIFY,
+        ))
+
+        return styles
+
+    # ------------------------------------------------------------------ layout
+    def _para(self, markup, style_name, shared=True):
+        """
+        Paragraph in a named style, reusing parsed fragments for repeated markup.
+        Pass shared=False for markup that never repeats (numbered citations), so
+        it does not crowd the fragment cache.
+        """
+        style = self.styles[style_name]
+        if not (self.use_frag_cache and shared):
+            return Paragraph(markup, style)
+        return Paragraph(markup, style, frags=parse_paragraph(markup, style))
+
+    def _section_flowables(self, title):
+        """Modern section header: thick left accent bar + uppercase title + hairline rule."""
+        title_para = self._para(title.upper(), 'SectionHeading')
+        tbl = Table([[title_para]], colWidths=[self.CONTENT_WIDTH])
+        tbl.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('LINEBEFORE', (0, 0), (0, -1), 3, self.palette['primary']),
+            ('LINEBELOW', (0, 0), (-1, -1), 0.5, self.palette['border']),
+        ]))
+        return [Spacer(1, self.SPACE_SECTION), tbl, Spacer(1, self.SPACE_ITEM + 0.02 * inch)]
+
+    def _two_col_row(self, left, right=None, left_indent=0):
+        """
+        Two-column row aligned across the document.
+
+        The row is always CONTENT_WIDTH wide and the right column is always
+        RIGHT_COL_WIDTH wide. Indentation only shifts the left column, so the
+        right edge (and date column) lines up with every other row.
+        """
+        return ColumnRow(
+            left, right,
+            left_width=self.LEFT_COL_WIDTH,
+            right_width=self.RIGHT_COL_WIDTH,
+            left_indent=left_indent,
+        )
+
+    def _full_width_row(self, content, left_indent=0):
+        """Full-width single-column row with optional left indent (no right column)."""
+        return ColumnRow(content, left_width=self.CONTENT_WIDTH, left_indent=left_indent)
+
+    def _highlight_card(self, paragraphs):
+        """Soft-tinted card with an accent left bar — for executive summary highlights."""
+        cell = paragraphs if isinstance(paragraphs, list) else [paragraphs]
+        tbl = Table([[cell]], colWidths=[self.CONTENT_WIDTH])
+        tbl.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('BACKGROUND', (0, 0), (-1, -1), self.palette['card']),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('LINEBEFORE', (0, 0), (0, -1), 3, self.palette['accent']),
+        ]))
+        return tbl
+
+    # ---------------------------------------------------------------- document
+    def _run_markup(self, run):
+        markup = escape(run.text)
+        if run.tone is not None:
+            markup = f'<font color="{self.PALETTES[self.palette_name][run.tone]}">{markup}</font>'
+        if run.italic:
+            markup = f"<i>{markup}</i>"
+        if run.bold:
+            markup = f"<b>{markup}</b>"
+        return markup
+
+    def _block_para(self, block, style_name=None):
+        """Paragraph of a block's runs, in its role's style unless `style_name` is given."""
+        markup = ''.join(self._run_markup(run) for run in block.runs)
+        # Numbered citations never repeat
+        return self._para(markup, style_name or self.DOCUMENT_STYLES[block.role],
+                          shared=block.role != 'publication')
+
+    def _right_column(self, block, style_name):
+        """One right-aligned paragraph per run of the block's right-hand column."""
+        return [self._para(self._run_markup(run), style_name) for run in block.right]
+
+    @staticmethod
+    def _block_groups(blocks):
+        """
+        A section's blocks in layout units: an entry with the 'small' detail
+        lines after it, a run of metrics, or any other single block.
+        """
+        group = []
+        for block in blocks:
+            if group and (block.role == 'small' and group[0].role == 'entry'
+                          or block.role == 'metric' and group[0].role == 'metric'):
+                group.append(block)
+                continue
+            if group:
+                yield group
+            group = [block]
+        if group:
+            yield group
+
+    def _section_entries(self, section):
+        """
+        Flowables of one Document section, a layout unit at a time (see
+        _block_groups), so chunked builds can make the publication list's
+        flowables as they go.
+        """
+        if section.key == 'header':
+            yield self._header_flowables(section.blocks)
+            return
+        if section.title:
+            yield self._section_flowables(section.title)
+        first = True
+        for group in self._block_groups(section.blocks):
+            yield self._group_flowables(group, first)
+            first = False
+
+    def _group_flowables(self, group, first):
+        block = group[0]
+        if block.role == 'metric':
+            return self._metrics_flowables(group)
+        if block.role == 'entry':
+            # Entries with detail lines, and top-level ones, get more air than
+            # the one-line items of a category
+            gap = self.SPACE_ITEM if len(group) > 1 or not block.indent else self.SPACE_DETAIL
+            return [self._entry_row(block, group[1:]), Spacer(1, gap)]
+        if block.rule == 'divider':
+            return [HRFlowable(
+                width='100%', thickness=0.4, color=self.palette['border'],
+                spaceBefore=self.SPACE_ITEM, spaceAfter=self.SPACE_ITEM,
+            )]
+        if block.role in ('category', 'subsection'):
+            flowables = [] if first else [Spacer(1, self.SPACE_SUBSECTION)]
+            if block.role == 'category':
+                return flowables + [self._block_para(block), Spacer(1, 0.03 * inch)]
+            return flowables + [self._full_width_row(self._block_para(block)), Spacer(1, 0.02 * inch)]
+        if block.rule == 'callout':
+            return [self._highlight_card(self._block_para(block, 'HighlightBody')),
+                    Spacer(1, self.SPACE_ITEM)]
+        para = self._block_para(block)
+        if block.rule == 'below':
+            return [para, HRFlowable(
+                width='100%', thickness=1.2, color=self.palette['primary'],
+                spaceBefore=2, spaceAfter=self.SPACE_SUBSECTION,
+            )]
+        if block.role == 'body':
+            return [para, Spacer(1, self.SPACE_ITEM)]
+        return [para]
+
+    def _entry_row(self, block, details):
+        """Two-column row of an entry: its runs and detail lines left, its right-hand column right."""
+        left = [self._block_para(block)] + [self._block_para(detail) for detail in details]
+        indent = self.INDENT_SUB * block.indent
+        if block.right:
+            return self._two_col_row(left, self._right_column(block, 'EntryMetaMuted'), left_indent=indent)
+        return self._full_width_row(left, left_indent=indent)
+
+    def _header_flowables(self, blocks):
+        """Name and tagline on the left, the contact lines on the right."""
+        left, right = [], []
+        for block in blocks:
+            if block.role != 'contact':
+                left.append(self._block_para(block))
+                continue
+            if block.runs:
+                right.append(self._block_para(block))
+            right.extend(self._right_column(block, 'ContactInfo'))
+
+        header = Table(
+            [[left or [Spacer(1, 0)], right or [Spacer(1, 0)]]],
+            colWidths=[self.HEADER_LEFT_WIDTH, self.HEADER_RIGHT_WIDTH],
+        )
+        style = [
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ]
+        if any(block.rule == 'below' for block in blocks):
+            style.append(('LINEBELOW', (0, 0), (-1, -1), 1.8, self.palette['primary']))
+        header.setStyle(TableStyle(style))
+        return [header, Spacer(1, self.SPACE_SUBSECTION)]
+
+    def _metrics_flowables(self, blocks):
+        """KPI strip: one column per metric block, the value over its label."""
+        row_cells = []
+        for block in blocks:
+            value, *label = block.runs
+            row_cells.append([
+                self._para(escape(value.text), 'MetricValue'),
+                Spacer(1, 1),
+                self._para(escape(''.join(run.text for run in label).strip().upper()), 'MetricLabel'),
+            ])
+
+        col_width = self.CONTENT_WIDTH / len(blocks)
+        tbl = Table([row_cells], colWidths=[col_width] * len(blocks))
+        style = [
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 4),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+            ('BACKGROUND', (0, 0), (-1, -1), self.palette['soft']),
+            ('BOX', (0, 0), (-1, -1), 0.4, self.palette['border']),
+        ]
+        # Hairline dividers between metric columns
+        for i in range(1, len(blocks)):
+            style.append(('LINEBEFORE', (i, 0), (i, -1), 0.4, self.palette['border']))
+        tbl.setStyle(TableStyle(style))
+        return [tbl, Spacer(1, self.SPACE_ITEM + 0.02 * inch)]
+
+    # ----------------------------------------------------------- page footer
+    def _footer_texts(self):
+        """(left, centre) footer strings; the page number is drawn separately."""
+        name = self.data.get('personal', {}).get('name', '')
+        suffix = self.data.get('personal', {}).get('title', '')
+        full = f"{name}, {suffix}" if suffix else name
+        updated = f"{self.footer_label} · {build_datetime():%B %Y}"
+        return full, updated
+
+    def _draw_footer(self, canvas, _doc):
+        canvas.saveState()
+        # Hairline above footer
+        canvas.setStrokeColor(self.palette['border'])
+        canvas.setLineWidth(0.4)
+        canvas.line(
+            self.MARGIN_X, 0.55 * inch,
+            self.PAGE_WIDTH - self.MARGIN_X, 0.55 * inch,
+        )
+        # Name left, page number right
+        canvas.setFont(self.fonts['regular'], 8)
+        canvas.setFillColor(self.palette['muted'])
+        full, updated = self._footer_texts()
+        canvas.drawString(self.MARGIN_X, 0.38 * inch, full)
+        # Center: updated date
+        canvas.drawCentredString(self.PAGE_WIDTH / 2, 0.38 * inch, updated)
+        # Page number (offset when this build continues an earlier one)
+        if self.number_pages:
+            self._draw_page_number(canvas, canvas.getPageNumber() + self.page_offset)
+        canvas.restoreState()
+
+    def _draw_page_number(self, canvas, page_num):
+        canvas.setFont(self.fonts['bold'], 8)
+        canvas.setFillColor(self.palette['primary'])
+        canvas.drawRightString(
+            self.PAGE_WIDTH - self.MARGIN_X, 0.38 * inch,
+            f"Page {page_num}",
+        )
+
+    # ------------------------------------------------------------------ build
+    def _doc_template(self, output_path, story_offset=0):
+        return TrackingDocTemplate(
+            output_path,
+            story_offset=story_offset,
+            pagesize=letter,
+            leftMargin=self.MARGIN_X,
+            rightMargin=self.MARGIN_X,
+            topMargin=self.MARGIN_TOP,
+            bottomMargin=self.MARGIN_BOTTOM,
+            title=f"{self.footer_label} — {self.data.get('personal', {}).get('name', '')}",
+            author=self.data.get('personal', {}).get('name', ''),
+            invariant=is_reproducible(),
+        )
+
+    # Independent layout problems: the publication record starts on a fresh
+    # page, so it lays out the same whatever comes before it
+    SECTION_GROUPS = ('front', 'publications')
+
+    # Document sections that start a fresh page, and those the PDF leaves out
+    # (the page footer already prints the date)
+    NEW_PAGE_SECTIONS = ('publications',)
+    OMITTED_SECTIONS = ('footer',)
+
+    def document(self, sections=None):
+        """
+        The cv_document.Document of this generator's inputs, self.counts and
+        self.selection: every section, or only the SECTION_KEYS in `sections`.
+        The last one built is kept, so the other formats of a run can share it.
+        """
+        key = (
+            None if sections is None else tuple(sections),
+            tuple(sorted(self.counts.items())), tuple(sorted(self.selection.items())),
+        )
+        if self._document is None or self._document[0] != key:
+            publications = self.publications if needs_publications(sections) else PublicationSet([])
+            self._document = key, build_document(
+                self.data, self.activities, publications, self.funding, sections, self.counts,
+                self.selection,
+            )
+        return self._document[1]
+
+    def document_story(self, document):
+        """
+        Lay out a cv_document.Document (the CV, or e.g. a Current & Pending
+        report) into self.story, noting where each section starts in
+        self.section_starts.
+        """
+        self.story = []
+        self.section_starts = []
+        for section in document.sections:
+            if section.key in self.OMITTED_SECTIONS:
+                continue
+            self.section_starts.append((section.key, len(self.story)))
+            if self.story and section.key in self.NEW_PAGE_SECTIONS:
+                self.story.append(PageBreak())
+            for flowables in self._section_entries(section):
+                self.story.extend(flowables)
+        return self.story
+
+    def _group_story(self, group):
+        """Story of one SECTION_GROUPS entry, laid out on its own."""
+        in_group = [key for key in SECTION_KEYS if (key == 'publications') == (group == 'publications')]
+        return self.document_story(self.document(in_group))
+
+    def _publication_entries(self):
+        """
+        Flowables of the complete publication list, one entry (section
+        heading, year heading or citation) at a time. Chunked builds hold the
+        list's blocks, which are small, but never all of its flowables.
+        """
+        for section in self.document(['publications']).sections:
+            if section.key == 'publications':
+                yield from self._section_entries(section)
+
+    def build_story(self, sections=None):
+        """
+        Lay out the CV into self.story (flowables only, no PDF yet): all
+        sections, or only the cv_document.SECTION_KEYS named in `sections`.
+        """
+        if sections is not None:
+            unknown = set(sections) - set(SECTION_KEYS)
+            if unknown:
+                raise ValueError(f"Unknown CV sections: {', '.join(sorted(unknown))}")
+        print("Building CV sections...")
+        return self.document_story(self.document(sections))
+
+    # Selections that fit_to_pages() grows, highest priority first
+    FIT_ORDER = ('selected_publications', 'major_funding')
+
+    def _count_limits(self):
+        """Largest useful value of each self.counts entry."""
+        funding = self.data.get('funding', {}) or {}
+        return {
+            'selected_publications': len(self.publications.query(**self.selection)),
+            'major_funding': sum(len(funding.get(key, []) or []) for key in FUNDING_CATEGORIES),
+        }
+
+    def height_model(self):
+        """HeightModel of this generator's frame (SimpleDocTemplate pads it 6pt a side)."""
+        padding = 12
+        return HeightModel(
+            self.CONTENT_WIDTH - padding,
+            self.PAGE_HEIGHT - self.MARGIN_TOP - self.MARGIN_BOTTOM - padding,
+        )
+
+    def fit_to_pages(self, pages, sections=None, model=None):
+        """
+        Set self.counts to the largest selections that keep the CV (or only
+        `sections`) within `pages` pages; return the estimated page count.
+
+        The counts in FIT_ORDER are binary-searched one after the other, the
+        rest held where they are. Each trial builds the story and estimates
+        its pages with a HeightModel instead of running doc.build. Trials
+        share most flowables, so after the first one only the entries a trial
+        adds are wrapped, and the whole search costs about one render.
+        """
+        model = model or self.height_model()
+        limits = self._count_limits()
+        self.counts = {key: min(count, limits[key]) for key, count in DEFAULT_COUNTS.items()}
+
+        def estimate():
+            self.story = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.build_story(sections)
+            return model.pages(self.story)
+
+        for key in self.FIT_ORDER:
+            if sections is not None and key not in sections:
+                continue
+            lo, hi = 0, limits[key]
+            while lo < hi:
+                self.counts[key] = mid = (lo + hi + 1) // 2
+                if estimate() <= pages:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            self.counts[key] = lo
+        estimated = estimate()
+        self.story = []
+        return estimated
+
+    def _build_fitted(self, output_path, pages, sections=None):
+        """Single-pass build with the selections fitted to `pages` pages."""
+        estimated = self.fit_to_pages(pages, sections)
+        fitted = [key for key in self.FIT_ORDER if sections is None or key in sections]
+        print(f"Fitted to {pages} page(s) (estimated {estimated}): " + ', '.join(
+            f"{key.replace('_', ' ')} {self.counts[key]}" for key in fitted
+        ))
+        while True:
+            self.story = []
+            self.build_story(sections)
+            doc = self._doc_template(output_path)
+            self.build(doc)
+            if doc.page <= pages:
+                return
+            # The estimate fell short: give up one entry of the lowest-priority
+            # selection that still has any
+            key = next((k for k in reversed(fitted) if self.counts[k] > 0), None)
+            if key is None:
+                print(f"Warning: {doc.page} pages even without featured entries; "
+                      f"cannot fit {pages}.")
+                return
+            self.counts[key] -= 1
+            print(f"  laid out {doc.page} pages; retrying with {key.replace('_', ' ')} {self.counts[key]}")
+
+    def _section_hashes(self):
+        """[name, story start, content digest] for each section of the built story."""
+        bounds = [start for _, start in self.section_starts[1:]] + [len(self.story)]
+        return [
+            [name, start, digest(flowable_fingerprint(self.story[start:end]))]
+            for (name, start), end in zip(self.section_starts, bounds)
+        ]
+
+    # Modules on the PDF render path: a change to any of them may change the
+    # pages, so they are part of the layout cache key
+    LAYOUT_SOURCES = (
+        'cv_pdf.py', 'pdf_flowables.py', 'pdf_pages.py', 'pdf_fonts.py', 'pdf_size.py',
+        'cv_data.py', 'cv_document.py', 'derive_stats.py', 'funding_utils.py',
+        'publications.py', 'author_identity.py', 'reproducible.py',
+    )
+
+    def _layout_key(self):
+        """Everything outside the story that affects how pages look or are encoded."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        sources = source_digest(*(os.path.join(here, name) for name in self.LAYOUT_SOURCES))
+        return digest(
+            sources, reportlab.Version,
+            sorted(self.fonts.items()), sorted(font_digests(self.fonts).items()),
+            sorted(self.PALETTES[self.palette_name].items()),
+            self._footer_texts(), self.optimize_size,
+        )
+
+    def build(self, doc):
+        """Render the already-built story into `doc`."""
+        print("Generating PDF...")
+        self._render(doc)
+
+    def _render(self, doc):
+        with compact_streams(self.optimize_size):
+            doc.build(
+                self.story,
+                onFirstPage=self._draw_footer,
+                onLaterPages=self._draw_footer,
+            )
+
+    def _compact(self, output):
+        """Rewrite the finished PDF at `output` (a path or BytesIO) with object streams."""
+        if not (self.object_streams and PYPDF_AVAILABLE):
+            return
+        if isinstance(output, io.BytesIO):
+            data = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            compact_pdf(io.BytesIO(data), output)
+            return
+        before = os.path.getsize(output)
+        after = compact_pdf(output, output)
+        print(f"Packed into object streams: {before / 1024:.1f} KB -> {after / 1024:.1f} KB")
+
+    def generate(self, output_path, layout_cache=False, chunk_size=None, parallel=False, sections=None,
+                 pages=None):
+        """
+        Build the PDF. With `layout_cache`, reuse the pages of the previous build
+        that precede the first changed section (see pdf_pages.LayoutCache). With
+        `chunk_size`, lay out the publication list in batches of that many
+        entries (see _build_chunked). With `parallel`, lay out the section
+        groups in separate processes (see _build_parallel). With `sections`,
+        build only those sections, in a single pass. With `pages`, feature as
+        many selected publications and funded programs as fit in that many
+        pages (see fit_to_pages), in a single pass. `optimize_size` and
+        `object_streams` apply to every kind of build.
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        self._build_pdf(output_path, layout_cache, chunk_size, parallel, sections, pages)
+        self._compact(output_path)
+        print(f"✓ PDF CV generated: {output_path}")
+
+    def _build_pdf(self, output_path, layout_cache, chunk_size, parallel, sections, pages):
+        if pages is not None:
+            self._build_fitted(output_path, pages, sections)
+            return
+
+        if sections is not None:
+            self.build_story(sections)
+            self.build(self._doc_template(output_path))
+            return
+
+        if (layout_cache or chunk_size or parallel) and not PYPDF_AVAILABLE:
+            print("Warning: pypdf not installed. Building the PDF in a single pass.")
+            layout_cache = chunk_size = parallel = None
+        if parallel and 'fork' not in multiprocessing.get_all_start_methods():
+            print("Warning: worker processes need fork(). Building the PDF in a single pass.")
+            parallel = False
+        if parallel:
+            if layout_cache or chunk_size:
+                print("Note: parallel builds lay out every group in full.")
+            self._build_parallel(output_path)
+        elif chunk_size:
+            if layout_cache:
+                print("Note: the layout cache is not used for chunked builds.")
+            self._build_chunked(output_path, chunk_size)
+        elif layout_cache:
+            self.build_story()
+            self._build_with_layout_cache(output_path)
+        else:
+            self.build_story()
+            self.build(self._doc_template(output_path))
+
+    def generate_document(self, document, output_path):
+        """Write a cv_document.Document (e.g. a Current & Pending report) as a PDF."""
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        self.document_story(document)
+        self.build(self._doc_template(output_path))
+        self._compact(output_path)
+        print(f"✓ PDF generated: {output_path}")
+
+    def render_bytes(self, sections=None):
+        """
+        Build the PDF in one pass into memory and return its bytes. The loaded
+        data, style sheets and paragraph fragment cache are kept, so a
+        long-lived generator can be asked again (see cv_daemon.py).
+        """
+        self.story = []
+        self.page_offset = 0
+        self.number_pages = True
+        self.build_story(sections)
+        buffer = io.BytesIO()
+        self.build(self._doc_template(buffer))
+        self._compact(buffer)
+        return buffer.getvalue()
+
+    def _build_chunked(self, output_path, chunk_size):
+        """
+        Build the PDF holding at most about `chunk_size` publication entries in
+        memory at a time.
+
+        The sections before the publication list are built first; the list then
+        starts on a fresh page, as in a single-pass build. Each batch is laid
+        out into its own temporary PDF, whose pages are kept up to its last
+        clean page start (see TrackingDocTemplate). The flowables from there on
+        are carried into the next batch, so every page comes out as it would
+        in one pass. Page numbers continue through `page_offset`. The kept
+        page ranges are stitched together at the end.
+        """
+        print("Building CV sections (publications in batches)...")
+        with tempfile.TemporaryDirectory() as tmp:
+            self._group_story('front')
+            path = os.path.join(tmp, 'front.pdf')
+            doc = self._doc_template(path)
+            print("Generating PDF...")
+            self._render(doc)
+            parts = [(path, 0, None)]
+            pages = doc.page
+
+            entries = self._publication_entries()
+            pending = []
+            try:
+                while True:
+                    batch = list(islice(entries, chunk_size))
+                    final = len(batch) < chunk_size
+                    for entry in batch:
+                        pending.extend(entry)
+                    del batch
+                    if not pending:
+                        break
+                    path = os.path.join(tmp, f"chunk{len(parts)}.pdf")
+                    doc = self._doc_template(path)
+                    self.story = list(pending)
+                    self.page_offset = pages
+                    self._render(doc)
+                    if final:
+                        parts.append((path, 0, None))
+                        pages += doc.page
+                        break
+                    restart = max((p for p in doc.page_starts if p > 1), default=None)
+                    if restart is None:
+                        # No page is complete yet: carry the whole batch over
+                        continue
+                    parts.append((path, 0, restart - 1))
+                    pages += restart - 1
+                    pending = pending[doc.page_starts[restart]:]
+            finally:
+                self.page_offset = 0
+                self.story = []
+            print(f"Laid out {pages} pages in {len(parts)} parts")
+            stitch_pdfs(parts, output_path)
+
+    def _build_parallel(self, output_path):
+        """
+        Lay out each of SECTION_GROUPS in its own forked worker process and merge
+        the partial PDFs.
+
+        A group cannot know how many pages precede it until the others finish,
+        so workers draw the footer without page numbers and the numbers are
+        stamped onto the merged pages.
+        """
+        global _PARALLEL_GENERATOR
+        print("Building CV section groups in parallel...")
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, f"{group}.pdf") for group in self.SECTION_GROUPS]
+            _PARALLEL_GENERATOR = self
+            self.number_pages = False
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=len(paths), mp_context=multiprocessing.get_context('fork'),
+                ) as pool:
+                    pages = list(pool.map(_render_section_group, self.SECTION_GROUPS, paths))
+            finally:
+                _PARALLEL_GENERATOR = None
+                self.number_pages = True
+            merged = io.BytesIO()
+            stitch_pdfs([(path, 0, None) for path, n in zip(paths, pages) if n], merged)
+            stamp_pages(merged, output_path, self._draw_page_number)
+        print(f"Laid out {sum(pages)} pages in {len(paths)} worker processes")
+
+    def _build_with_layout_cache(self, output_path):
+        sections = self._section_hashes()
+        cache = LayoutCache(self.project_root, self._layout_key())
+        meta = cache.load()
+        restart = LayoutCache.restart_point(meta, sections)
+
+        if restart == ('all', None):
+            shutil.copyfile(cache.pdf_path, output_path)
+            print("Layout unchanged: reused all cached pages")
+            return
+
+        if restart is None:
+            doc = self._doc_template(output_path)
+            self.build(doc)
+            page_starts = doc.page_starts
+        else:
+            page, index = restart
+            partial = io.BytesIO()
+            doc = self._doc_template(partial, story_offset=index)
+            self.story = self.story[index:]
+            self.page_offset = page - 1
+            try:
+                self.build(doc)
+            finally:
+                self.page_offset = 0
+            stitch_pdfs([(cache.pdf_path, 0, page - 1), (partial, 0, None)], output_path)
+            page_starts = {p: i for p, i in meta['page_starts'].items() if p < page}
+            page_starts.update({p + page - 1: i for p, i in doc.page_starts.items()})
+            print(f"Reused {page - 1} cached pages; laid out from page {page}")
+        cache.store(sections, page_starts, output_path)
+
+
+# Generator inherited by the forked workers of CVGenerator._build_parallel
+_PARALLEL_GENERATOR = None
+
+
+def _render_section_group(group, path):
+    """Worker: lay out one section group of the inherited generator into `path`."""
+    gen = _PARALLEL_GENERATOR
+    if not gen._group_story(group):
+        return 0
+    doc = gen._doc_template(path)
+    gen._render(doc)
+    return doc.page
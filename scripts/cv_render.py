@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Text backends for the CV Document (see cv_document.py): HTML, Markdown and
+LaTeX.
+
+Each backend maps block roles and run formatting onto its own markup. The
+Document is built once per run, so adding formats only adds these cheap walks.
+
+Usage:
+    python scripts/cv_render.py [html|md|tex ...] [--output-dir files/cv]
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+from itertools import groupby
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cv_document import inline_runs, load_document  # noqa: E402
+
+# Same colours as the PDF/DOCX palettes
+TONES = {
+    'ink': '1a202c',
+    'primary': '1e3a8a',
+    'accent': '2563eb',
+    'muted': '64748b',
+}
+
+
+def _split_space(text):
+    """(leading whitespace, core, trailing whitespace) of a run's text."""
+    core = text.strip()
+    if not core:
+        return text, '', ''
+    start = text.index(core)
+    return text[:start], core, text[start + len(core):]
+
+
+# ----------------------------------------------------------------------------
+# HTML
+# ----------------------------------------------------------------------------
+
+HTML_TAGS = {
+    'name': 'h1',
+    'tagline': 'p',
+    'contact': 'p',
+    'subsection': 'h3',
+    'category': 'h4',
+    'body': 'p',
+    'entry': 'p',
+    'metric': 'p',
+    'small': 'p',
+    'publication': 'p',
+}
+
+HTML_STYLE = f"""
+body {{ font-family: Calibri, Helvetica, Arial, sans-serif; font-size: 10pt; color: #{TONES['ink']};
+       max-width: 8in; margin: 0.65in auto; line-height: 1.35; }}
+h1 {{ font-size: 22pt; margin: 0; }}
+h2 {{ font-size: 11pt; text-transform: uppercase; color: #{TONES['primary']};
+     border-bottom: 1px solid #{TONES['primary']}; margin: 14pt 0 4pt; }}
+h3 {{ font-size: 10pt; color: #{TONES['primary']}; margin: 6pt 0 0; }}
+h4 {{ font-size: 9.5pt; color: #{TONES['accent']}; margin: 4pt 0 2pt; }}
+p {{ margin: 0; }}
+.tagline {{ font-size: 11pt; font-weight: bold; color: #{TONES['accent']}; }}
+.contact, .small {{ font-size: 9pt; color: #{TONES['muted']}; }}
+.contact.rule {{ border-bottom: 2px solid #{TONES['primary']}; padding-bottom: 4pt; }}
+.callout {{ border-left: 3px solid #{TONES['accent']}; padding-left: 8pt; margin: 4pt 0; }}
+.indent {{ padding-left: 0.18in; }}
+.publication {{ font-size: 9pt; padding-left: 0.25in; text-indent: -0.25in; margin-bottom: 2pt; }}
+.tone-primary {{ color: #{TONES['primary']}; }}
+.tone-accent {{ color: #{TONES['accent']}; }}
+.tone-muted {{ color: #{TONES['muted']}; }}
+hr {{ border: 0; border-top: 1px solid #e2e8f0; }}
+"""
+
+
+def _html_run(run):
+    text = html.escape(run.text)
+    if run.tone:
+        text = f'<span class="tone-{run.tone}">{text}</span>'
+    if run.italic:
+        text = f'<em>{text}</em>'
+    if run.bold:
+        text = f'<strong>{text}</strong>'
+    return text
+
+
+def render_html(document):
+    out = [
+        '<!DOCTYPE html>',
+        '<html lang="en">',
+        '<head>',
+        '<meta charset="utf-8">',
+        f'<title>{html.escape(document.title)}</title>',
+        f'<style>{HTML_STYLE}</style>',
+        '</head>',
+        '<body>',
+    ]
+    for section in document.sections:
+        out.append(f'<section class="{section.key}">')
+        if section.title:
+            out.append(f'<h2>{html.escape(section.title)}</h2>')
+        for block in section.blocks:
+            if block.rule == 'divider':
+                out.append('<hr>')
+                continue
+            tag = HTML_TAGS[block.role]
+            classes = [block.role]
+            if block.rule == 'below':
+                classes.append('rule')
+            elif block.rule == 'callout':
+                classes.append('callout')
+            if block.indent:
+                classes.append('indent')
+            body = ''.join(_html_run(r) for r in inline_runs(block))
+            out.append(f'<{tag} class="{" ".join(classes)}">{body}</{tag}>')
+        out.append('</section>')
+    out += ['</body>', '</html>', '']
+    return '\n'.join(out)
+
+
+# ----------------------------------------------------------------------------
+# Markdown
+# ----------------------------------------------------------------------------
+
+MARKDOWN_HEADINGS = {'name': '# ', 'subsection': '### ', 'category': '#### '}
+
+_MD_SPECIAL = re.compile(r'([\\`*_\[\]<>|])')
+
+
+def _md_escape(text):
+    return _MD_SPECIAL.sub(r'\\\1', text)
+
+
+def _md_runs(runs, plain=False):
+    """Markdown for a block's runs; neighbours with the same emphasis share markers."""
+    if plain:
+        return ''.join(_md_escape(r.text) for r in runs)
+    return ''.join(
+        _md_emphasis(''.join(_md_escape(r.text) for r in group), bold, italic)
+        for (bold, italic), group in groupby(runs, key=lambda r: (bool(r.bold), bool(r.italic)))
+    )
+
+
+def _md_emphasis(text, bold, italic):
+    if not (bold or italic):
+        return text
+    lead, core, trail = _split_space(text)
+    if not core:
+        return text
+    marker = ('**' if bold else '') + ('*' if italic else '')
+    return f"{lead}{marker}{core}{marker[::-1]}{trail}"
+
+
+def render_markdown(document):
+    out = []
+    for section in document.sections:
+        if section.title:
+            out.append(f"## {_md_escape(section.title)}")
+        for block in section.blocks:
+            if block.rule == 'divider':
+                out.append('---')
+                continue
+            heading = MARKDOWN_HEADINGS.get(block.role)
+            text = _md_runs(inline_runs(block), plain=heading is not None).strip()
+            if not text:
+                continue
+            if heading:
+                out.append(heading + text)
+            elif block.role == 'tagline':
+                out.append(f"**{text}**")
+            elif block.role == 'small':
+                out.append(f"<small>{text}</small>")
+            elif block.rule == 'callout':
+                out.append(f"> {text}")
+            else:
+                out.append(text)
+            if block.rule == 'below':
+                out.append('---')
+    return '\n\n'.join(out) + '\n'
+
+
+# ----------------------------------------------------------------------------
+# LaTeX
+# ----------------------------------------------------------------------------
+
+_TEX_SPECIAL = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+    # Symbols pdflatex's utf8 input encoding does not know
+    '•': r'\textbullet{}',
+    '▸': r'\textbullet{}',
+    '·': r'\textperiodcentered{}',
+    '\u00a0': '~',
+    '—': '---',
+    '–': '--',
+}
+_TEX_PATTERN = re.compile('|'.join(re.escape(c) for c in _TEX_SPECIAL))
+
+
+def _tex_escape(text):
+    return _TEX_PATTERN.sub(lambda m: _TEX_SPECIAL[m.group()], text)
+
+
+def _tex_run(run):
+    text = _tex_escape(run.text)
+    if run.tone:
+        text = rf'\textcolor{{{run.tone}}}{{{text}}}'
+    if run.italic:
+        text = rf'\textit{{{text}}}'
+    elif run.italic is False:
+        text = rf'\textup{{{text}}}'
+    if run.bold:
+        text = rf'\textbf{{{text}}}'
+    elif run.bold is False:
+        text = rf'\textmd{{{text}}}'
+    return text
+
+
+TEX_BLOCKS = {
+    'name': r'{\LARGE\bfseries %s\par}',
+    'tagline': r'{\large\bfseries\color{accent} %s\par}',
+    'contact': r'{\small\color{muted} %s\par}',
+    'subsection': r'\subsection*{%s}',
+    'category': r'\subsubsection*{%s}',
+    'body': r'%s\par',
+    'entry': r'%s\par',
+    'metric': r'%s\par',
+    'small': r'{\small\color{muted} %s\par}',
+    'publication': r'{\small\hangindent=0.25in\hangafter=1 %s\par}',
+}
+
+TEX_PREAMBLE = r"""\documentclass[10pt]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[T1]{fontenc}
+\usepackage[margin=0.7in,top=0.65in,bottom=0.8in]{geometry}
+\usepackage{xcolor}
+\usepackage{titlesec}
+%(colors)s
+\titleformat{\section}{\color{primary}\normalsize\bfseries\MakeUppercase}{}{0pt}{}[\titlerule]
+\titleformat{\subsection}{\color{primary}\normalsize\bfseries}{}{0pt}{}
+\titleformat{\subsubsection}{\color{accent}\small\bfseries}{}{0pt}{}
+\setlength{\parindent}{0pt}
+\setlength{\parskip}{2pt}
+\pagestyle{plain}
+"""
+
+
+def render_latex(document):
+    colors = '\n'.join(rf'\definecolor{{{name}}}{{HTML}}{{{value.upper()}}}' for name, value in TONES.items())
+    out = [TEX_PREAMBLE % {'colors': colors}, r'\begin{document}', r'\color{ink}', '']
+    for section in document.sections:
+        if section.title:
+            out.append(rf'\section*{{{_tex_escape(section.title)}}}')
+        for block in section.blocks:
+            if block.rule == 'divider':
+                out.append(r'\noindent{\color{muted!30}\rule{\linewidth}{0.4pt}}')
+                continue
+            body = ''.join(_tex_run(r) for r in inline_runs(block))
+            line = TEX_BLOCKS[block.role] % body
+            if block.rule == 'callout':
+                line = (r'\noindent{\color{accent}\vrule width 2pt}\hspace{6pt}'
+                        r'\parbox[t]{\dimexpr\linewidth-8pt}{' + body + '}\par')
+            out.append(line)
+            if block.rule == 'below':
+                out.append(r'{\color{primary}\hrule height 1pt}\medskip')
+        out.append('')
+    out += [r'\end{document}', '']
+    return '\n'.join(out)
+
+
+# format -> (renderer, file extension)
+RENDERERS = {
+    'html': (render_html, '.html'),
+    'md': (render_markdown, '.md'),
+    'tex': (render_latex, '.tex'),
+}
+
+
+def write_document(document, fmt, output_base):
+    """Render `document` as `fmt` to `output_base` + the format's extension."""
+    renderer, ext = RENDERERS[fmt]
+    path = output_base + ext
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(renderer(document))
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the CV as HTML, Markdown or LaTeX.')
+    parser.add_argument('formats', nargs='*', metavar='FORMAT',
+                        help=f"one or more of {', '.join(sorted(RENDERERS))} (default: all)")
+    parser.add_argument('--output-dir', help='directory for the exported files (default: files/cv)')
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.formats) - set(RENDERERS))
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(unknown)}")
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    output_dir = args.output_dir or os.path.join(project_root, 'files', 'cv')
+    document = load_document(os.path.join(project_root, '_data', 'rafael.yml'), project_root)
+    for fmt in args.formats or sorted(RENDERERS):
+        path = write_document(document, fmt, os.path.join(output_dir, 'RafaelFerreiraDaSilva-cv'))
+        print(f"✓ {fmt.upper()} CV generated: {path}")
+
+
+if __name__ == '__main__':
+    main()
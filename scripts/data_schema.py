@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Declarative schemas for the YAML files under _data/, and a validator that runs
+before the CV is rendered.
+
+Without it, a typo renders silently wrong: a conference without `entries:` just
+disappears from the CV, and a malformed `amount` counts as $0 in the funding
+total. Schemas are plain literals:
+
+    {'name': str, 'link?': URL}    mapping; keys ending in '?' are optional,
+                                   unlisted keys are allowed
+    [spec]                         list whose items all match spec
+    str, int, (int, str)           isinstance check (bool is never an int)
+    Check(...)                     a type plus a predicate, e.g. AMOUNT, YEAR
+
+Each schema is compiled once into nested closures, so validating the whole data
+set is a single walk with no per-node dispatch on the schema. Errors name the
+offending value by path:
+
+    rafael.yml: funding.nsf[2].amount: expected an amount like '$1,234,567', got 'TBD'
+
+Results are cached under .cache/validation/, keyed by the data file's hash and
+this module's own hash, so warm rebuilds skip validation of unchanged files.
+
+Usage:
+    python scripts/data_schema.py          # validate, exit 1 on errors
+"""
+
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cache_utils import cache_dir, digest, file_digest, read_bytes, write_bytes  # noqa: E402
+from cv_data import PEOPLE_DIR, load_yaml, people_files  # noqa: E402
+from funding_index import parse_period  # noqa: E402
+
+
+class Check:
+    """A leaf schema: values must be instances of `types` and satisfy `predicate`."""
+
+    def __init__(self, types, predicate, expected):
+        self.types = types
+        self.predicate = predicate
+        self.expected = expected
+
+
+_AMOUNT_RE = re.compile(r'^[$€£\s]*\d{1,3}(,\d{3})*(\.\d+)?\s*(€|\$|£|EUR|USD)?$')
+
+AMOUNT = Check(str, _AMOUNT_RE.match, "an amount like '$1,234,567'")
+YEAR = Check(int, lambda y: 1990 <= y <= 2100, 'a four-digit year')
+URL = Check(str, lambda u: u.startswith(('http://', 'https://')), 'an http(s) URL')
+TEXT = Check(str, lambda s: bool(s.strip()), 'non-empty text')
+PERIOD = Check(str, lambda p: parse_period(p) is not None,
+               "a period like '10/2025-09/2027', '2017-2021' or '2026-present'")
+# A `link:` left blank in the YAML (rendered without a hyperlink)
+OPTIONAL_URL = Check((str, type(None)), lambda u: u is None or URL.predicate(u),
+                     'an http(s) URL or nothing')
+
+
+# ------------------------------------------------------------------- schemas
+AWARD = {
+    'title': TEXT, 'amount': AMOUNT, 'role?': TEXT, 'period': PERIOD, 'program?': str,
+    'person_months?': (int, float),
+}
+
+STUDENT = {'name': TEXT, 'degree': str, 'period?': str, 'linkedin?': URL, 'photo?': str}
+
+RAFAEL_SCHEMA = {
+    'personal': {'name': TEXT, 'title': str, 'contact': {'email': str}, 'author_names?': [TEXT]},
+    'appointments': {
+        'current': [{'institution': TEXT, 'positions': [{'title': TEXT, 'period': str}]}],
+        'past': [{'institution': TEXT, 'positions': [{'title': TEXT, 'period': str}]}],
+    },
+    'education': [{'degree': TEXT, 'institution': TEXT, 'year': YEAR}],
+    'research': {'areas': [str]},
+    'funding': {
+        'doe': [AWARD],
+        'nsf': [dict(AWARD, **{'awards?': [{'id': int}]})],
+        'darpa': [AWARD],
+        'international': [AWARD],
+    },
+    'invited_talks': [{
+        'year': YEAR,
+        'entries': [{'title': TEXT, 'event': TEXT, 'location': str, 'link?': URL, 'video?': URL}],
+    }],
+    'teaching': [{'course': TEXT, 'institution': str, 'semester': str}],
+    'students': {
+        'phd': [STUDENT],
+        'dr': [STUDENT],
+        'worker': [STUDENT],
+        'thesis_committee': [{'name': TEXT, 'degree': str, 'institution': str, 'year': YEAR}],
+    },
+    'funding_pending?': [dict(AWARD, agency=TEXT)],
+    'awards': [{'title': TEXT, 'year': YEAR}],
+    'media': [{'title': TEXT, 'venue': str, 'date': str, 'link': URL, 'image?': URL}],
+}
+
+# Lab members (_data/people/<slug>.yml) use the same layout, but only
+# `personal` is required: a student CV may have no funding or teaching yet
+MEMBER_SCHEMA = dict(
+    {f"{key}?": spec for key, spec in RAFAEL_SCHEMA.items()},
+    personal=RAFAEL_SCHEMA['personal'],
+)
+del MEMBER_SCHEMA['personal?']
+
+CONFERENCE_GROUP = {
+    'conference': TEXT,
+    'series': str,
+    'entries': [{'year': YEAR, 'location': str, 'edition?': (int, str), 'link?': URL}],
+}
+
+SCHEMAS = {
+    'rafael.yml': RAFAEL_SCHEMA,
+    'activities_chair.yml': [dict(CONFERENCE_GROUP, entries=[
+        {'year': YEAR, 'role': TEXT, 'location': str, 'edition?': (int, str), 'link?': URL},
+    ])],
+    'activities_pc.yml': [CONFERENCE_GROUP],
+    'activities_conference.yml': [{'conference': TEXT, 'year': YEAR, 'location': str, 'link?': OPTIONAL_URL}],
+    'activities_journal.yml': [{'journal': TEXT, 'year': (int, str), 'link?': URL}],
+    'activities_editor.yml': [{
+        'journal': TEXT, 'link?': URL,
+        'entries': [{'role': TEXT, 'year': (int, str)}],
+    }],
+    'activities_funding.yml': [{
+        'agency': TEXT, 'link?': URL,
+        'entries': [{'year': YEAR, 'description': TEXT}],
+    }],
+    'activities_sc.yml': [{'conference': TEXT, 'role': TEXT, 'year': (int, str), 'link?': URL}],
+}
+
+
+# ----------------------------------------------------------------- compiler
+def _type_name(types):
+    if isinstance(types, tuple):
+        return ' or '.join(t.__name__ for t in types)
+    return types.__name__
+
+
+def _is_instance(value, types):
+    if isinstance(value, bool):
+        return bool in (types if isinstance(types, tuple) else (types,))
+    return isinstance(value, types)
+
+
+def compile_schema(spec):
+    """Compile a schema literal into validate(value, path, errors)."""
+    if isinstance(spec, dict):
+        fields = []
+        for key, sub in spec.items():
+            optional = key.endswith('?')
+            fields.append((key.rstrip('?'), optional, compile_schema(sub)))
+
+        def validate_mapping(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f"{path or '<root>'}: expected a mapping, got {type(value).__name__}")
+                return
+            for key, optional, validate in fields:
+                child = f"{path}.{key}" if path else key
+                if key in value:
+                    validate(value[key], child, errors)
+                elif not optional:
+                    errors.append(f"{child}: missing required key")
+        return validate_mapping
+
+    if isinstance(spec, list):
+        validate_item = compile_schema(spec[0])
+
+        def validate_list(value, path, errors):
+            if not isinstance(value, list):
+                errors.append(f"{path or '<root>'}: expected a list, got {type(value).__name__}")
+                return
+            for i, item in enumerate(value):
+                validate_item(item, f"{path}[{i}]", errors)
+        return validate_list
+
+    if isinstance(spec, Check):
+        types, predicate, expected = spec.types, spec.predicate, spec.expected
+
+        def validate_check(value, path, errors):
+            if not _is_instance(value, types) or not predicate(value):
+                errors.append(f"{path}: expected {expected}, got {value!r}")
+        return validate_check
+
+    expected = _type_name(spec)
+
+    def validate_type(value, path, errors):
+        if not _is_instance(value, spec):
+            errors.append(f"{path}: expected {expected}, got {value!r}")
+    return validate_type
+
+
+_compiled = {}
+
+
+def schema_for(filename):
+    """
+    Schema of a file under _data/: one of SCHEMAS, a lab member's CV data
+    (people/<slug>.yml) or their activities (people/<slug>/activities_*.yml).
+    """
+    if filename.startswith(PEOPLE_DIR + '/'):
+        base = os.path.basename(filename)
+        return SCHEMAS[base] if base in SCHEMAS and base != 'rafael.yml' else MEMBER_SCHEMA
+    return SCHEMAS[filename]
+
+
+def validator_for(filename):
+    """Compiled validator for a _data/ file (compiled on first use per schema)."""
+    schema = schema_for(filename)
+    key = id(schema)
+    if key not in _compiled:
+        _compiled[key] = compile_schema(schema)
+    return _compiled[key]
+
+
+# ---------------------------------------------------------------- validation
+def validate_file(project_root, filename):
+    """Return the error messages for _data/<filename> (cached per file hash)."""
+    path = os.path.join(project_root, '_data', filename)
+    if not os.path.exists(path):
+        return []
+
+    # The file name picks the schema (see schema_for) and prefixes the
+    # messages; funding_index.parse_period backs the PERIOD check
+    here = os.path.dirname(os.path.abspath(__file__))
+    cache_path = os.path.join(
+        cache_dir(project_root, 'validation'),
+        digest(filename, file_digest(path), file_digest(__file__),
+               file_digest(os.path.join(here, 'funding_index.py'))) + '.json',
+    )
+    cached = read_bytes(cache_path)
+    if cached is not None:
+        return json.loads(cached)
+
+    errors = []
+    validator_for(filename)(load_yaml(path, project_root), '', errors)
+    errors = [f"{filename}: {error}" for error in errors]
+    write_bytes(cache_path, json.dumps(errors).encode('utf-8'))
+    return errors
+
+
+def data_files(project_root):
+    """Every schema'd file under _data/, relative to it: SCHEMAS, then lab members."""
+    data_dir = os.path.join(project_root, '_data')
+    filenames = list(SCHEMAS)
+    for _, yaml_path, activities_dir in people_files(project_root)[1:]:
+        filenames.append(os.path.relpath(yaml_path, data_dir).replace(os.sep, '/'))
+        for name in SCHEMAS:
+            path = os.path.join(activities_dir, name)
+            if name != 'rafael.yml' and os.path.exists(path):
+                filenames.append(os.path.relpath(path, data_dir).replace(os.sep, '/'))
+    return filenames
+
+
+def validate_data(project_root):
+    """Validate every schema'd file under _data/; return all error messages."""
+    errors = []
+    for filename in data_files(project_root):
+        errors.extend(validate_file(project_root, filename))
+    return errors
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    errors = validate_data(project_root)
+    for error in errors:
+        print(f"✗ {error}")
+    if errors:
+        print(f"{len(errors)} problem(s) found in _data/")
+        return 1
+    print(f"✓ {len(data_files(project_root))} data files valid")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Write _data/derived.yml: every aggregate count and total the website and the CV
+show (funding portfolio, chair/PC roles, talks, awards, students).
+
+The numbers are computed here, once per build, by the same Python functions the
+CV generators use (funding_utils.funding_totals for the portfolio), so Liquid
+only does O(1) lookups in site.data.derived and the two can never drift apart.
+The GitHub Actions workflow runs this before `jekyll build`; run it locally after
+editing _data/rafael.yml or _data/activities_*.yml and commit the result.
+
+Usage:
+    python scripts/derive_stats.py
+"""
+
+import os
+import sys
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cv_data import load_activities, load_yaml  # noqa: E402
+from funding_utils import FUNDING_CATEGORIES, funding_totals, parse_amount  # noqa: E402
+
+
+def _entry_count(groups):
+    """Number of `entries` across a list of activity groups (one per conference)."""
+    return sum(len(group.get('entries', []) or []) for group in groups or [])
+
+
+def compute_derived(data, activities):
+    """Return the derived-stats mapping for a rafael.yml payload and its activities."""
+    data = data or {}
+    totals = funding_totals(data)
+    funding = data.get('funding', {}) or {}
+
+    by_agency = {}
+    for category in FUNDING_CATEGORIES:
+        awards = funding.get(category, []) or []
+        by_agency[category] = {
+            'count': len(awards),
+            'total': int(round(sum(parse_amount(a.get('amount')) for a in awards))),
+        }
+
+    students = data.get('students', {}) or {}
+    return {
+        'funding': {
+            'count': totals['count'],
+            # Whole dollars, as funding_totals.html and about.html format them
+            'total': int(round(totals['total'])),
+            # One decimal, for stat tiles ("$78.2M")
+            'total_millions': round(totals['millions'], 1),
+            # Floored prose label ("$78M+")
+            'total_label': totals['label'],
+            'by_agency': by_agency,
+        },
+        'activities': {
+            'chair_count': _entry_count(activities.get('chair')),
+            'pc_count': _entry_count(activities.get('pc')),
+        },
+        'talks_count': sum(
+            len(group.get('entries', []) or []) for group in data.get('invited_talks', []) or []
+        ),
+        'awards_count': len(data.get('awards', []) or []),
+        'students': {key: len(items or []) for key, items in students.items()},
+    }
+
+
+def write_derived(derived, output_path):
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("# Derived statistics - auto-generated by scripts/derive_stats.py\n")
+        f.write("# Do not edit: run `python scripts/derive_stats.py` after changing _data/\n\n")
+        yaml.safe_dump(derived, f, default_flow_style=False, sort_keys=True)
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    rafael_yml_path = os.path.join(project_root, '_data', 'rafael.yml')
+    output_path = os.path.join(project_root, '_data', 'derived.yml')
+
+    data = load_yaml(rafael_yml_path, project_root)
+    derived = compute_derived(data, load_activities(project_root))
+
+    print(f"Writing derived statistics to {output_path}")
+    write_derived(derived, output_path)
+    print(f"  Funding: {derived['funding']['total_label']} across {derived['funding']['count']} awards")
+    print(f"  Chair roles: {derived['activities']['chair_count']}, "
+          f"PC roles: {derived['activities']['pc_count']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Mirror the `media:` thumbnails of _data/rafael.yml under assets/images/media/.
+
+The media cards used to hotlink third-party images, so every page view waited on
+those hosts and cards broke whenever an article was re-organised. This script
+downloads each image once, crops/resizes it to the card size (2x the 16:9,
+190px-tall CSS box, for high-DPI screens), saves it as WebP and records the local
+path in _data/media_images.yml. _includes/media.html looks each `image:` URL up
+in that manifest and falls back to the remote URL for images not mirrored yet.
+
+Downloads run concurrently and are conditional: the manifest keeps each image's
+ETag/Last-Modified, so re-running only transfers images that changed upstream
+(the server answers 304 Not Modified for the rest).
+
+Run this script locally after adding media entries, then commit the images and
+the manifest:
+    python scripts/fetch_media_images.py [--force] [--workers 8]
+"""
+
+import argparse
+import io
+import os
+import sys
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+from PIL import Image, ImageOps
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cache_utils import digest, write_bytes  # noqa: E402
+from cv_data import load_yaml  # noqa: E402
+
+# 2x the .media-thumb box (16:9, 190px tall)
+CARD_SIZE = (676, 380)
+WEBP_QUALITY = 82
+IMAGE_DIR = os.path.join('assets', 'images', 'media')
+MANIFEST = os.path.join('_data', 'media_images.yml')
+USER_AGENT = 'Mozilla/5.0 (compatible; media-mirror; +https://github.com/rafaelfsilva)'
+TIMEOUT = 30
+
+
+def local_name(url):
+    """Stable file name for an image URL."""
+    return digest(url)[:16] + '.webp'
+
+
+def resize_for_card(data, size=CARD_SIZE):
+    """Centre-crop and resize image bytes to `size`; return WebP bytes."""
+    with Image.open(io.BytesIO(data)) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        card = ImageOps.fit(img, size, method=Image.LANCZOS)
+        out = io.BytesIO()
+        card.save(out, 'WEBP', quality=WEBP_QUALITY, method=6)
+    return out.getvalue()
+
+
+def fetch_image(url, entry, project_root, force=False):
+    """
+    Download (if changed) and store one image.
+
+    `entry` is the image's previous manifest entry or None. Returns
+    (url, entry, status) where status is 'fetched', 'not modified' or an error
+    message; on error the previous entry (if any) is kept.
+    """
+    path = os.path.join(IMAGE_DIR, local_name(url))
+    full_path = os.path.join(project_root, path)
+
+    headers = {'User-Agent': USER_AGENT}
+    if entry and not force and os.path.exists(full_path):
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+            data = response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return url, entry, 'not modified'
+        return url, entry, f"HTTP {e.code}"
+    except (urllib.error.URLError, OSError) as e:
+        return url, entry, str(getattr(e, 'reason', e))
+
+    try:
+        webp = resize_for_card(data)
+    except (OSError, ValueError):
+        return url, entry, 'not an image'
+    write_bytes(full_path, webp)
+
+    new_entry = {'path': '/' + path.replace(os.sep, '/')}
+    if etag:
+        new_entry['etag'] = etag
+    if last_modified:
+        new_entry['last_modified'] = last_modified
+    return url, new_entry, 'fetched'
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    return load_yaml(path) or {}
+
+
+def write_manifest(manifest, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Local copies of media thumbnails - auto-generated by scripts/fetch_media_images.py\n")
+        f.write("# Run locally: python scripts/fetch_media_images.py\n\n")
+        yaml.safe_dump(manifest, f, default_flow_style=False, sort_keys=True)
+
+
+def mirror_media_images(project_root, urls, workers=8, force=False):
+    """Mirror `urls` and update the manifest; return {url: status}."""
+    os.makedirs(os.path.join(project_root, IMAGE_DIR), exist_ok=True)
+    manifest_path = os.path.join(project_root, MANIFEST)
+    manifest = load_manifest(manifest_path)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            lambda url: fetch_image(url, manifest.get(url), project_root, force),
+            urls,
+        ))
+
+    statuses = {}
+    wanted = set(urls)
+    for url, entry, status in results:
+        if entry:
+            manifest[url] = entry
+        statuses[url] = status
+
+    # Drop images whose media entries were removed
+    for url in list(manifest):
+        if url not in wanted:
+            stale = os.path.join(project_root, manifest.pop(url)['path'].lstrip('/'))
+            if os.path.exists(stale):
+                os.remove(stale)
+
+    write_manifest(manifest, manifest_path)
+    return statuses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mirror media thumbnails locally.')
+    parser.add_argument('--force', action='store_true',
+                        help='re-download every image, ignoring ETag/Last-Modified')
+    parser.add_argument('--workers', type=int, default=8, help='concurrent downloads')
+    args = parser.parse_args(argv)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    rafael_yml_path = os.path.join(project_root, '_data', 'rafael.yml')
+
+    print(f"Reading {rafael_yml_path}")
+    data = load_yaml(rafael_yml_path, project_root)
+    urls = list(dict.fromkeys(
+        item['image'] for item in data.get('media', []) or [] if item.get('image')
+    ))
+
+    print(f"Mirroring {len(urls)} media images to {IMAGE_DIR}/ "
+          f"(manifest: {os.path.join(project_root, MANIFEST)})")
+    statuses = mirror_media_images(project_root, urls, args.workers, args.force)
+    for url, status in statuses.items():
+        mark = '✓' if status in ('fetched', 'not modified') else '✗'
+        print(f"  {mark} {status:<13} {url}")
+    failed = sum(1 for s in statuses.values() if s not in ('fetched', 'not modified'))
+    if failed:
+        print(f"Warning: {failed} image(s) could not be mirrored; their cards keep the remote URL.")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,10 +8,14 @@ The GitHub Actions workflow uses the committed data file.
 
 import os
 import re
+import sys
 import yaml
 from datetime import datetime
 from scholarly import scholarly
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cv_data import load_yaml  # noqa: E402
+
 
 def get_author_id_from_url(url: str) -> str:
     """Extract author ID from Google Scholar URL."""
@@ -57,8 +61,7 @@ def main():
 
     # Load rafael.yml to get Google Scholar URL
     print(f"Reading {rafael_yml_path}")
-    with open(rafael_yml_path, 'r', encoding='utf-8') as f:
-        rafael_data = yaml.safe_load(f)
+    rafael_data = load_yaml(rafael_yml_path, project_root)
 
     scholar_url = rafael_data.get('social_media', {}).get('google_scholar')
     if not scholar_url:
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Funding awards from _data/rafael.yml as dated intervals.
+
+Each award's `period` ("10/2025-09/2027", "2017-12/2023", "08/2021 – 05/2022",
+"2026-present") is parsed once into a start and end date. The awards are
+then kept in a FundingIndex sorted by start date, which answers interval
+queries by bisecting the starts and checking the ends of the candidates
+only:
+
+    index = FundingIndex.from_data(data)
+    index.active_on(date(2026, 1, 1))           # running on that day
+    index.ending_within(date(2026, 1, 1), 12)   # ...and over within 12 months
+    index.annual_amounts()                      # {year: amount}, prorated by day
+
+Awards listed under `funding` are awarded. Proposals under review go in
+`funding_pending` (same fields plus `agency`); they are indexed too, but kept
+out of the award queries and of the portfolio totals. current_pending.py
+builds the Current & Pending support report on this index.
+"""
+
+import calendar
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from funding_utils import FUNDING_CATEGORIES, parse_amount
+
+# Open-ended awards ("2026-present") run until this day for interval queries
+OPEN_END = date.max
+
+_OPEN_WORDS = {'present', 'now', 'ongoing', 'current'}
+_BOUND_RE = re.compile(r'^(?:(\d{1,2})/)?(\d{4})$')
+_SEPARATOR_RE = re.compile(r'\s*[-–—]\s*')
+
+
+def _bound(text, end):
+    """'10/2025' or '2025' as its first day (or, with `end`, its last day)."""
+    m = _BOUND_RE.match(text)
+    if not m:
+        return None
+    month, year = m.group(1), int(m.group(2))
+    if month is None:
+        return date(year, 12, 31) if end else date(year, 1, 1)
+    month = int(month)
+    if not 1 <= month <= 12:
+        return None
+    if end:
+        return date(year, month, calendar.monthrange(year, month)[1])
+    return date(year, month, 1)
+
+
+def parse_period(period):
+    """
+    (start, end) dates of a period string, with `end` None when the award is
+    open-ended; None if the string is not a period. A single year or month
+    covers the whole of it.
+    """
+    text = str(period or '').strip()
+    if not text:
+        return None
+    parts = _SEPARATOR_RE.split(text)
+    if len(parts) == 1:
+        parts = [text, text]
+    if len(parts) != 2:
+        return None
+    start = _bound(parts[0], end=False)
+    if parts[1].lower() in _OPEN_WORDS:
+        end = None
+    else:
+        end = _bound(parts[1], end=True)
+        if end is None:
+            return None
+    if start is None or (end is not None and end < start):
+        return None
+    return start, end
+
+
+def add_months(day, months):
+    """`day` moved by a number of months, clamped to the end of the month."""
+    month = day.month - 1 + months
+    year, month = day.year + month // 12, month % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def months_after(day, months):
+    """Last day of the `months` months starting on `day` (inclusive bounds)."""
+    return add_months(day, months) - timedelta(days=1)
+
+
+class FundedAward:
+    """One award (or pending proposal) with its period parsed."""
+
+    __slots__ = ('category', 'title', 'role', 'program', 'agency', 'amount', 'amount_label',
+                 'period', 'start', 'end', 'award_ids', 'person_months', 'pending')
+
+    def __init__(self, category, entry, start, end, pending=False):
+        self.category = category
+        self.title = entry.get('title', '')
+        self.role = entry.get('role', '')
+        self.program = entry.get('program', '')
+        self.agency = entry.get('agency', '')
+        self.amount = parse_amount(entry.get('amount'))
+        self.amount_label = str(entry.get('amount', '') or '')
+        self.period = str(entry.get('period', '') or '')
+        self.start = start
+        self.end = end
+        ids = [str(a.get('id')) for a in entry.get('awards', []) or [] if a.get('id')]
+        if entry.get('award'):
+            ids.insert(0, str(entry['award']))
+        self.award_ids = tuple(ids)
+        self.person_months = entry.get('person_months')
+        self.pending = pending
+
+    @property
+    def last_day(self):
+        return self.end or OPEN_END
+
+    def overlaps(self, start, end):
+        return self.start <= end and self.last_day >= start
+
+    def prorated(self, start, end):
+        """Share of the amount falling within [start, end], by day."""
+        if self.end is None or not self.overlaps(start, end):
+            return 0.0
+        days = (self.end - self.start).days + 1
+        inside = (min(self.end, end) - max(self.start, start)).days + 1
+        return self.amount * inside / days
+
+    def __repr__(self):
+        return f"FundedAward({self.title[:30]!r}, {self.start}..{self.end})"
+
+
+class FundingIndex:
+    """Awarded funding sorted by start date, plus the pending proposals."""
+
+    def __init__(self, awards, pending=(), unparsed=()):
+        self.awards = tuple(sorted(awards, key=lambda a: (a.start, a.last_day)))
+        self.starts = [a.start for a in self.awards]
+        self.pending = tuple(pending)
+        # (category, title, period) of entries whose period could not be read
+        self.unparsed = tuple(unparsed)
+
+    @classmethod
+    def from_data(cls, data):
+        funding = (data or {}).get('funding', {}) or {}
+        awards, pending, unparsed = [], [], []
+        entries = [(c, e, False) for c in FUNDING_CATEGORIES for e in funding.get(c, []) or []]
+        entries += [('pending', e, True) for e in (data or {}).get('funding_pending', []) or []]
+        for category, entry, is_pending in entries:
+            bounds = parse_period(entry.get('period'))
+            if bounds is None:
+                unparsed.append((category, entry.get('title', ''), entry.get('period')))
+                continue
+            award = FundedAward(category, entry, *bounds, pending=is_pending)
+            (pending if is_pending else awards).append(award)
+        return cls(awards, pending, unparsed)
+
+    def __len__(self):
+        return len(self.awards)
+
+    def __iter__(self):
+        return iter(self.awards)
+
+    def overlapping(self, start, end):
+        """Awards running at any point in [start, end], by start date."""
+        candidates = self.awards[:bisect_right(self.starts, end)]
+        return [a for a in candidates if a.last_day >= start]
+
+    def active_on(self, day):
+        return self.overlapping(day, day)
+
+    def current(self, day):
+        """Awards not over by `day`: running, or awarded and yet to start."""
+        return [a for a in self.awards if a.last_day >= day]
+
+    def starting_after(self, day):
+        return list(self.awards[bisect_right(self.starts, day):])
+
+    def started_before(self, day):
+        return list(self.awards[:bisect_left(self.starts, day)])
+
+    def ending_within(self, day, months=12):
+        """Awards active on `day` whose end falls within the next `months` months."""
+        horizon = months_after(day, months)
+        return [a for a in self.active_on(day) if a.end is not None and a.end <= horizon]
+
+    def amount_between(self, start, end, awards=None):
+        """Prorated amount of `awards` (default: all) falling within [start, end]."""
+        return sum(a.prorated(start, end) for a in (self.awards if awards is None else awards))
+
+    def annual_amounts(self, awards=None):
+        """{calendar year: prorated amount} over the years `awards` (default: all) span."""
+        awards = self.awards if awards is None else awards
+        years = {}
+        for award in awards:
+            if award.end is None:
+                continue
+            for year in range(award.start.year, award.end.year + 1):
+                years[year] = years.get(year, 0.0) + award.prorated(date(year, 1, 1), date(year, 12, 31))
+        return dict(sorted(years.items()))
@@ -3,9 +3,9 @@
 Funding portfolio totals, computed from the awards listed in _data/rafael.yml.
 
 The total awarded amount and the award count are never stored in the YAML: they
-are derived here so the CV, resume, and website can never drift apart. The Liquid
-equivalent used by the website lives in _includes/funding_totals.html -- keep the
-two in sync.
+are derived here so the CV, resume, and website can never drift apart. The
+website reads them from _data/derived.yml, which scripts/derive_stats.py writes
+with these same functions (see _includes/funding_totals.html).
 
 Prose in the YAML (intro, about_sections, leadership_highlights) uses the tokens
 %FUNDING_TOTAL% and %FUNDING_COUNT%, which apply_funding_tokens() resolves.
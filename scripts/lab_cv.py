@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Lab mode: one CV per group member from a single repository.
+
+Each member has a YAML file in the layout of _data/rafael.yml under
+_data/people/<slug>.yml (only `personal` is required; see
+data_schema.MEMBER_SCHEMA), with optional activities_*.yml files in
+_data/people/<slug>/. The site owner's _data/rafael.yml is always included.
+Everyone shares _bibliography/references.bib. It is parsed once, and each
+member's publications are picked out of it through the author index
+(PublicationSet.authored_by) using the `personal.author_names` spellings.
+
+Members are loaded in the parent process, which also builds the PDF style
+sheets. The CVs are then rendered in a pool of forked workers that inherit
+the parsed bibliography, the loaded data and the style sheets. Output files
+are named after each person, e.g. files/cv/RafaelFerreiraDaSilva-cv.pdf.
+
+Usage:
+    python scripts/generate_cv_pdf.py --lab [--jobs N] [--formats pdf docx ...]
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from author_identity import AuthorIdentity  # noqa: E402
+from cv_data import load_activities, load_yaml, people_files  # noqa: E402
+from derive_stats import compute_derived  # noqa: E402
+from funding_utils import resolve_funding_tokens  # noqa: E402
+from publications import load_publications  # noqa: E402
+
+
+def file_stem(data, fallback):
+    """'Rafael Ferreira da Silva' -> 'RafaelFerreiraDaSilva', for output file names."""
+    name = (data or {}).get('personal', {}).get('name', '') or fallback
+    name = unicodedata.normalize('NFKD', name)
+    words = re.findall(r'[A-Za-z0-9]+', ''.join(c for c in name if not unicodedata.combining(c)))
+    return ''.join(w[0].upper() + w[1:] for w in words)
+
+
+def output_name(data, fallback):
+    """'Rafael Ferreira da Silva' -> 'RafaelFerreiraDaSilva-cv'."""
+    return file_stem(data, fallback) + '-cv'
+
+
+class LabMember:
+    """One person's loaded CV inputs, ready to render in any format."""
+
+    __slots__ = ('slug', 'yaml_path', 'activities_dir', 'data', 'activities',
+                 'funding', 'identity', 'publications', 'output_name')
+
+    def __init__(self, slug, yaml_path, activities_dir, project_root):
+        self.slug = slug
+        self.yaml_path = yaml_path
+        self.activities_dir = activities_dir
+        data = load_yaml(yaml_path, project_root)
+        self.activities = load_activities(project_root, activities_dir)
+        self.funding = compute_derived(data, self.activities)['funding']
+        self.data = resolve_funding_tokens(data)
+        self.identity = AuthorIdentity.from_data(self.data)
+        self.publications = None
+        self.output_name = output_name(self.data, slug)
+
+
+def output_names(project_root):
+    """{slug: output file name without extension} for every lab member."""
+    return {
+        slug: output_name(load_yaml(yaml_path, project_root), slug)
+        for slug, yaml_path, _ in people_files(project_root)
+    }
+
+
+def unmatched_entries(shared, member):
+    """
+    Keys of the entries whose whole author string names `member` but that
+    PublicationSet.authored_by() left out of their publications, a sign that
+    an author list was split wrongly. Empty when the two agree.
+    """
+    picked = {p.key for p in member.publications}
+    return [p.key for p in shared if p.key not in picked and member.identity.spans(p.authors)]
+
+
+# State inherited by the forked workers of build_lab
+_LAB = None
+
+
+def _render_member(slug):
+    """Worker: write every requested format of one member's CV."""
+    lab = _LAB
+    member = lab['members'][slug]
+    output_base = os.path.join(lab['output_dir'], member.output_name)
+    start = time.perf_counter()
+    paths = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for fmt in lab['formats']:
+            if fmt == 'pdf':
+                from cv_pdf import CVGenerator
+
+                gen = CVGenerator(member.yaml_path, lab['project_root'], fonts=lab['fonts'],
+                                  activities_dir=member.activities_dir)
+                for attr, value in lab['pdf_options'].items():
+                    setattr(gen, attr, value)
+                gen.publications = member.publications
+                gen.generate(output_base + '.pdf')
+                paths.append(output_base + '.pdf')
+                continue
+
+            from cv_document import build_document
+
+            document = build_document(member.data, member.activities, member.publications,
+                                      member.funding)
+            if fmt == 'docx':
+                from cv_docx import CVDocxGenerator
+
+                CVDocxGenerator(document).generate(output_base + '.docx')
+                paths.append(output_base + '.docx')
+            else:
+                from cv_render import write_document
+
+                paths.append(write_document(document, fmt, output_base))
+    return slug, paths, time.perf_counter() - start
+
+
+def build_lab(project_root, output_dir, formats, jobs=None, fonts=None, pdf_options=None):
+    """
+    Render every member's CV in `formats` into `output_dir`, across `jobs`
+    worker processes (default: one per CPU). `pdf_options` are CVGenerator
+    attributes to set, e.g. {'optimize_size': True}. Returns the paths written.
+    """
+    global _LAB
+    start = time.perf_counter()
+    members = {
+        slug: LabMember(slug, yaml_path, activities_dir, project_root)
+        for slug, yaml_path, activities_dir in people_files(project_root)
+    }
+
+    # One parse of the shared bibliography, split per person
+    shared = load_publications(project_root)
+    for member in members.values():
+        member.publications = shared.authored_by(member.identity)
+        print(f"  {member.slug}: {len(member.publications)} of {len(shared)} publications")
+        missed = unmatched_entries(shared, member)
+        if missed:
+            print(f"  Warning: {member.slug} is named in {len(missed)} entries the author "
+                  f"index did not match: {', '.join(missed)}")
+
+    if 'pdf' in formats:
+        # Build the style sheets here, once, for the workers to inherit
+        from cv_pdf import CVGenerator
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = next(iter(members.values()))
+            CVGenerator(first.yaml_path, project_root, fonts=fonts,
+                        activities_dir=first.activities_dir)
+    print(f"Loaded {len(members)} people in {time.perf_counter() - start:.2f}s")
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(members)))
+    if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        print("Warning: worker processes need fork(). Rendering the CVs one at a time.")
+        jobs = 1
+
+    os.makedirs(output_dir, exist_ok=True)
+    _LAB = {
+        'members': members, 'formats': list(formats), 'fonts': fonts,
+        'pdf_options': dict(pdf_options or {}),
+        'project_root': project_root, 'output_dir': output_dir,
+    }
+    try:
+        if jobs == 1:
+            results = [_render_member(slug) for slug in members]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context('fork'),
+            ) as pool:
+                results = list(pool.map(_render_member, members))
+    finally:
+        _LAB = None
+
+    written = []
+    for slug, paths, seconds in results:
+        print(f"✓ {slug}: {', '.join(os.path.basename(p) for p in paths)} ({seconds:.1f}s)")
+        written.extend(paths)
+    print(f"Rendered {len(results)} CVs in {time.perf_counter() - start:.1f}s with {jobs} worker(s)")
+    return written
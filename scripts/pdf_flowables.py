@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Custom reportlab flowables for the PDF CV.
+
+Most CV entries are a left column of paragraphs with an optional right-aligned
+meta column (dates, amounts). Wrapping each entry in its own single-row Table
+makes reportlab run its full table machinery -- column sizing, cell styles,
+split calculations, and a second wrap of every cell at draw time -- hundreds of
+times per CV. ColumnRow lays the same cells out directly.
+
+The geometry deliberately mirrors a one-row Table with zero top/bottom padding
+and VALIGN TOP, so replacing the table changes no pixel of the output:
+
+- the row is as tall as its taller column, where a column's height is the sum
+  of its flowables' heights and inner spacing (the first spaceBefore and the
+  last spaceAfter are dropped, as Table does);
+- the row is centred in the frame like a Table, which lets CONTENT_WIDTH rows
+  sit flush with the page margins despite the frame's own padding;
+- like a single-row Table the row is never split across pages -- unless it does
+  not fit even on a fresh page, where a Table would raise a LayoutError; the
+  left column is then split between pages instead.
+"""
+
+from reportlab.platypus.flowables import Flowable
+
+
+class ColumnRow(Flowable):
+    """
+    A left column (with optional left indent) and an optional right column.
+
+    `left` and `right` are flowables or lists of flowables. The right column is
+    `right_width` wide including `right_gap` of left padding, and its flowables
+    are right-aligned.
+    """
+
+    def __init__(self, left, right=None, left_width=0, right_width=0,
+                 left_indent=0, right_gap=4):
+        super().__init__()
+        self.left = list(left) if isinstance(left, (list, tuple)) else [left]
+        if right is None:
+            right = []
+        self.right = list(right) if isinstance(right, (list, tuple)) else [right]
+        self.left_width = left_width
+        self.right_width = right_width
+        self.left_indent = left_indent
+        self.right_gap = right_gap
+        self.hAlign = 'CENTER'
+        self._wrapped_width = None
+
+    # ------------------------------------------------------------------ layout
+    def _column_geometry(self, flowables, avail_width):
+        """Wrap a column; return (height, [(flowable, width, height), ...])."""
+        if not flowables:
+            return 0, []
+        sizes = []
+        total = 0
+        for f in flowables:
+            w, h = f.wrapOn(self.canv, avail_width, 72000)
+            sizes.append((f, w, h))
+            total += h + f.getSpaceBefore() + f.getSpaceAfter()
+        return total - flowables[0].getSpaceBefore() - flowables[-1].getSpaceAfter(), sizes
+
+    def wrap(self, availWidth, availHeight):
+        if self._wrapped_width != availWidth:
+            left_h, self._left_sizes = self._column_geometry(
+                self.left, self.left_width - self.left_indent,
+            )
+            right_h, self._right_sizes = self._column_geometry(
+                self.right, self.right_width - self.right_gap,
+            )
+            self.height = max(left_h, right_h)
+            self._wrapped_width = availWidth
+        self.width = self.left_width + self.right_width
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        frame = getattr(self, '_frame', None)
+        if frame is None or not frame._atTop:
+            return []
+
+        # Taller than a whole page: move as many left-column flowables as fit,
+        # splitting the one that straddles the page boundary.
+        self.wrap(availWidth, availHeight)
+        first, rest = [], list(self.left)
+        used = 0
+        while rest:
+            f = rest[0]
+            _, w, h = self._left_sizes[len(first)]
+            space = (f.getSpaceBefore() if first else 0) + h
+            if used + space > availHeight:
+                parts = f.splitOn(self.canv, self.left_width - self.left_indent,
+                                  availHeight - used - (f.getSpaceBefore() if first else 0))
+                if len(parts) == 2:
+                    first.append(parts[0])
+                    rest[0] = parts[1]
+                break
+            used += space + f.getSpaceAfter()
+            first.append(rest.pop(0))
+        if not first or not rest:
+            return []
+        return [
+            ColumnRow(first, self.right, self.left_width, self.right_width,
+                      self.left_indent, self.right_gap),
+            ColumnRow(rest, None, self.left_width, self.right_width,
+                      self.left_indent, self.right_gap),
+        ]
+
+    # -------------------------------------------------------------------- draw
+    def _draw_column(self, sizes, x0, col_width, align_right):
+        if not sizes:
+            return
+        y = self.height + sizes[0][0].getSpaceBefore()
+        for f, w, h in sizes:
+            x = x0 + col_width - w if align_right else x0
+            y -= f.getSpaceBefore()
+            y -= h
+            f.drawOn(self.canv, x, y)
+            y -= f.getSpaceAfter()
+
+    def draw(self):
+        self._draw_column(
+            self._left_sizes, self.left_indent, self.left_width - self.left_indent, False,
+        )
+        self._draw_column(
+            self._right_sizes, self.left_width + self.right_gap,
+            self.right_width - self.right_gap, True,
+        )
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+TrueType font support for the PDF CV.
+
+By default the CV uses reportlab's built-in Helvetica family, which is never
+embedded. register_font_family() registers a TTF family instead, so the CV can
+use a brand font. reportlab already embeds only the glyphs that a document
+actually uses, but it rebuilds each subset from the full TTF on every run. Here
+every face's subsetter is backed by an on-disk cache keyed by the font file hash
+and the glyph set, so unchanged CVs reuse the subset bytes verbatim and custom
+typography costs neither PDF size nor build time.
+
+The returned mapping ({'regular', 'bold', 'italic', 'bold_italic'} -> font name)
+is what CVGenerator expects in its `fonts` argument.
+"""
+
+import os
+
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from cache_utils import cache_dir, digest, file_digest, read_bytes, write_bytes
+
+DEFAULT_FONTS = {
+    'regular': 'Helvetica',
+    'bold': 'Helvetica-Bold',
+    'italic': 'Helvetica-Oblique',
+    'bold_italic': 'Helvetica-BoldOblique',
+}
+
+FACE_SUFFIXES = {
+    'regular': '',
+    'bold': '-Bold',
+    'italic': '-Italic',
+    'bold_italic': '-BoldItalic',
+}
+
+# font name -> font file digest, so a face is parsed only once per process even
+# when several generators register it.
+_registered = {}
+
+
+class _CachedSubsetter:
+    """Drop-in replacement for TTFontFace.makeSubset backed by the subset cache."""
+
+    def __init__(self, make_subset, font_digest, directory):
+        self._make_subset = make_subset
+        self._font_digest = font_digest
+        self._directory = directory
+        self._memory = {}
+
+    def __call__(self, subset):
+        key = digest(self._font_digest, tuple(subset))
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        path = os.path.join(self._directory, f"{key}.ttf")
+        data = read_bytes(path)
+        if data is None:
+            data = self._make_subset(subset)
+            write_bytes(path, data)
+        self._memory[key] = data
+        return data
+
+
+def register_ttf(name, path, project_root):
+    """Register one TTF face under `name`, with a cached subsetter."""
+    font_digest = file_digest(path)
+    if _registered.get(name) == font_digest:
+        return name
+
+    font = TTFont(name, path)
+    font.face.makeSubset = _CachedSubsetter(
+        font.face.makeSubset, font_digest, cache_dir(project_root, 'fonts'),
+    )
+    pdfmetrics.registerFont(font)
+    _registered[name] = font_digest
+    return name
+
+
+def font_digests(fonts):
+    """{face: file digest} of the TTF faces in a font-name mapping (None for built-ins)."""
+    return {face: _registered.get(name) for face, name in fonts.items()}
+
+
+def register_font_family(regular, project_root, bold=None, italic=None, bold_italic=None):
+    """
+    Register a TTF family and return its font-name mapping.
+
+    Missing faces fall back to the closest registered one (bold-italic to bold,
+    italic and bold to regular), so a single TTF is enough. The family is also
+    mapped for reportlab's <b>/<i> paragraph markup.
+    """
+    family = os.path.splitext(os.path.basename(regular))[0]
+    paths = {
+        'regular': regular,
+        'bold': bold or regular,
+        'italic': italic or regular,
+        'bold_italic': bold_italic or bold or italic or regular,
+    }
+
+    fonts = {}
+    for face, path in paths.items():
+        fonts[face] = register_ttf(family + FACE_SUFFIXES[face], path, project_root)
+
+    # The regular face is registered under the family name itself, which is
+    # what the paragraph parser looks up when resolving <b>/<i>.
+    addMapping(family, 0, 0, fonts['regular'])
+    addMapping(family, 1, 0, fonts['bold'])
+    addMapping(family, 0, 1, fonts['italic'])
+    addMapping(family, 1, 1, fonts['bold_italic'])
+    return fonts
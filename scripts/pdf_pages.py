@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Page-level bookkeeping for the PDF CV: which story flowable starts each page,
+content fingerprints of story sections, and stitching page ranges of several
+PDFs into one file, and stamping marks such as page numbers onto the merged
+pages.
+
+Restarting layout at a page boundary is exact when the page begins with an
+original story flowable (not the continuation of a split paragraph) that is not
+kept together with the flowable before it: laying out story[i:] on a fresh page
+then reproduces every later page of the full build. TrackingDocTemplate records
+those clean page starts so later builds can restart from them.
+
+Stitching needs pypdf; callers check PYPDF_AVAILABLE and fall back to a plain
+single-pass build without it.
+"""
+
+import io
+import json
+import os
+from importlib.util import find_spec
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table
+from reportlab.platypus.doctemplate import ActionFlowable, FrameActionFlowable
+
+from cache_utils import cache_dir, digest, file_digest, read_bytes, write_bytes
+from pdf_flowables import ColumnRow
+
+# Imported by the functions that stitch pages, only when a build needs them
+PYPDF_AVAILABLE = find_spec('pypdf') is not None
+
+
+class TrackingDocTemplate(SimpleDocTemplate):
+    """
+    SimpleDocTemplate that records the story index of each clean page start.
+
+    After build(), `page_starts` maps page number -> index into the story that
+    was passed in (plus `story_offset`, for partial builds of a longer story).
+    """
+
+    def __init__(self, filename, story_offset=0, **kw):
+        super().__init__(filename, **kw)
+        self.story_offset = story_offset
+        self.page_starts = {}
+
+    def build(self, flowables, **kw):
+        # build() consumes the list in place; index the original objects first
+        self._story_index = {id(f): i for i, f in enumerate(flowables)}
+        self._story_refs = list(flowables)
+        self._page_first = {}
+        try:
+            super().build(flowables, **kw)
+        finally:
+            self.page_starts = {}
+            for page, flowable in self._page_first.items():
+                i = self._story_index.get(id(flowable))
+                if i is None:
+                    continue  # continuation of a split flowable
+                if i > 0 and self._story_refs[i - 1].getKeepWithNext():
+                    continue  # kept together with the previous page's tail
+                self.page_starts[page] = i + self.story_offset
+            del self._story_refs, self._story_index, self._page_first
+
+    def afterFlowable(self, flowable):
+        # Page/frame actions inserted by reportlab itself are not content
+        if not isinstance(flowable, (ActionFlowable, FrameActionFlowable)):
+            self._page_first.setdefault(self.page, flowable)
+
+
+def flowable_fingerprint(flowable):
+    """Hashable summary of what a flowable renders (style objects are keyed elsewhere)."""
+    if isinstance(flowable, (list, tuple)):
+        return tuple(flowable_fingerprint(f) for f in flowable)
+    if isinstance(flowable, Paragraph):
+        return ('P', flowable.style.name, flowable.text)
+    if isinstance(flowable, ColumnRow):
+        return ('R', flowable_fingerprint(flowable.left), flowable_fingerprint(flowable.right),
+                flowable.left_width, flowable.right_width, flowable.left_indent)
+    if isinstance(flowable, Table):
+        return ('T', flowable_fingerprint(flowable._cellvalues), tuple(flowable._colWidths))
+    if isinstance(flowable, Spacer):
+        return ('S', flowable.width, flowable.height)
+    return (type(flowable).__name__,)
+
+
+class HeightModel:
+    """
+    Estimates how many pages a story fills from the wrap() heights of its
+    flowables, without drawing anything.
+
+    Heights are cached by flowable_fingerprint() and frame width, so trial
+    stories that share most of their flowables (auto-fit, see
+    CVGenerator.fit_to_pages) only wrap the new ones. Page filling follows the
+    frame rules that matter for the CV: space before is dropped at the top of
+    a page, keep-with-next headings move down with the flowable after them,
+    paragraphs split at line boundaries (with reportlab's orphan and widow
+    rules) and other flowables move to the next page whole. The result is an
+    estimate; callers check it against a real build.
+    """
+
+    # Fingerprints that identify what a flowable draws; anything else is
+    # measured every time
+    CACHEABLE = (Paragraph, ColumnRow, Table, Spacer)
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.heights = {}
+        self.hits = 0
+        self.misses = 0
+        self._canvas = Canvas(io.BytesIO())
+
+    def measure(self, flowable):
+        """Height of `flowable` wrapped to the frame width."""
+        if not isinstance(flowable, self.CACHEABLE):
+            return flowable.wrapOn(self._canvas, self.width, self.height)[1]
+        key = (flowable_fingerprint(flowable), self.width)
+        height = self.heights.get(key)
+        if height is None:
+            self.misses += 1
+            height = self.heights[key] = flowable.wrapOn(self._canvas, self.width, self.height)[1]
+        else:
+            self.hits += 1
+        return height
+
+    @staticmethod
+    def _lines_that_fit(paragraph, height, room):
+        """Height of the lines of `paragraph` that stay on a page with `room` left."""
+        style = paragraph.style
+        lines = round(height / style.leading)
+        fit = max(int(room // style.leading), 0)
+        if not style.allowWidows and lines - fit < 2:
+            fit = lines - 2
+        if not style.allowOrphans and fit < 2:
+            fit = 0
+        return max(fit, 0) * style.leading
+
+    def pages(self, story):
+        """Estimated number of pages `story` fills."""
+        pages, used = 1, 0.0
+        for i, flowable in enumerate(story):
+            if isinstance(flowable, (PageBreak, ActionFlowable, FrameActionFlowable)):
+                if used:
+                    pages, used = pages + 1, 0.0
+                continue
+            height = self.measure(flowable)
+            before = flowable.getSpaceBefore() if used else 0
+            need = before + height
+            if flowable.getKeepWithNext() and i + 1 < len(story):
+                need += self.measure(story[i + 1])
+            if used and used + need > self.height:
+                if isinstance(flowable, Paragraph) and not flowable.getKeepWithNext():
+                    height -= self._lines_that_fit(flowable, height, self.height - used - before)
+                pages, used, before = pages + 1, 0.0, 0
+            used += before + height + flowable.getSpaceAfter()
+            while used > self.height:
+                pages, used = pages + 1, used - self.height
+        return pages
+
+
+def stitch_pdfs(parts, output):
+    """
+    Write the pages of several PDFs into one file.
+
+    `parts` is a list of (source, first, last) page ranges (0-based, last
+    exclusive, None for "to the end"); sources are paths or file-like objects.
+    `output` is a path or a writable file-like object. Document metadata is
+    taken from the last part.
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    reader = None
+    for source, first, last in parts:
+        reader = PdfReader(source)
+        for page in reader.pages[first:last]:
+            writer.add_page(page)
+    if reader is not None and reader.metadata:
+        writer.add_metadata(dict(reader.metadata))
+    writer.compress_identical_objects()
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, 'wb') as f:
+            writer.write(f)
+    else:
+        writer.write(output)
+
+
+def stamp_pages(source, output, draw):
+    """
+    Draw on top of every page of a PDF.
+
+    `draw(canvas, page_number)` is called once per page (1-based) on a blank
+    overlay page of the same size, which is then merged onto the page.
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(source)
+    overlay = io.BytesIO()
+    canvas = Canvas(overlay)
+    for number, page in enumerate(reader.pages, start=1):
+        canvas.setPageSize((float(page.mediabox.width), float(page.mediabox.height)))
+        draw(canvas, number)
+        canvas.showPage()
+    canvas.save()
+
+    writer = PdfWriter(clone_from=reader)
+    for page, stamp in zip(writer.pages, PdfReader(overlay).pages):
+        page.merge_page(stamp)
+        # merge_page() leaves the combined content uncompressed
+        page.compress_content_streams()
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, 'wb') as f:
+            writer.write(f)
+    else:
+        writer.write(output)
+
+
+class LayoutCache:
+    """
+    The last rendered PDF of a configuration plus its section hashes and clean
+    page starts, stored under .cache/layout/.
+
+    `key` identifies everything outside the story that affects layout (source
+    code, fonts, palette, footer text); section hashes cover the story itself.
+    """
+
+    def __init__(self, project_root, key):
+        directory = cache_dir(project_root, 'layout')
+        self.meta_path = os.path.join(directory, f"{key}.json")
+        self.pdf_path = os.path.join(directory, f"{key}.pdf")
+
+    def load(self):
+        data = read_bytes(self.meta_path)
+        if data is None or not os.path.exists(self.pdf_path):
+            return None
+        meta = json.loads(data)
+        meta['page_starts'] = {int(p): i for p, i in meta['page_starts'].items()}
+        return meta
+
+    def store(self, sections, page_starts, pdf_path):
+        write_bytes(self.pdf_path, read_bytes(pdf_path))
+        meta = {'sections': sections, 'page_starts': page_starts}
+        write_bytes(self.meta_path, json.dumps(meta).encode('utf-8'))
+
+    @staticmethod
+    def restart_point(meta, sections):
+        """
+        Where to resume layout for `sections` given the cached layout `meta`.
+
+        Returns None when nothing can be reused, ('all', None) when the story is
+        unchanged, or (page, story_index): keep the cached pages before `page`
+        and lay out story[story_index:] from `page` on.
+        """
+        if meta is None:
+            return None
+        old = meta['sections']
+        changed = next(
+            (n for n, (a, b) in enumerate(zip(old, sections)) if a != b),
+            None,
+        )
+        if changed is None:
+            if len(old) == len(sections):
+                return ('all', None)
+            changed = min(len(old), len(sections))
+        # Story index where the first changed section starts (indices before it
+        # are identical in both stories because earlier sections are unchanged).
+        limit = sections[changed][1] if changed < len(sections) else old[changed][1]
+        # A page that starts at `limit` itself is not reused: its first
+        # flowable belongs to the changed section, and whether that flowable
+        # still breaks to a new page depends on what it now is
+        candidates = [(p, i) for p, i in meta['page_starts'].items() if i < limit and p > 1]
+        if not candidates:
+            return None
+        return max(candidates)
+
+
+def source_digest(*paths):
+    """Digest of the given source files, so code changes invalidate caches."""
+    return digest(*(file_digest(p) for p in paths))
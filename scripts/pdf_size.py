@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Smaller PDF files for the site and for email.
+
+reportlab already deflates page content and shares one font dictionary
+between pages, and the CV has no images, so what is left to save is encoding
+overhead:
+
+- By default reportlab wraps every deflated stream in ASCII85, which makes it
+  a quarter larger again. compact_streams() turns that off for the builds
+  made inside it.
+- compact_pdf() rewrites a finished PDF with object streams (PDF 1.5): the
+  small objects (page dictionaries, fonts, the catalog and document info)
+  go into one compressed object stream, and the cross-reference table
+  becomes a compressed stream too. Streams are deflated again at the highest
+  zlib level, which also drops any ASCII85 left in pages stitched from
+  earlier builds. Object numbers, content and the document ID are kept, so
+  the pages are unchanged and the output is as reproducible as the input.
+
+compact_pdf() reads the PDF with pypdf; callers check
+pdf_pages.PYPDF_AVAILABLE and keep the plain build without it.
+"""
+
+import contextlib
+import io
+import os
+import struct
+import zlib
+
+from reportlab import rl_config
+
+# Filters compact_pdf() can undo before deflating again; streams with any
+# other filter (images, for example) are copied as they are
+_REENCODABLE = {'/FlateDecode', '/ASCII85Decode'}
+
+
+@contextlib.contextmanager
+def compact_streams(enabled=True):
+    """Write plain deflated streams, without ASCII85, in reportlab builds made inside."""
+    saved = rl_config.useA85
+    if enabled:
+        rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = saved
+
+
+def _serialize(obj):
+    buffer = io.BytesIO()
+    obj.write_to_stream(buffer)
+    return buffer.getvalue()
+
+
+def _stream_object(obj):
+    """Dictionary and data of a pypdf stream, deflated at level 9 when possible."""
+    from pypdf.generic import DictionaryObject, NameObject, NumberObject
+
+    filters = obj.get('/Filter', [])
+    filters = [filters] if isinstance(filters, str) else list(filters)
+    header = DictionaryObject(obj)
+    data = obj._data
+    if set(filters) <= _REENCODABLE and '/DecodeParms' not in obj:
+        data = zlib.compress(obj.get_data(), 9)
+        header[NameObject('/Filter')] = NameObject('/FlateDecode')
+    header[NameObject('/Length')] = NumberObject(len(data))
+    return _serialize(header) + b'\nstream\n' + data + b'\nendstream'
+
+
+def compact_pdf(source, output):
+    """
+    Rewrite the PDF at `source` (a path or file-like object) with object
+    streams into `output` (a path or a writable file-like object; it may be
+    the same path). Returns the size written in bytes.
+    """
+    from pypdf import PdfReader
+    from pypdf.generic import StreamObject
+
+    reader = PdfReader(source)
+    objects = {}
+    for number in sorted(set(reader.xref.get(0, {})) | set(reader.xref_objStm)):
+        obj = reader.get_object(number)
+        # Skip the containers of a PDF that was compacted before
+        if obj is None or isinstance(obj, StreamObject) and obj.get('/Type') in ('/ObjStm', '/XRef'):
+            continue
+        objects[number] = obj
+    trailer = {key: _serialize(reader.trailer[key]) for key in ('/Root', '/Info', '/ID')
+               if key in reader.trailer}
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.5\n%\xe2\xe3\xcf\xd3\n')
+    offsets = {}  # object number -> (type, field 2, field 3) of its xref entry
+
+    packed = []
+    for number, obj in objects.items():
+        if not isinstance(obj, StreamObject):
+            packed.append((number, _serialize(obj)))
+            continue
+        offsets[number] = (1, out.tell(), 0)
+        out.write(b'%d 0 obj\n' % number + _stream_object(obj) + b'\nendobj\n')
+
+    size = max(objects, default=0) + 1
+    if packed:
+        container, size = size, size + 1
+        index, bodies, position = [], [], 0
+        for i, (number, body) in enumerate(packed):
+            index.append(b'%d %d' % (number, position))
+            bodies.append(body)
+            position += len(body) + 1
+            offsets[number] = (2, container, i)
+        head = b' '.join(index) + b'\n'
+        data = zlib.compress(head + b'\n'.join(bodies), 9)
+        offsets[container] = (1, out.tell(), 0)
+        out.write(b'%d 0 obj\n<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>\n'
+                  b'stream\n' % (container, len(packed), len(head), len(data)))
+        out.write(data + b'\nendstream\nendobj\n')
+
+    # The cross-reference stream: (type, offset or container, generation or
+    # index) per object, 1 + 4 + 2 bytes each
+    xref, size = size, size + 1
+    start = out.tell()
+    offsets[xref] = (1, start, 0)
+    rows = [struct.pack('>BIH', 0, 0, 65535)]
+    for number in range(1, size):
+        rows.append(struct.pack('>BIH', *offsets.get(number, (0, 0, 0))))
+    data = zlib.compress(b''.join(rows), 9)
+    extra = b''.join(b' %s %s' % (key.encode('ascii'), value) for key, value in trailer.items())
+    out.write(b'%d 0 obj\n<< /Type /XRef /Size %d /W [ 1 4 2 ] /Filter /FlateDecode '
+              b'/Length %d%s >>\nstream\n' % (xref, size, len(data), extra))
+    out.write(data + b'\nendstream\nendobj\n')
+    out.write(b'startxref\n%d\n%%%%EOF\n' % start)
+
+    data = out.getvalue()
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, 'wb') as f:
+            f.write(data)
+    else:
+        output.write(data)
+    return len(data)
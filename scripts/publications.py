@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+The publication list from _bibliography/references.bib as typed records.
+
+bibtexparser yields one dict of raw LaTeX strings per entry. Every consumer
+used to re-normalize authors/titles/venues with pylatexenc and re-cast `year`
+on each use. Here each entry becomes a slotted Publication once, at load time,
+with clean text and an integer year. The PDF, DOCX and any other exporter share
+the same records.
+
+PublicationSet keeps the records together with per-field columns (keys, entry
+types, years as a compact int array), so sorting and grouping by year or type
+work on those columns instead of going back to the record strings. It also
+indexes the records by year, entry type, normalized venue and coauthor when it
+is built, so query() can slice the bibliography ("journals since 2020", "with
+coauthor X") in time proportional to the result rather than the whole list:
+
+    pubs.query(entry_type='article', since=2020)
+    pubs.query(coauthor='Ewa Deelman')
+"""
+
+import os
+import re
+import unicodedata
+from array import array
+from collections import defaultdict
+from importlib.util import find_spec
+
+# Both parsers are imported on first use, not with this module: runs that never
+# touch the bibliography should not pay for them.
+BIBTEX_AVAILABLE = find_spec('bibtexparser') is not None
+LATEX_AVAILABLE = find_spec('pylatexenc') is not None
+
+_latex = None
+
+# Separator of the names in a BibTeX author list, whatever whitespace surrounds
+# it; a doubled "and and" (a typo in some entries) is one separator
+AUTHOR_SEPARATOR = re.compile(r'(?:\s+and)+\s+')
+
+
+def normalize_bibtex_text(text):
+    """Braces and LaTeX markup resolved, and line breaks and runs of spaces collapsed."""
+    global _latex
+    if not text:
+        return ""
+    cleaned = text.replace('{', '').replace('}', '')
+    if LATEX_AVAILABLE:
+        if _latex is None:
+            from pylatexenc.latex2text import LatexNodes2Text
+            _latex = LatexNodes2Text()
+        cleaned = _latex.latex_to_text(cleaned)
+    # Long fields wrap over several lines in the .bib, e.g. "Bard, Debbie\n  and Bremer, Timo"
+    return ' '.join(cleaned.split())
+
+
+def _fold(text):
+    """Lower-case, accent-free, punctuation-free form of `text` for matching."""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    return re.sub(r'[^a-z0-9]+', ' ', text).strip()
+
+
+def author_key(name):
+    """
+    Match key for an author name. "Last, First" is read as "First Last", so
+    "Ferreira da Silva, Rafael", "da Silva, Rafael Ferreira" and "Rafael
+    Ferreira da Silva" share a key.
+    """
+    if ',' in name:
+        last, first = name.split(',', 1)
+        name = f"{first} {last}"
+    return _fold(name)
+
+
+def venue_key(venue):
+    """
+    Match key for a venue: editions, years and "Proceedings of the" dropped, so
+    every year of a conference or volume of a journal shares one key.
+    """
+    key = _fold(venue)
+    key = re.sub(r'\b(proceedings of( the)?|\d+(st|nd|rd|th)?)\b', ' ', key)
+    return ' '.join(key.split())
+
+
+def _parse_year(value):
+    value = (value or '').strip()
+    return int(value) if value.isdigit() else None
+
+
+class Publication:
+    """One bibliography entry with normalized, display-ready fields."""
+
+    __slots__ = ('key', 'entry_type', 'authors', 'author_list', 'owner_spans',
+                 'title', 'venue', 'year', 'doi')
+
+    def __init__(self, key, entry_type, authors, title, venue, year, doi, owner_spans=()):
+        self.key = key
+        self.entry_type = entry_type
+        self.authors = authors
+        self.author_list = tuple(a.strip() for a in AUTHOR_SEPARATOR.split(authors) if a.strip())
+        # (start, end) of the CV owner's name within `authors`
+        self.owner_spans = owner_spans
+        self.title = title
+        self.venue = venue
+        self.year = year
+        self.doi = doi
+
+    @classmethod
+    def from_bibtex(cls, entry, identity=None):
+        """Build a record from a bibtexparser entry dict (see AuthorIdentity)."""
+        authors = normalize_bibtex_text(entry.get('author', ''))
+        return cls(
+            key=entry.get('ID', ''),
+            entry_type=entry.get('ENTRYTYPE', 'misc').lower(),
+            authors=authors,
+            title=normalize_bibtex_text(entry.get('title', '')),
+            venue=normalize_bibtex_text(entry.get('booktitle') or entry.get('journal') or ''),
+            year=_parse_year(entry.get('year')),
+            doi=entry.get('doi', '').strip(),
+            owner_spans=identity.spans(authors) if identity is not None else (),
+        )
+
+    @property
+    def year_label(self):
+        return str(self.year) if self.year is not None else 'n.d.'
+
+    def author_segments(self):
+        """[(text, is_owner), ...] covering `authors`, for highlighting the owner."""
+        segments = []
+        pos = 0
+        for start, end in self.owner_spans:
+            if start > pos:
+                segments.append((self.authors[pos:start], False))
+            segments.append((self.authors[start:end], True))
+            pos = end
+        if pos < len(self.authors):
+            segments.append((self.authors[pos:], False))
+        return segments
+
+    def highlight_authors(self, before, after):
+        """`authors` with the owner's name wrapped in `before`/`after` markup."""
+        return ''.join(
+            f"{before}{text}{after}" if is_owner else text
+            for text, is_owner in self.author_segments()
+        )
+
+    def with_owner(self, identity):
+        """A copy with the owner's name located for `identity` instead."""
+        return Publication(self.key, self.entry_type, self.authors, self.title, self.venue,
+                           self.year, self.doi, owner_spans=identity.spans(self.authors))
+
+    def __repr__(self):
+        return f"Publication({self.key!r}, {self.year_label})"
+
+
+class PublicationSet:
+    """An ordered, immutable collection of Publications with column views."""
+
+    def __init__(self, records):
+        self.records = tuple(records)
+        self.keys = tuple(r.key for r in self.records)
+        self.entry_types = tuple(r.entry_type for r in self.records)
+        # 0 stands for "no year"; real years are always positive
+        self.years = array('i', (r.year or 0 for r in self.records))
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """value -> [positions] for year, entry type, venue key and coauthor key."""
+        self.by_year = defaultdict(list)
+        self.by_type = defaultdict(list)
+        self.by_venue = defaultdict(list)
+        self.by_author = defaultdict(list)
+        # author key -> the spellings that produced it
+        self.author_spellings = defaultdict(set)
+        for i, record in enumerate(self.records):
+            self.by_year[self.years[i]].append(i)
+            self.by_type[record.entry_type].append(i)
+            if record.venue:
+                self.by_venue[venue_key(record.venue)].append(i)
+            keys = set()
+            for author in record.author_list:
+                key = author_key(author)
+                keys.add(key)
+                self.author_spellings[key].add(author)
+            for key in keys:
+                self.by_author[key].append(i)
+
+    @classmethod
+    def from_bibtex(cls, entries, identity=None):
+        return cls(Publication.from_bibtex(e, identity) for e in entries)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.records[index])
+        return self.records[index]
+
+    def newest_first(self):
+        """A copy sorted by year, newest first (stable within a year)."""
+        years = self.years
+        order = sorted(range(len(years)), key=years.__getitem__, reverse=True)
+        return PublicationSet(self.records[i] for i in order)
+
+    def year_groups(self):
+        """[(year_label, [records]), ...] per year, in the order the years appear."""
+        return [
+            (self.records[ids[0]].year_label, [self.records[i] for i in ids])
+            for ids in self.by_year.values()
+        ]
+
+    def count_since(self, year):
+        """Number of publications from `year` onward."""
+        return sum(len(ids) for y, ids in self.by_year.items() if y >= year)
+
+    def query(self, entry_type=None, since=None, until=None, venue=None, coauthor=None):
+        """
+        Publications matching every given filter, in this set's order.
+
+        `entry_type` is a BibTeX type ('article', 'inproceedings', ...) or a
+        collection of them; `since`/`until` bound the year (inclusive); `venue`
+        and `coauthor` are matched through venue_key()/author_key(). Only the
+        index lists involved are touched: the smallest is scanned and checked
+        against the others.
+        """
+        candidates = []
+        if entry_type is not None:
+            types = [entry_type] if isinstance(entry_type, str) else entry_type
+            candidates.append([i for t in types for i in self.by_type.get(t.lower(), ())])
+        if since is not None or until is not None:
+            lo = since if since is not None else 1
+            hi = until if until is not None else float('inf')
+            candidates.append([i for y, ids in self.by_year.items() if lo <= y <= hi for i in ids])
+        if venue is not None:
+            candidates.append(self.by_venue.get(venue_key(venue), []))
+        if coauthor is not None:
+            candidates.append(self.by_author.get(author_key(coauthor), []))
+
+        if not candidates:
+            return self
+        candidates.sort(key=len)
+        others = [set(ids) for ids in candidates[1:]]
+        ids = sorted(i for i in candidates[0] if all(i in other for other in others))
+        return PublicationSet(self.records[i] for i in ids)
+
+    def authored_by(self, identity):
+        """
+        The publications with `identity` among their authors, in this set's
+        order, with that person's name located for highlighting. Each distinct
+        author spelling in the index is matched once, however many entries it
+        appears in, so one shared bibliography splits cheaply per person.
+        """
+        ids = set()
+        for key, spellings in self.author_spellings.items():
+            if any(identity.matches(name) for name in spellings):
+                ids.update(self.by_author[key])
+        records = (self.records[i].with_owner(identity) for i in sorted(ids))
+        return PublicationSet(r for r in records if r.owner_spans)
+
+
+def load_publications(project_root, identity=None):
+    """
+    Load references.bib as a PublicationSet, newest first (empty on failure).
+    With an AuthorIdentity, each record also locates the owner's name.
+    """
+    if not BIBTEX_AVAILABLE:
+        print("Warning: bibtexparser not installed. Publications will be skipped.")
+        print("Install with: pip install bibtexparser")
+        return PublicationSet([])
+    if not LATEX_AVAILABLE:
+        print("Warning: pylatexenc not installed. LaTeX accents may not render correctly.")
+        print("Install with: pip install pylatexenc")
+    import bibtexparser
+    bib_path = os.path.join(project_root, '_bibliography', 'references.bib')
+    if not os.path.exists(bib_path):
+        print(f"Warning: BibTeX file not found at {bib_path}")
+        return PublicationSet([])
+    try:
+        with open(bib_path, 'r', encoding='utf-8') as f:
+            bib_database = bibtexparser.load(f)
+        return PublicationSet.from_bibtex(bib_database.entries, identity).newest_first()
+    except Exception as e:
+        print(f"Error loading BibTeX file: {e}")
+        return PublicationSet([])
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Reproducible builds: the same data always gives byte-identical PDF and DOCX
+files, so outputs can be content-addressed and an unchanged CV never shows up
+as a new file.
+
+The build date comes from SOURCE_DATE_EPOCH when it is set
+(https://reproducible-builds.org/specs/source-date-epoch/) instead of the wall
+clock. This affects the "Last updated" footers, and reportlab reads the same
+variable for the PDF creation date. In invariant mode reportlab also derives
+the document ID from the content only. DOCX files are zip archives that
+python-docx stamps with the current time; normalize_zip() rewrites them with
+fixed member dates, permissions and order.
+
+`generate_cv_pdf.py --reproducible` turns the mode on. Without
+SOURCE_DATE_EPOCH in the environment, it uses the time of the last git commit.
+"""
+
+import os
+from datetime import datetime, timezone
+
+# Earliest timestamp a zip member can carry
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def source_date_epoch():
+    """SOURCE_DATE_EPOCH as an int, or None when it is not set."""
+    value = os.environ.get('SOURCE_DATE_EPOCH', '').strip()
+    return int(value) if value.isdigit() else None
+
+
+def is_reproducible():
+    return source_date_epoch() is not None
+
+
+def build_datetime():
+    """The date to print on the CV: SOURCE_DATE_EPOCH (UTC) if set, else now."""
+    epoch = source_date_epoch()
+    if epoch is None:
+        return datetime.now()
+    return datetime.fromtimestamp(epoch, timezone.utc)
+
+
+def git_commit_epoch(project_root):
+    """Commit time of HEAD, or None outside a git checkout."""
+    import subprocess
+
+    try:
+        out = subprocess.run(
+            ['git', 'log', '-1', '--format=%ct'],
+            cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return int(out) if out.isdigit() else None
+
+
+def enable(project_root):
+    """
+    Turn on reproducible mode for this process (and its workers).
+
+    Keeps an existing SOURCE_DATE_EPOCH, otherwise sets it to the last commit
+    time. Returns the epoch, or None if no date could be determined.
+    """
+    epoch = source_date_epoch()
+    if epoch is None:
+        epoch = git_commit_epoch(project_root)
+        if epoch is None:
+            return None
+        os.environ['SOURCE_DATE_EPOCH'] = str(epoch)
+    return epoch
+
+
+def normalize_zip_bytes(data, epoch=None):
+    """
+    Rewrite a zip archive (DOCX) held in memory with every member dated
+    `epoch`, the same permissions and a fixed order: [Content_Types].xml
+    first, as OPC packages expect, then the other members by name.
+    """
+    import io
+    import time
+    import zipfile
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        members = [(info.filename, zf.read(info)) for info in zf.infolist()]
+    members.sort(key=lambda m: (m[0] != '[Content_Types].xml', m[0]))
+    date_time = max(ZIP_EPOCH, tuple(time.gmtime(epoch))[:6]) if epoch is not None else ZIP_EPOCH
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for name, content in members:
+            info = zipfile.ZipInfo(name, date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3  # Unix, whatever the build machine
+            info.external_attr = 0o644 << 16
+            zf.writestr(info, content)
+    return buffer.getvalue()
+
+
+def normalize_zip(path, epoch=None):
+    """normalize_zip_bytes() for a zip file on disk, rewritten in place."""
+    with open(path, 'rb') as f:
+        data = normalize_zip_bytes(f.read(), epoch)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,65 @@
+"""check_links.LinkChecker against a local stand-in server."""
+
+import asyncio
+import unittest
+
+from http_standin import QuietHandler, StandIn
+
+from check_links import LinkChecker
+
+
+class Handler(QuietHandler):
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = 0.2
+
+    def do_HEAD(self):
+        self.server.requests.append(('HEAD', self.path, self.headers))
+        if self.path == '/no-head':
+            # Drop the connection without an answer, as some servers do
+            self.close_connection = True
+            return
+        self.send_body(200 if self.path != '/missing' else 404)
+
+    def do_GET(self):
+        self.server.requests.append(('GET', self.path, self.headers))
+        self.send_body(404 if self.path == '/missing' else 200, b'page')
+
+
+class LinkCheckerTest(unittest.TestCase):
+    def check(self, *urls, pause=0.0):
+        """Results of checking `urls` in turn with one checker, `pause` seconds apart."""
+        async def run(checker):
+            results = []
+            for url in urls:
+                results.append(await checker.check(url))
+                await asyncio.sleep(pause)
+            return results
+
+        checker = LinkChecker(per_host=1, timeout=5)
+        try:
+            return asyncio.run(run(checker))
+        finally:
+            checker.close()
+
+    def test_stale_keep_alive_connection_is_replaced(self):
+        with StandIn(Handler) as server:
+            # The server closes the pooled connection between the two checks
+            first, second = self.check(server.url('/a'), server.url('/b'), pause=0.6)
+        self.assertEqual(first, {'ok': True, 'status': 200})
+        self.assertEqual(second, {'ok': True, 'status': 200})
+
+    def test_dropped_head_falls_back_to_get(self):
+        with StandIn(Handler) as server:
+            result, = self.check(server.url('/no-head'))
+            methods = [method for method, _, _ in server.requests]
+        self.assertEqual(result, {'ok': True, 'status': 200})
+        self.assertEqual(methods, ['HEAD', 'GET'])
+
+    def test_missing_page_is_broken(self):
+        with StandIn(Handler) as server:
+            result, = self.check(server.url('/missing'))
+        self.assertEqual(result, {'ok': False, 'status': 404})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""fetch_media_images.mirror_media_images against a local stand-in server."""
+
+import io
+import os
+import tempfile
+import unittest
+
+from http_standin import QuietHandler, StandIn
+from PIL import Image
+
+from cv_data import load_yaml
+from fetch_media_images import CARD_SIZE, MANIFEST, mirror_media_images
+
+
+def png_bytes(size=(800, 600), color=(30, 60, 140)):
+    out = io.BytesIO()
+    Image.new('RGB', size, color).save(out, 'PNG')
+    return out.getvalue()
+
+
+class Handler(QuietHandler):
+    PNG = png_bytes()
+    ETAG = '"photo-v1"'
+    # Paths answered with 404 from now on (set by the tests)
+    gone = set()
+
+    def do_GET(self):
+        self.server.requests.append(('GET', self.path, self.headers))
+        if self.path in self.gone or self.path == '/missing.png':
+            self.send_body(404, b'not found')
+        elif self.path == '/page.png':
+            self.send_body(200, b'<html>moved</html>', 'text/html')
+        elif self.headers.get('If-None-Match') == self.ETAG:
+            self.send_response(304)
+            self.send_header('ETag', self.ETAG)
+            self.end_headers()
+        else:
+            self.send_body(200, self.PNG, 'image/png', {'ETag': self.ETAG})
+
+
+class MirrorMediaImagesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        os.makedirs(os.path.join(self.root, '_data'))
+        Handler.gone = set()
+        self.server = StandIn(Handler).__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+    def manifest(self):
+        return load_yaml(os.path.join(self.root, MANIFEST))
+
+    def local_file(self, entry):
+        return os.path.join(self.root, entry['path'].lstrip('/'))
+
+    def test_first_fetch_writes_webp_and_manifest_entry(self):
+        url = self.server.url('/photo.png')
+        statuses = mirror_media_images(self.root, [url], workers=2)
+
+        self.assertEqual(statuses, {url: 'fetched'})
+        entry = self.manifest()[url]
+        self.assertEqual(entry['etag'], Handler.ETAG)
+        self.assertTrue(entry['path'].startswith('/assets/images/media/'))
+        with Image.open(self.local_file(entry)) as img:
+            self.assertEqual((img.format, img.size), ('WEBP', CARD_SIZE))
+
+    def test_not_modified_reuses_the_cached_file(self):
+        url = self.server.url('/photo.png')
+        mirror_media_images(self.root, [url])
+        path = self.local_file(self.manifest()[url])
+        mtime = os.stat(path).st_mtime_ns
+
+        statuses = mirror_media_images(self.root, [url])
+
+        self.assertEqual(statuses, {url: 'not modified'})
+        _, _, headers = self.server.requests[-1]
+        self.assertEqual(headers.get('If-None-Match'), Handler.ETAG)
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+        self.assertEqual(self.manifest()[url]['etag'], Handler.ETAG)
+
+    def test_errors_fall_back_without_crashing(self):
+        photo = self.server.url('/photo.png')
+        missing = self.server.url('/missing.png')
+        page = self.server.url('/page.png')
+        mirror_media_images(self.root, [photo])
+        Handler.gone = {'/photo.png'}
+
+        statuses = mirror_media_images(self.root, [photo, missing, page], workers=3)
+
+        self.assertEqual(statuses, {photo: 'HTTP 404', missing: 'HTTP 404', page: 'not an image'})
+        manifest = self.manifest()
+        # Failed images get no entry (their cards keep the remote URL); one
+        # mirrored earlier keeps its copy
+        self.assertEqual(set(manifest), {photo})
+        self.assertTrue(os.path.exists(self.local_file(manifest[photo])))
+
+
+if __name__ == '__main__':
+    unittest.main()
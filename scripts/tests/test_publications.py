@@ -0,0 +1,85 @@
+"""publications.PublicationSet indexes against plain scans of the records."""
+
+import itertools
+import os
+import random
+import sys
+import unittest
+
+# The scripts import each other as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from publications import Publication, PublicationSet, author_key, venue_key  # noqa: E402
+
+TYPES = ('article', 'inproceedings', 'incollection', 'misc')
+VENUES = (
+    'Future Generation Computer Systems',
+    'Future Generation Computer Systems ',
+    'Proceedings of the {IEEE} eScience Conference',
+    'Journal of Computational Science',
+    '',
+)
+AUTHORS = (
+    'Ferreira da Silva, Rafael', 'Deelman, Ewa', 'Casanova, Henri',
+    'Deelman, E.', 'Pottier, Loïc', 'Suter, Frédéric',
+)
+
+
+def sample_set(n=300, seed=7):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        authors = ' and '.join(rng.sample(AUTHORS, rng.randint(1, 4)))
+        year = rng.choice([None] + list(range(2008, 2026)))
+        records.append(Publication(
+            key=f'pub{i}', entry_type=rng.choice(TYPES), authors=authors, title=f'Paper {i}',
+            venue=rng.choice(VENUES), year=year, doi='',
+        ))
+    return PublicationSet(records).newest_first()
+
+
+def linear(pubs, entry_type=None, since=None, until=None, venue=None, coauthor=None):
+    """The records query() should return, by checking each one in turn."""
+    types = [entry_type] if isinstance(entry_type, str) else entry_type
+    return [
+        r for r in pubs
+        if (types is None or r.entry_type in types)
+        and (since is None or (r.year or 0) >= since)
+        and (until is None or (r.year is not None and r.year <= until))
+        and (venue is None or (r.venue and venue_key(r.venue) == venue_key(venue)))
+        and (coauthor is None or author_key(coauthor) in {author_key(a) for a in r.author_list})
+    ]
+
+
+class PublicationSetTest(unittest.TestCase):
+    def setUp(self):
+        self.pubs = sample_set()
+
+    def test_query_matches_linear_filter(self):
+        options = {
+            'entry_type': [None, 'article', ('article', 'inproceedings')],
+            'since': [None, 2015, 2030],
+            'until': [None, 2012],
+            'venue': [None, 'Future Generation Computer Systems', 'Nowhere'],
+            'coauthor': [None, 'Deelman, Ewa', 'Ewa Deelman'],
+        }
+        for values in itertools.product(*options.values()):
+            filters = dict(zip(options, values))
+            with self.subTest(**filters):
+                expected = [r.key for r in linear(self.pubs, **filters)]
+                self.assertEqual(list(self.pubs.query(**filters).keys), expected)
+
+    def test_count_since(self):
+        for year in (2008, 2020, 2026):
+            self.assertEqual(self.pubs.count_since(year), len(linear(self.pubs, since=year)))
+
+    def test_year_groups_follow_set_order(self):
+        groups = self.pubs.year_groups()
+        self.assertEqual([r for _, records in groups for r in records], list(self.pubs))
+        for label, records in groups:
+            self.assertEqual({r.year_label for r in records}, {label})
+        self.assertEqual(len({label for label, _ in groups}), len(groups))
+
+
+if __name__ == '__main__':
+    unittest.main()